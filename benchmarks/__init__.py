@@ -0,0 +1,4 @@
+"""Performance benchmarks for fastapi_class.
+
+Each `bench_*` module is runnable on its own, e.g. `python -m benchmarks.bench_endpoint`.
+"""
@@ -0,0 +1,91 @@
+"""Run the benchmark suite and write machine-readable results.
+
+    python -m benchmarks --output results.json
+    python -m benchmarks --scale 0.1 --compare results.json
+
+Metric names end with their unit: `_ns` and `_s` are durations (lower is better), `_rps` are throughputs (higher is
+better). `--compare` prints the ratio of each metric to a previous results file, e.g. from the last release.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import json
+import platform
+import sys
+from datetime import datetime, timezone
+from typing import Any
+
+import fastapi
+import pydantic
+
+import fastapi_class
+
+MODULES = (
+    "bench_endpoint",
+    "bench_startup",
+    "bench_dispatch",
+    "bench_openapi",
+    "bench_exceptions",
+    "bench_responses",
+    "bench_snapshot",
+)
+
+
+def run(scale: float = 1.0, modules: tuple[str, ...] = MODULES) -> dict[str, Any]:
+    """Run the benchmark `modules` and return their results along with the environment they ran in."""
+    return {
+        "fastapi_class": fastapi_class.__version__,
+        "fastapi": fastapi.__version__,
+        "pydantic": pydantic.VERSION,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "scale": scale,
+        "results": {
+            module: importlib.import_module(f"benchmarks.{module}").run(scale)  # type: ignore
+            for module in modules
+        },
+    }
+
+
+def compare(current: dict[str, Any], baseline: dict[str, Any]) -> list[str]:
+    """Describe how each metric of `current` moved relative to `baseline`."""
+    lines = []
+    for module, metrics in current["results"].items():
+        for name, value in metrics.items():
+            previous = baseline["results"].get(module, {}).get(name)
+            if not previous:
+                continue
+            ratio = value / previous
+            better = ratio > 1 if name.endswith("_rps") else ratio < 1
+            lines.append(
+                f"{module}.{name}: {previous:.4g} -> {value:.4g} (x{ratio:.2f}, {'better' if better else 'worse'})"
+            )
+    return lines
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier of the iteration counts")
+    parser.add_argument("--only", nargs="+", choices=MODULES, default=MODULES, help="benchmarks to run")
+    parser.add_argument("--output", help="write results as JSON to this file")
+    parser.add_argument("--compare", help="previous results file to compare against")
+    args = parser.parse_args(argv)
+
+    results = run(args.scale, tuple(args.only))
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=2)
+    else:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+    if args.compare:
+        with open(args.compare) as file:
+            print("\n".join(compare(results, json.load(file))))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
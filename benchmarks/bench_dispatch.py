@@ -0,0 +1,56 @@
+"""Per-request dispatch overhead of view methods compared to plain FastAPI routes."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+
+from benchmarks.asgi import request
+from fastapi_class import View, endpoint
+
+REQUESTS = 5_000
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/plain")
+    async def plain(limit: int = 50):
+        return {"limit": limit}
+
+    class ItemView:
+        async def get(self, limit: int = 50):
+            return {"limit": limit}
+
+        @endpoint("get", path="/sync")
+        def sync(self, limit: int = 50):
+            return {"limit": limit}
+
+    View(app, path="/view")(ItemView)
+    return app
+
+
+async def _measure(app: FastAPI, path: str, requests: int) -> float:
+    await request(app, path=path)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request(app, path=path)
+    return (time.perf_counter() - start) / requests * 1e9
+
+
+def run(scale: float = 1.0) -> dict[str, float]:
+    """Return nanoseconds per request for a plain route, an async view method and a sync view method."""
+    requests = max(1, int(REQUESTS * scale))
+    app = _app()
+    return {
+        "plain_route_ns": asyncio.run(_measure(app, "/plain", requests)),
+        "view_async_ns": asyncio.run(_measure(app, "/view", requests)),
+        "view_sync_ns": asyncio.run(_measure(app, "/view/sync", requests)),
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name}: {value / 1e3:.1f} us/request")
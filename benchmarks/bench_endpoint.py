@@ -0,0 +1,50 @@
+"""Per-call overhead of `endpoint()` decorated functions.
+
+Compares awaiting the decorated function against the `async def _wrapper` that `endpoint()` used to return.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from functools import wraps
+
+from fastapi_class import endpoint
+
+ITERATIONS = 200_000
+
+
+def _legacy_endpoint(function):
+    @wraps(function)
+    async def _wrapper(*args, **kwargs):
+        return await function(*args, **kwargs)
+
+    return _wrapper
+
+
+async def handler(item_id: int = 0):
+    return item_id
+
+
+async def _measure(function, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        await function(item_id=1)
+    return time.perf_counter() - start
+
+
+def run(scale: float = 1.0) -> dict[str, float]:
+    """Return the per-call cost in nanoseconds of the legacy wrapper and of the current decorator."""
+    iterations = max(1, int(ITERATIONS * scale))
+    legacy = _legacy_endpoint(handler)
+    current = endpoint("get")(handler)
+    return {
+        "legacy_ns": asyncio.run(_measure(legacy, iterations)) / iterations * 1e9,
+        "current_ns": asyncio.run(_measure(current, iterations)) / iterations * 1e9,
+    }
+
+
+if __name__ == "__main__":
+    results = run()
+    print(f"legacy wrapper: {results['legacy_ns']:.1f} ns/call")
+    print(f"endpoint():     {results['current_ns']:.1f} ns/call")
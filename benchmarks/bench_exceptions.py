@@ -0,0 +1,64 @@
+"""Cost of raising exceptions from view methods and serializing them into responses."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+
+from fastapi import FastAPI
+
+from benchmarks.asgi import request
+from fastapi_class import FormattedMessageException, PreparedHTTPException, View, prepared_exception_handler
+
+REQUESTS = 5_000
+
+NOT_FOUND = FormattedMessageException(exceptions=((404, "Item not found."),))
+COMPILED_NOT_FOUND = FormattedMessageException(exceptions=((404, "Item not found."),), compiled=True)
+
+
+def _app() -> FastAPI:
+    app = FastAPI()
+    app.add_exception_handler(PreparedHTTPException, prepared_exception_handler)
+
+    class ErrorView:
+        async def get(self):
+            raise NOT_FOUND()
+
+        async def delete(self):
+            raise COMPILED_NOT_FOUND()
+
+    View(app)(ErrorView)
+    return app
+
+
+async def _measure(app: FastAPI, method: str, requests: int) -> float:
+    await request(app, method)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request(app, method)
+    return (time.perf_counter() - start) / requests * 1e9
+
+
+def run(scale: float = 1.0) -> dict[str, float]:
+    """Return nanoseconds per failing request, and per factory call, for plain and compiled exceptions."""
+    requests = max(1, int(REQUESTS * scale))
+    app = _app()
+    start = time.perf_counter()
+    for _ in range(requests):
+        NOT_FOUND()
+    factory = (time.perf_counter() - start) / requests * 1e9
+    start = time.perf_counter()
+    for _ in range(requests):
+        COMPILED_NOT_FOUND()
+    compiled_factory = (time.perf_counter() - start) / requests * 1e9
+    return {
+        "raise_http_exception_ns": asyncio.run(_measure(app, "GET", requests)),
+        "raise_prepared_exception_ns": asyncio.run(_measure(app, "DELETE", requests)),
+        "factory_ns": factory,
+        "compiled_factory_ns": compiled_factory,
+    }
+
+
+if __name__ == "__main__":
+    for name, value in run().items():
+        print(f"{name}: {value:.0f} ns")
@@ -0,0 +1,45 @@
+"""OpenAPI generation time for an application made of many views, and `_exceptions_to_responses` cost."""
+
+from __future__ import annotations
+
+import time
+
+from fastapi import FastAPI, HTTPException
+
+from benchmarks.bench_startup import _synthetic_view
+from fastapi_class import FormattedMessageException, View, _exceptions_to_responses
+
+VIEWS = 100
+ITERATIONS = 20_000
+
+EXCEPTIONS = (
+    HTTPException(401, "Not authorized."),
+    HTTPException(403, "Forbidden."),
+    FormattedMessageException(exceptions=((404, "Item {item_id} not found."),)),
+)
+
+
+def run(scale: float = 1.0) -> dict[str, float]:
+    """Return seconds to build the OpenAPI schema of `VIEWS * scale` views and nanoseconds per responses mapping."""
+    views = max(1, int(VIEWS * scale))
+    iterations = max(1, int(ITERATIONS * scale))
+    app = FastAPI()
+    for index in range(views):
+        View(app, path=f"/items{index}")(_synthetic_view(index))
+
+    start = time.perf_counter()
+    app.openapi()
+    openapi = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(iterations):
+        _exceptions_to_responses(EXCEPTIONS)
+    responses = (time.perf_counter() - start) / iterations * 1e9
+
+    return {"openapi_s": openapi, "exceptions_to_responses_ns": responses}
+
+
+if __name__ == "__main__":
+    results = run()
+    print(f"OpenAPI schema of {VIEWS} views: {results['openapi_s'] * 1e3:.1f} ms")
+    print(f"_exceptions_to_responses: {results['exceptions_to_responses_ns']:.0f} ns/call")
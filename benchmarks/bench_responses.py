@@ -0,0 +1,72 @@
+"""Throughput of views returning `response_model` payloads with `JSONResponse` and `ModelJSONResponse`."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Optional
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel
+
+from benchmarks.asgi import request
+from fastapi_class import ModelJSONResponse, View
+
+REQUESTS = 5_000
+
+
+class Tag(BaseModel):
+    name: str
+    weight: float
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+    description: Optional[str] = None
+    tags: list[Tag]
+
+
+ITEM = Item(
+    id=1,
+    name="item",
+    description="An item with a few nested tags.",
+    tags=[Tag(name=f"tag{index}", weight=index / 10) for index in range(20)],
+)
+
+
+def _app(default_response_class: type[Response]) -> FastAPI:
+    app = FastAPI()
+
+    class ItemView:
+        response_model = {"get": Item}
+
+        async def get(self):
+            return ITEM
+
+    View(app, default_response_class=default_response_class)(ItemView)
+    return app
+
+
+async def _measure(app: FastAPI, requests: int) -> float:
+    await request(app)
+    start = time.perf_counter()
+    for _ in range(requests):
+        await request(app)
+    return requests / (time.perf_counter() - start)
+
+
+def run(scale: float = 1.0) -> dict[str, float]:
+    """Return requests per second served with each response class."""
+    requests = max(1, int(REQUESTS * scale))
+    return {
+        "json_response_rps": asyncio.run(_measure(_app(JSONResponse), requests)),
+        "model_json_response_rps": asyncio.run(_measure(_app(ModelJSONResponse), requests)),
+    }
+
+
+if __name__ == "__main__":
+    results = run()
+    print(f"JSONResponse:      {results['json_response_rps']:.0f} req/s")
+    print(f"ModelJSONResponse: {results['model_json_response_rps']:.0f} req/s")
@@ -0,0 +1,64 @@
+"""Cold start of an application serving its OpenAPI schema, with and without a route table snapshot."""
+
+from __future__ import annotations
+
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi import FastAPI, HTTPException, status
+from pydantic import BaseModel
+
+from fastapi_class import View, ViewRegistry, endpoint
+
+VIEWS = 300
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def _synthetic_view(index: int) -> type:
+    async def get(self, limit: int = 50, offset: int = 0) -> Item:
+        return Item(id=index, name="item")  # pragma: no cover
+
+    async def post(self, item: Item) -> Item:
+        return item  # pragma: no cover
+
+    @endpoint("put", path="/rename")
+    async def rename(self, name: str) -> Item:
+        return Item(id=index, name=name)  # pragma: no cover
+
+    exceptions = {"common": [HTTPException(status.HTTP_404_NOT_FOUND, "Not found.")]}
+    return type(f"Synthetic{index}View", (), {"get": get, "post": post, "rename": rename, "EXCEPTIONS": exceptions})
+
+
+def _cold_start(classes: list[type], path: Path) -> tuple[float, bool]:
+    start = time.perf_counter()
+    app = FastAPI()
+    registry = ViewRegistry()
+    for index, cls in enumerate(classes):
+        View(app, path=f"/items{index}", registry=registry)(cls)
+    restored = registry.register_snapshot(app, path, source_hash="bench")
+    app.openapi()
+    return time.perf_counter() - start, restored
+
+
+def run(scale: float = 1.0) -> dict[str, float]:
+    """Return seconds spent registering `VIEWS * scale` views and generating their schema, then restoring both."""
+    views = max(1, int(VIEWS * scale))
+    classes = [_synthetic_view(index) for index in range(views)]
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "routes.json.gz"
+        cold, restored = _cold_start(classes, path)
+        assert not restored
+        snapshot, restored = _cold_start(classes, path)
+        assert restored
+    return {"cold_start_s": cold, "snapshot_start_s": snapshot}
+
+
+if __name__ == "__main__":
+    results = run()
+    print(f"cold start of {VIEWS} views (register + openapi): {results['cold_start_s'] * 1e3:.1f} ms")
+    print(f"cold start from a route table snapshot:         {results['snapshot_start_s'] * 1e3:.1f} ms")
@@ -0,0 +1,62 @@
+"""Startup cost of registering many synthetic views, eagerly and through a `ViewRegistry`."""
+
+from __future__ import annotations
+
+import time
+
+from fastapi import FastAPI
+from pydantic import BaseModel
+
+from fastapi_class import View, ViewRegistry, endpoint
+
+VIEWS = 300
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def _synthetic_view(index: int) -> type:
+    async def get(self, limit: int = 50, offset: int = 0) -> Item:
+        return Item(id=index, name="item")  # pragma: no cover
+
+    async def post(self, item: Item) -> Item:
+        return item  # pragma: no cover
+
+    @endpoint("put", path="/rename")
+    async def rename(self, name: str) -> Item:
+        return Item(id=index, name=name)  # pragma: no cover
+
+    return type(f"Synthetic{index}View", (), {"get": get, "post": post, "rename": rename})
+
+
+def run(scale: float = 1.0) -> dict[str, float]:
+    """Return seconds spent decorating and registering `VIEWS * scale` views, eagerly and through a registry."""
+    views = max(1, int(VIEWS * scale))
+    classes = [_synthetic_view(index) for index in range(views)]
+
+    start = time.perf_counter()
+    app = FastAPI()
+    for index, cls in enumerate(classes):
+        View(app, path=f"/eager{index}")(cls)
+    eager = time.perf_counter() - start
+
+    start = time.perf_counter()
+    registry = ViewRegistry()
+    app = FastAPI()
+    for index, cls in enumerate(classes):
+        View(app, path=f"/lazy{index}", registry=registry)(cls)
+    decorate = time.perf_counter() - start
+    start = time.perf_counter()
+    registry.register()
+    register = time.perf_counter() - start
+
+    return {"eager_s": eager, "registry_decorate_s": decorate, "registry_register_s": register}
+
+
+if __name__ == "__main__":
+    results = run()
+    print(f"eager registration of {VIEWS} views:    {results['eager_s'] * 1e3:.1f} ms")
+    print(f"registry, decoration (import time):  {results['registry_decorate_s'] * 1e3:.1f} ms")
+    print(f"registry, register():                {results['registry_register_s'] * 1e3:.1f} ms")
@@ -37,17 +37,70 @@ class ItemView:
 
 __version__ = "3.7.0"
 
-from fastapi_class.exception import FormattedMessageException
-from fastapi_class.openapi import ExceptionModel, _exceptions_to_responses
-from fastapi_class.routers import Metadata, Method, endpoint
+from fastapi_class.cache import Cache, CacheBackend, InMemoryCache
+from fastapi_class.coalesce import Coalesce
+from fastapi_class.compression import Compress
+from fastapi_class.conditional import ETag
+from fastapi_class.dependencies import memoize
+from fastapi_class.exception import FormattedMessageException, PreparedHTTPException, prepared_exception_handler
+from fastapi_class.executors import ProcessExecutor
+from fastapi_class.lifecycle import InstanceScope
+from fastapi_class.metrics import MetricsRegistry, PrometheusExporter, add_metrics_route
+from fastapi_class.openapi import ExceptionModel, _exceptions_to_responses, cache_openapi
+from fastapi_class.pagination import Page, PageRequest, Paginator
+from fastapi_class.profiling import Profiler, add_profile_route
+from fastapi_class.ratelimit import InMemoryRateLimiter, RateLimit, RateLimitBackend
+from fastapi_class.realtime import Broadcaster, Message, Realtime, WebSocketConnection
+from fastapi_class.registry import ViewRegistry
+from fastapi_class.responses import ModelJSONResponse
+from fastapi_class.routers import Channel, Metadata, Method, endpoint
+from fastapi_class.snapshot import RouteTable, source_hash
+from fastapi_class.streaming import JSONArrayResponse, NDJSONResponse
+from fastapi_class.timeouts import Deadline, get_deadline
 from fastapi_class.views import View
 
 __all__ = [
     "View",
+    "ViewRegistry",
     "endpoint",
     "Method",
     "Metadata",
+    "InstanceScope",
     "FormattedMessageException",
+    "PreparedHTTPException",
+    "prepared_exception_handler",
     "ExceptionModel",
     "_exceptions_to_responses",
+    "cache_openapi",
+    "Cache",
+    "CacheBackend",
+    "InMemoryCache",
+    "ModelJSONResponse",
+    "NDJSONResponse",
+    "JSONArrayResponse",
+    "Coalesce",
+    "MetricsRegistry",
+    "PrometheusExporter",
+    "add_metrics_route",
+    "ProcessExecutor",
+    "memoize",
+    "RateLimit",
+    "RateLimitBackend",
+    "InMemoryRateLimiter",
+    "Deadline",
+    "get_deadline",
+    "Page",
+    "PageRequest",
+    "Paginator",
+    "RouteTable",
+    "source_hash",
+    "ETag",
+    "Compress",
+    "Profiler",
+    "add_profile_route",
+    "Channel",
+    "Realtime",
+    "Broadcaster",
+    "Message",
+    "WebSocketConnection",
 ]
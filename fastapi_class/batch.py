@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import logging
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from typing import Annotated, Any, Literal, Optional, Union, get_args, get_origin
+
+from fastapi import BackgroundTasks, Body, HTTPException, Response, params
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+from fastapi.security import SecurityScopes
+from pydantic import BaseModel, Field, TypeAdapter, create_model
+from starlette.concurrency import run_in_threadpool
+from starlette.requests import HTTPConnection
+
+from fastapi_class.signature import typed_signature
+
+logger = logging.getLogger("fastapi_class")
+
+BATCH_PATH = "batch"
+UNBATCHABLE_PARAMETER_TYPES = (HTTPConnection, Response, BackgroundTasks, SecurityScopes)
+
+
+class BatchResult(BaseModel):
+    """Outcome of one item of a batch request."""
+
+    status_code: int
+    result: Any = None
+    detail: Any = None
+
+
+def _model_name(*parts: str) -> str:
+    return "".join(word.capitalize() if word.islower() else word for part in parts for word in part.split("_"))
+
+
+def arguments_model(name: str, signature: inspect.Signature) -> type[BaseModel] | None:
+    """Build a model of the parameters of a view method, or return `None` if the method can't be batched.
+
+    Methods taking dependencies, request-bound objects, form fields or variadic parameters need a real request.
+    """
+    fields: dict[str, Any] = {}
+    for parameter in signature.parameters.values():
+        annotation = Any if parameter.annotation is inspect.Parameter.empty else parameter.annotation
+        default = ... if parameter.default is inspect.Parameter.empty else parameter.default
+        if parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
+            return None
+        if isinstance(default, (params.Depends, params.Form)):
+            return None
+        if get_origin(annotation) is Annotated and any(
+            isinstance(arg, (params.Depends, params.Form)) for arg in get_args(annotation)
+        ):
+            return None
+        if isinstance(annotation, type) and issubclass(annotation, UNBATCHABLE_PARAMETER_TYPES):
+            return None
+        fields[parameter.name] = (annotation, default)
+    return create_model(name, **fields)
+
+
+@dataclass(frozen=True)
+class BatchOperation:
+    """A view method callable from the batch route of its view."""
+
+    function: Callable[..., Any]
+    arguments: type[BaseModel]
+    response_model: Any | None
+    status_code: int
+    adapter: TypeAdapter[Any] | None
+
+    @classmethod
+    def build(
+        cls,
+        view_name: str,
+        name: str,
+        function: Callable[..., Any],
+        response_model: Any | None,
+        status_code: int,
+    ) -> BatchOperation | None:
+        """Return the operation running `function`, or `None` if it can't be batched."""
+        arguments = arguments_model(_model_name(view_name, name, "Arguments"), typed_signature(function))
+        if arguments is None:
+            return None
+        adapter = TypeAdapter(response_model) if response_model is not None else None
+        return cls(function, arguments, response_model, status_code, adapter)
+
+    def item_model(self, view_name: str, name: str) -> type[BaseModel]:
+        """Model of a batch item calling this operation, discriminated by its `method` field."""
+        required = any(field.is_required() for field in self.arguments.model_fields.values())
+        return create_model(
+            _model_name(view_name, name, "BatchItem"),
+            method=(Literal[name], ...),
+            arguments=(self.arguments, ... if required else Field(default_factory=self.arguments)),
+        )
+
+    async def __call__(self, arguments: BaseModel) -> dict[str, Any]:
+        kwargs = {name: getattr(arguments, name) for name in type(arguments).model_fields}
+        try:
+            if inspect.iscoroutinefunction(self.function):
+                result = await self.function(**kwargs)
+            else:
+                result = await run_in_threadpool(self.function, **kwargs)
+            if isinstance(result, Response):
+                return {"status_code": result.status_code, "result": bytes(result.body).decode()}
+            if self.adapter is not None:
+                result = self.adapter.dump_python(
+                    self.adapter.validate_python(result, from_attributes=True), mode="json"
+                )
+            else:
+                result = jsonable_encoder(result)
+            return {"status_code": self.status_code, "result": result}
+        except HTTPException as exc:
+            return {"status_code": exc.status_code, "detail": exc.detail}
+        except Exception:
+            logger.exception("Batch item %s failed", self.function.__qualname__)
+            return {"status_code": 500, "detail": "Internal Server Error"}
+
+
+def batch_endpoint(
+    view_name: str,
+    operations: dict[str, BatchOperation],
+    *,
+    max_concurrency: int,
+    max_size: int | None = None,
+) -> tuple[Callable[..., Any], type[BaseModel]]:
+    """Build the endpoint of a batch route and the model of its results.
+
+    The endpoint accepts a list of `{"method": ..., "arguments": {...}}` items, runs them concurrently, at most
+    `max_concurrency` at a time, and returns their results in order.
+    """
+    items = [operation.item_model(view_name, name) for name, operation in operations.items()]
+    item = items[0] if len(items) == 1 else Annotated[Union[tuple(items)], Field(discriminator="method")]
+    results = [operation.response_model for operation in operations.values()]
+    result_type = Any if None in results else Optional[Union[tuple(results)]]
+    result_model = create_model(_model_name(view_name, "BatchResult"), __base__=BatchResult, result=(result_type, None))
+
+    async def _endpoint(items: Iterable[Any]) -> Response:
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _run(item: Any) -> dict[str, Any]:
+            async with semaphore:
+                return await operations[item.method](item.arguments)
+
+        return JSONResponse(await asyncio.gather(*map(_run, items)))
+
+    _endpoint.__signature__ = inspect.Signature(  # type: ignore
+        [
+            inspect.Parameter(
+                "items",
+                inspect.Parameter.POSITIONAL_OR_KEYWORD,
+                annotation=Annotated[list[item], Body(max_length=max_size)],  # type: ignore[valid-type]
+            )
+        ]
+    )
+    _endpoint.__name__ = _endpoint.__qualname__ = f"{view_name}_batch"
+    return _endpoint, result_model
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from fastapi_class.concurrency import SingleFlight
+from fastapi_class.route import Handler, Layer, replay, replaying
+
+CACHEABLE_METHODS = frozenset({"GET", "HEAD"})
+INVALIDATING_METHODS = frozenset({"POST", "PUT", "PATCH", "DELETE"})
+CREDENTIAL_HEADERS = ("authorization", "cookie")
+Variant = Callable[[Request], str]
+
+
+def request_key(request: Request, vary: tuple[str, ...] = (), variant: Variant | None = None) -> str:
+    """Identify a readonly request by its method, path, query string and `vary` headers.
+
+    `variant` adds a value derived from the request, such as the negotiated content encoding.
+    """
+    key = f"{request.method}:{request.url.path}?{request.url.query}"
+    if vary:
+        key += "|" + "|".join(request.headers.get(header, "") for header in vary)
+    if variant is not None:
+        key += "#" + variant(request)
+    return key
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Serialized response stored by a `CacheBackend`."""
+
+    status_code: int
+    headers: tuple[tuple[bytes, bytes], ...]
+    body: bytes
+
+    @classmethod
+    def from_response(cls, response: Response) -> CachedResponse:
+        return cls(response.status_code, tuple(response.raw_headers), bytes(response.body))
+
+    def to_response(self) -> Response:
+        return _StoredResponse(self)
+
+
+class _StoredResponse(Response):
+    """Response replaying a `CachedResponse` without re-rendering its body or headers."""
+
+    def __init__(self, cached: CachedResponse) -> None:
+        self.status_code = cached.status_code
+        self.body = cached.body
+        self.raw_headers = list(cached.headers)
+        self.background = None
+
+
+class CacheBackend(ABC):
+    """Storage of cached responses, grouped by namespace (one per view)."""
+
+    @abstractmethod
+    async def get(self, namespace: str, key: str) -> CachedResponse | None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, namespace: str, key: str, value: CachedResponse, ttl: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def invalidate(self, namespace: str) -> None:
+        raise NotImplementedError
+
+
+class InMemoryCache(CacheBackend):
+    """Process-local LRU cache bounded by entry count and total body size."""
+
+    def __init__(self, *, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._size = 0
+        self._entries: OrderedDict[tuple[str, str], tuple[float, CachedResponse]] = OrderedDict()
+        self._namespaces: dict[str, set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, namespace: str, key: str) -> CachedResponse | None:
+        entry = self._entries.get((namespace, key))
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._discard((namespace, key))
+            return None
+        self._entries.move_to_end((namespace, key))
+        return entry[1]
+
+    async def set(self, namespace: str, key: str, value: CachedResponse, ttl: float) -> None:
+        if len(value.body) > self.max_bytes:
+            return
+        self._discard((namespace, key))
+        self._entries[namespace, key] = (time.monotonic() + ttl, value)
+        self._namespaces.setdefault(namespace, set()).add(key)
+        self._size += len(value.body)
+        while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+            self._discard(next(iter(self._entries)))
+
+    async def invalidate(self, namespace: str) -> None:
+        for key in self._namespaces.pop(namespace, ()):
+            entry = self._entries.pop((namespace, key), None)
+            if entry is not None:
+                self._size -= len(entry[1].body)
+
+    def _discard(self, item: tuple[str, str]) -> None:
+        entry = self._entries.pop(item, None)
+        if entry is None:
+            return
+        self._size -= len(entry[1].body)
+        keys = self._namespaces.get(item[0])
+        if keys is not None:
+            keys.discard(item[1])
+            if not keys:
+                del self._namespaces[item[0]]
+
+
+default_backend = InMemoryCache()
+
+
+@dataclass(frozen=True)
+class Cache:
+    """Response caching policy of a view method.
+
+    `ttl` is in seconds. `vary` lists the request headers that are part of the cache key besides the path and
+    query string; by default the credentials, so each user gets their own entries. `vary=()` shares the entries
+    between users. Cached responses are served once the dependencies of the route (e.g. authentication) have run, and
+    requests waiting for a failed fill run the method themselves.
+
+    ### Example:
+        >>> @endpoint("get", path="items", cache=Cache(ttl=30, vary=("authorization", "accept-language")))
+        ... async def items(self):
+        ...     ...
+    """
+
+    ttl: float = 60.0
+    vary: tuple[str, ...] = CREDENTIAL_HEADERS
+    backend: CacheBackend = field(default=default_backend, compare=False)
+
+    @classmethod
+    def parse(cls, value: Cache | float | None) -> Cache | None:
+        """Accept a `Cache`, a TTL in seconds or `None`."""
+        if value is None or isinstance(value, Cache):
+            return value
+        return cls(ttl=value)
+
+    def key(self, request: Request, variant: Variant | None = None) -> str:
+        return request_key(request, self.vary, variant)
+
+    def layer(self, namespace: str, variant: Variant | None = None) -> Layer:
+        """Return the route layer serving cached responses of a readonly method, whose endpoint has to be wrapped by
+        `replayable_endpoint()`.
+
+        `variant` stores a separate response per value it returns, e.g. per negotiated content encoding.
+        """
+        flight: SingleFlight[Response] = SingleFlight()
+
+        def _layer(handler: Handler) -> Handler:
+            async def _handler(request: Request) -> Response:
+                if request.method not in CACHEABLE_METHODS or replaying():
+                    return await handler(request)
+                key = self.key(request, variant)
+                cached = await self.backend.get(namespace, key)
+                if cached is not None:
+                    return await replay(handler, request, cached.to_response())
+
+                filled = False
+
+                async def _fill() -> Response:
+                    nonlocal filled
+                    filled = True
+                    response = await handler(request)
+                    if _cacheable(response):
+                        await self.backend.set(namespace, key, CachedResponse.from_response(response), self.ttl)
+                    return response
+
+                try:
+                    response = await flight.do(key, _fill)
+                except Exception:
+                    if filled:
+                        raise
+                    return await handler(request)
+                if filled:
+                    return response
+                if not _cacheable(response):
+                    return await handler(request)
+                return await replay(handler, request, CachedResponse.from_response(response).to_response())
+
+            return _handler
+
+        return _layer
+
+
+def _cacheable(response: Response) -> bool:
+    return response.status_code == 200 and hasattr(response, "body") and "set-cookie" not in response.headers
+
+
+def invalidation_layer(namespace: str, backends: Iterable[CacheBackend]) -> Layer:
+    """Return the route layer clearing the cache of a view after a successful mutating request."""
+    _backends = tuple(dict.fromkeys(backends))
+
+    def _layer(handler: Handler) -> Handler:
+        async def _handler(request: Request) -> Response:
+            response = await handler(request)
+            if request.method in INVALIDATING_METHODS and response.status_code < 400:
+                for backend in _backends:
+                    await backend.invalidate(namespace)
+            return response
+
+        return _handler
+
+    return _layer
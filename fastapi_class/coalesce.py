@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from fastapi_class.cache import CACHEABLE_METHODS, CREDENTIAL_HEADERS, CachedResponse, Variant, request_key
+from fastapi_class.concurrency import SingleFlight
+from fastapi_class.route import Handler, Layer, replay, replaying
+
+
+@dataclass(frozen=True)
+class Coalesce:
+    """Request coalescing policy of a view method.
+
+    Concurrent readonly requests with the same path, query string and `vary` headers (by default the credentials)
+    wait for a single execution of the method and share its response, once their own dependencies have run. Nothing
+    is kept once it completes. Only successful responses are shared: when the execution fails, streams or sets
+    cookies, each waiter runs the method itself.
+
+    ### Example:
+        >>> @endpoint("get", path="report", coalesce=Coalesce(vary=("authorization", "accept-language")))
+        ... async def report(self):
+        ...     ...
+    """
+
+    vary: tuple[str, ...] = CREDENTIAL_HEADERS
+
+    @classmethod
+    def parse(cls, value: Coalesce | bool | None) -> Coalesce | None:
+        """Accept a `Coalesce`, `True` for the default policy, or `False`/`None`."""
+        if isinstance(value, Coalesce):
+            return value
+        return cls() if value else None
+
+    def layer(self, variant: Variant | None = None) -> Layer:
+        """Return the route layer coalescing concurrent identical requests, which `variant` may tell apart.
+
+        The endpoint has to be wrapped by `replayable_endpoint()`.
+        """
+        flight: SingleFlight[Response] = SingleFlight()
+
+        def _layer(handler: Handler) -> Handler:
+            async def _handler(request: Request) -> Response:
+                if request.method not in CACHEABLE_METHODS or replaying():
+                    return await handler(request)
+                leader = False
+
+                async def _run() -> Response:
+                    nonlocal leader
+                    leader = True
+                    return await handler(request)
+
+                try:
+                    response = await flight.do(request_key(request, self.vary, variant), _run)
+                except Exception:
+                    if leader:
+                        raise
+                    return await handler(request)
+                if leader:
+                    return response
+                if not _shareable(response):
+                    return await handler(request)
+                return await replay(handler, request, CachedResponse.from_response(response).to_response())
+
+            return _handler
+
+        return _layer
+
+
+def _shareable(response: Response) -> bool:
+    return response.status_code < 400 and hasattr(response, "body") and "set-cookie" not in response.headers
@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import gzip
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from fastapi import Request
+from fastapi.responses import Response
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_class.route import Handler, Layer
+
+try:
+    import brotli  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard  # type: ignore[import-not-found]
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+IDENTITY = "identity"
+COMPRESSIBLE_TYPES = ("text/", "application/json", "application/x-ndjson", "application/xml", "application/javascript")
+COMPRESSIBLE_SUFFIXES = ("+json", "+xml")
+
+
+def _gzip(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=6, mtime=0)
+
+
+ENCODERS: dict[str, Callable[[bytes], bytes]] = {}
+if brotli is not None:  # pragma: no cover
+    ENCODERS["br"] = lambda data: brotli.compress(data, quality=4)
+if zstandard is not None:  # pragma: no cover
+    ENCODERS["zstd"] = zstandard.ZstdCompressor(level=3).compress
+ENCODERS["gzip"] = _gzip
+
+
+def accepted_encodings(accept_encoding: str) -> dict[str, float]:
+    """Parse an `Accept-Encoding` header into the quality value of each coding."""
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, parameters = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        parameter = parameters.strip()
+        if parameter.startswith("q="):
+            try:
+                quality = float(parameter[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+    return qualities
+
+
+def _compressible(content_type: str) -> bool:
+    content_type = content_type.partition(";")[0].strip().lower()
+    return content_type.startswith(COMPRESSIBLE_TYPES) or content_type.endswith(COMPRESSIBLE_SUFFIXES)
+
+
+@dataclass(frozen=True)
+class Compress:
+    """Response compression policy of a view method.
+
+    Bodies of at least `minimum_size` bytes are compressed with the coding the client prefers among `encodings`,
+    those with an encoder available: `br` with `brotli` installed, `zstd` with `zstandard` installed, and `gzip`.
+    Bodies of `threadpool_size` bytes or more are compressed in the threadpool rather than on the event loop.
+    Streaming responses aren't compressed.
+
+    ### Example:
+        >>> @endpoint("get", path="report", compress=Compress(minimum_size=1024))
+        ... async def report(self):
+        ...     ...
+    """
+
+    minimum_size: int = 500
+    threadpool_size: int = 64 * 1024
+    encodings: tuple[str, ...] = field(default_factory=lambda: tuple(ENCODERS))
+
+    @classmethod
+    def parse(cls, value: Compress | bool | int | None) -> Compress | None:
+        """Accept a `Compress`, `True` for the default policy, a minimum size in bytes, or `False`/`None`."""
+        if isinstance(value, Compress):
+            return value
+        if value is True:
+            return cls()
+        if value is False or value is None:
+            return None
+        return cls(minimum_size=value)
+
+    def negotiate(self, request: Request) -> str:
+        """Return the coding to use for `request`, `identity` when it doesn't accept any of `encodings`."""
+        accept_encoding = request.headers.get("accept-encoding")
+        if not accept_encoding:
+            return IDENTITY
+        qualities = accepted_encodings(accept_encoding)
+        default = qualities.get("*", 0.0)
+        best, best_quality = IDENTITY, 0.0
+        for encoding in self.encodings:
+            quality = qualities.get(encoding, default)
+            if encoding in ENCODERS and quality > best_quality:
+                best, best_quality = encoding, quality
+        return best
+
+    def layer(self) -> Layer:
+        """Return the route layer compressing the responses of a view method."""
+
+        def _layer(handler: Handler) -> Handler:
+            async def _handler(request: Request) -> Response:
+                response = await handler(request)
+                if (
+                    not hasattr(response, "body")
+                    or len(response.body) < self.minimum_size
+                    or "content-encoding" in response.headers
+                    or not _compressible(response.headers.get("content-type", ""))
+                ):
+                    return response
+                vary = response.headers.get("vary")
+                if vary is None:
+                    response.headers["vary"] = "Accept-Encoding"
+                elif "accept-encoding" not in vary.lower():
+                    response.headers["vary"] = vary + ", Accept-Encoding"
+                encoding = self.negotiate(request)
+                if encoding == IDENTITY:
+                    return response
+                body = bytes(response.body)
+                if len(body) >= self.threadpool_size:
+                    response.body = await run_in_threadpool(ENCODERS[encoding], body)
+                else:
+                    response.body = ENCODERS[encoding](body)
+                response.headers["content-encoding"] = encoding
+                response.headers["content-length"] = str(len(response.body))
+                return response
+
+            return _handler
+
+        return _layer
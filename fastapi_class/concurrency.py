@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import Awaitable, Callable, Hashable
+from contextlib import suppress
+from typing import Any, Generic, TypeVar
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import Response
+
+from fastapi_class.route import Handler, replaying
+
+T = TypeVar("T")
+
+
+class SingleFlight(Generic[T]):
+    """Deduplicates concurrent calls sharing a key.
+
+    The first caller for a key runs the function; callers arriving while it runs wait for its outcome instead. A
+    result or an exception is handed to every waiter, nothing is kept once the call completes. If the running call
+    is cancelled, waiters don't inherit the cancellation: one of them runs the function again.
+
+    ### Example:
+        >>> flight = SingleFlight()
+        >>> await flight.do(("GET", "/items"), fetch_items)
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._calls)
+
+    async def do(self, key: Hashable, function: Callable[[], Awaitable[T]]) -> T:
+        """Run `function`, or wait for the call already running for `key`."""
+        while (future := self._calls.get(key)) is not None:
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+        future = self._calls[key] = asyncio.get_running_loop().create_future()
+        try:
+            result = await function()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except Exception as exc:
+            future.set_exception(exc)
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._calls[key]
+
+
+def _overloaded() -> HTTPException:
+    return HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, "Too many concurrent requests.")
+
+
+def _queue_timeout() -> HTTPException:
+    return HTTPException(status.HTTP_503_SERVICE_UNAVAILABLE, "Timed out waiting for a concurrency slot.")
+
+
+LIMIT_EXCEPTIONS = (_overloaded, _queue_timeout)
+
+
+class ConcurrencyLimiter:
+    """Limits the concurrent executions of a view method.
+
+    Up to `max_concurrency` requests run at once; the next ones wait, first in first out, in a queue of at most
+    `queue_limit` requests (unbounded when `None`) for at most `queue_timeout` seconds. Requests that can't be
+    queued or time out are rejected with a 503.
+
+    ### Example:
+        >>> @endpoint("get", path="report", max_concurrency=4, queue_limit=16, queue_timeout=1.0)
+        ... async def report(self):
+        ...     ...
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        *,
+        queue_limit: int | None = None,
+        queue_timeout: float | None = None,
+    ) -> None:
+        self.max_concurrency = max_concurrency
+        self.queue_limit = queue_limit
+        self.queue_timeout = queue_timeout
+        self.active = 0
+        self.rejected = 0
+        self._waiters: deque[asyncio.Future[None]] = deque()
+
+    @property
+    def queued(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self) -> None:
+        """Wait for a slot, or raise a 503 `HTTPException` when overloaded."""
+        if self.active < self.max_concurrency and not self._waiters:
+            self.active += 1
+            return
+        if self.queue_limit is not None and len(self._waiters) >= self.queue_limit:
+            self.rejected += 1
+            raise _overloaded()
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await asyncio.wait_for(future, self.queue_timeout)
+        except (asyncio.TimeoutError, asyncio.CancelledError) as exc:
+            if future.done() and not future.cancelled():
+                self.release()
+            else:
+                with suppress(ValueError):
+                    self._waiters.remove(future)
+            if isinstance(exc, asyncio.TimeoutError):
+                self.rejected += 1
+                raise _queue_timeout() from None
+            raise
+
+    def release(self) -> None:
+        """Hand the slot over to the next waiter, or free it."""
+        while self._waiters:
+            future = self._waiters.popleft()
+            if not future.done():
+                future.set_result(None)
+                return
+        self.active -= 1
+
+    def layer(self, handler: Handler) -> Handler:
+        """Wrap a route handler to run it within the limit; replayed responses don't take a slot."""
+
+        async def _handler(request: Request) -> Response:
+            if replaying():
+                return await handler(request)
+            await self.acquire()
+            try:
+                return await handler(request)
+            finally:
+                self.release()
+
+        return _handler
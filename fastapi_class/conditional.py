@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import hashlib
+import inspect
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Union
+
+from fastapi import Request, status
+from fastapi.responses import Response
+
+from fastapi_class.cache import CACHEABLE_METHODS
+from fastapi_class.route import Handler, Layer
+
+Version = Callable[[Request], Union[str, None, Awaitable[Union[str, None]]]]
+LastModified = Callable[[Request], Union[datetime, None, Awaitable[Union[datetime, None]]]]
+NOT_MODIFIED_RESPONSE = {"description": "Not Modified"}
+NOT_MODIFIED_HEADERS = frozenset(
+    {"cache-control", "content-location", "date", "etag", "expires", "last-modified", "vary"}
+)
+
+
+def entity_tag(value: bytes | str, *, weak: bool = False) -> str:
+    """Quoted entity tag of `value`, a response body or a version string."""
+    data = value.encode("utf-8") if isinstance(value, str) else value
+    tag = '"' + hashlib.blake2b(data, digest_size=16).hexdigest() + '"'
+    return "W/" + tag if weak else tag
+
+
+def etag_matches(if_none_match: str, tag: str) -> bool:
+    """Whether `tag` matches an `If-None-Match` header, using the weak comparison of RFC 9110."""
+    if if_none_match.strip() == "*":
+        return True
+    opaque = _opaque(tag)
+    return any(_opaque(candidate.strip()) == opaque for candidate in if_none_match.split(","))
+
+
+def _opaque(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+
+def not_modified_since(if_modified_since: str, last_modified: datetime) -> bool:
+    """Whether `last_modified` isn't later than an `If-Modified-Since` header; invalid dates never match."""
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def _utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+async def _call(function: Callable[[Request], Any], request: Request) -> Any:
+    result = function(request)
+    return await result if inspect.isawaitable(result) else result
+
+
+@dataclass(frozen=True)
+class ETag:
+    """Conditional request policy of a readonly view method.
+
+    Responses get an `ETag` computed from their body, strong unless `weak` is set, and requests whose
+    `If-None-Match` matches it get a `304 Not Modified` without a body. `version` is a cheap function of the request
+    returning a string that changes whenever the response does: the tag is then derived from it and a matching
+    request is answered before the method runs, skipping its serialization. `last_modified` returns the modification
+    time of the resource, sent as `Last-Modified` and compared with `If-Modified-Since`.
+
+    ### Example:
+        >>> @endpoint("get", path="items", etag=ETag(version=lambda request: str(store.version)))
+        ... async def items(self):
+        ...     ...
+    """
+
+    weak: bool = False
+    version: Version | None = None
+    last_modified: LastModified | None = None
+
+    @classmethod
+    def parse(cls, value: ETag | bool | Version | None) -> ETag | None:
+        """Accept an `ETag`, `True` for body-derived tags, a version function, or `False`/`None`."""
+        if isinstance(value, ETag):
+            return value
+        if callable(value):
+            return cls(version=value)
+        return cls() if value else None
+
+    def layer(self) -> Layer:
+        """Return the route layer tagging responses and answering conditional requests."""
+
+        def _layer(handler: Handler) -> Handler:
+            async def _handler(request: Request) -> Response:
+                if request.method not in CACHEABLE_METHODS:
+                    return await handler(request)
+                headers: dict[str, str] = {}
+                if self.version is not None:
+                    version = await _call(self.version, request)
+                    if version is not None:
+                        headers["etag"] = entity_tag(version, weak=self.weak)
+                if self.last_modified is not None:
+                    last_modified = await _call(self.last_modified, request)
+                    if last_modified is not None:
+                        headers["last-modified"] = format_datetime(_utc(last_modified), usegmt=True)
+                if headers and self._not_modified(request, headers):
+                    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+                response = await handler(request)
+                if not 200 <= response.status_code < 300:
+                    return response
+                for name, value in headers.items():
+                    response.headers.setdefault(name, value)
+                if "etag" not in response.headers and hasattr(response, "body"):
+                    response.headers["etag"] = entity_tag(bytes(response.body), weak=self.weak)
+                if self._not_modified(request, response.headers):
+                    return Response(
+                        status_code=status.HTTP_304_NOT_MODIFIED,
+                        headers={
+                            name: value for name, value in response.headers.items() if name in NOT_MODIFIED_HEADERS
+                        },
+                    )
+                return response
+
+            return _handler
+
+        return _layer
+
+    @staticmethod
+    def _not_modified(request: Request, headers: Any) -> bool:
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match is not None:
+            return "etag" in headers and etag_matches(if_none_match, headers["etag"])
+        if_modified_since = request.headers.get("if-modified-since")
+        if if_modified_since is not None and "last-modified" in headers:
+            return not_modified_since(if_modified_since, parsedate_to_datetime(headers["last-modified"]))
+        return False
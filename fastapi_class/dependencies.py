@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import inspect
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from typing import Any
+
+from starlette.concurrency import run_in_threadpool
+
+from fastapi_class.concurrency import SingleFlight
+from fastapi_class.signature import copy_signature, typed_signature
+
+
+def _arguments_key(**kwargs: Any) -> Hashable:
+    return tuple(sorted(kwargs.items()))
+
+
+def memoize(
+    dependency: Callable[..., Any],
+    *,
+    ttl: float,
+    max_entries: int = 1024,
+    key: Callable[..., Hashable] | None = None,
+) -> Callable[..., Any]:
+    """Cache the results of an expensive, idempotent dependency across requests for `ttl` seconds.
+
+    The returned dependency has the signature of `dependency`, so FastAPI resolves the same parameters (headers,
+    sub-dependencies, ...). Results are keyed on those resolved arguments, or on `key(**arguments)` when they aren't
+    hashable, and the least recently used of `max_entries` results are evicted first. Concurrent misses for the same
+    key share one call. Within a request FastAPI already runs each dependency once, so create the memoized dependency
+    once and reuse it everywhere.
+
+    ### Example:
+        >>> introspect_token = memoize(introspect, ttl=60)
+        >>> @View(app)
+        ... class UserView:
+        ...     DEPENDENCIES = {"common": [Depends(introspect_token)]}
+    """
+    if inspect.isgeneratorfunction(dependency) or inspect.isasyncgenfunction(dependency):
+        raise TypeError(f"{dependency.__qualname__} has teardown code and can't be memoized")
+    signature = typed_signature(dependency)
+    make_key = key or _arguments_key
+    entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+    flight: SingleFlight[Any] = SingleFlight()
+
+    async def _resolve(**kwargs: Any) -> Any:
+        if inspect.iscoroutinefunction(dependency):
+            return await dependency(**kwargs)
+        return await run_in_threadpool(dependency, **kwargs)
+
+    async def _dependency(**kwargs: Any) -> Any:
+        cache_key = make_key(**kwargs)
+        entry = entries.get(cache_key)
+        if entry is not None and entry[0] > time.monotonic():
+            entries.move_to_end(cache_key)
+            return entry[1]
+
+        async def _fill() -> Any:
+            value = await _resolve(**kwargs)
+            entries[cache_key] = (time.monotonic() + ttl, value)
+            entries.move_to_end(cache_key)
+            while len(entries) > max_entries:
+                entries.popitem(last=False)
+            return value
+
+        return await flight.do(cache_key, _fill)
+
+    return copy_signature(_dependency, dependency, signature)
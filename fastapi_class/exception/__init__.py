@@ -2,10 +2,14 @@ from fastapi_class.exception.handler import (
     UNKOWN_SERVER_ERROR_DETAIL,
     ExceptionAbstract,
     FormattedMessageException,
+    PreparedHTTPException,
+    prepared_exception_handler,
 )
 
 __all__ = [
     "FormattedMessageException",
     "ExceptionAbstract",
     "UNKOWN_SERVER_ERROR_DETAIL",
+    "PreparedHTTPException",
+    "prepared_exception_handler",
 ]
@@ -2,13 +2,53 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from collections.abc import Iterable
+from json.encoder import encode_basestring  # type: ignore[attr-defined]
+from string import Formatter
 from typing import Any
 
-from fastapi import HTTPException, status
+from fastapi import HTTPException, Request, status
+from fastapi.responses import Response
 
 UNKOWN_SERVER_ERROR_DETAIL = "Unknown server error"
 
 
+def _encode_detail(detail: str) -> bytes:
+    """Encode `{"detail": detail}` exactly like FastAPI's default handler would, without building an encoder."""
+    return b'{"detail":' + encode_basestring(detail).encode("utf-8") + b"}"
+
+
+class PreparedHTTPException(HTTPException):
+    """`HTTPException` carrying its already encoded JSON response body.
+
+    Without `prepared_exception_handler` installed it's handled like any other `HTTPException`.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        detail: str,
+        body: bytes | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(status_code=status_code, detail=detail, headers=headers)
+        self.body = _encode_detail(detail) if body is None else body
+
+
+async def prepared_exception_handler(_: Request, exc: Exception) -> Response:
+    """Respond with the pre-encoded body of a `PreparedHTTPException`.
+
+    ### Example:
+        >>> from fastapi import FastAPI
+        >>> from fastapi_class.exception import PreparedHTTPException, prepared_exception_handler
+        >>> app = FastAPI()
+        >>> app.add_exception_handler(PreparedHTTPException, prepared_exception_handler)
+    """
+    assert isinstance(exc, PreparedHTTPException)
+    if exc.status_code in {status.HTTP_204_NO_CONTENT, status.HTTP_304_NOT_MODIFIED}:
+        return Response(status_code=exc.status_code, headers=exc.headers)
+    return Response(exc.body, status_code=exc.status_code, headers=exc.headers, media_type="application/json")
+
+
 class ExceptionAbstract(ABC):
     _DEFAULT_DETAIL_SPECIAL_NAME = "__detail__"
 
@@ -22,11 +62,36 @@ class ExceptionAbstract(ABC):
 
 
 class FormattedMessageException(ExceptionAbstract):
+    """Factory of `HTTPException`s with a detail formatted from keyword arguments.
+
+    With `compiled=True` the factory returns `PreparedHTTPException`s, whose JSON body is encoded without building a
+    JSON encoder. A template without placeholders is formatted and encoded once, so raising it costs neither.
+
+    ### Example:
+        >>> NOT_FOUND = FormattedMessageException(exceptions=((404, "Item {item_id} not found"),), compiled=True)
+        >>> raise NOT_FOUND(item_id=1)
+    """
+
+    def __init__(self, *, exceptions: Iterable[tuple[int, str]] | None = None, compiled: bool = False) -> None:
+        super().__init__(exceptions=exceptions)
+        self._compiled = compiled
+        self._static_detail: str | None = None
+        self._static_body: bytes | None = None
+        if compiled:
+            template = self._exceptions[0][1]  # type: ignore
+            if all(field is None for _, field, _, _ in Formatter().parse(template)):
+                self._static_detail = template.format()
+                self._static_body = _encode_detail(self._static_detail)
+
     def __call__(self, *_, **kwargs):
         _exception = self._exceptions[0]
+        if self._static_body is not None:
+            return PreparedHTTPException(_exception[0], self._static_detail, self._static_body)  # type: ignore
 
         try:
             detail = _exception[1].format(**kwargs)
         except (IndexError, KeyError):
             detail = _exception[1]
+        if self._compiled:
+            return PreparedHTTPException(_exception[0], detail)
         return HTTPException(status_code=_exception[0], detail=detail)
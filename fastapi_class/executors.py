@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import asynccontextmanager
+from functools import partial
+from multiprocessing.context import BaseContext
+from typing import Any
+
+from fastapi import BackgroundTasks, Request, Response
+from fastapi.security import SecurityScopes
+from starlette.requests import HTTPConnection
+from starlette.routing import Router
+
+from fastapi_class.signature import copy_signature, typed_signature
+
+PROCESS_EXECUTOR = "process"
+UNPICKLABLE_PARAMETER_TYPES = (HTTPConnection, Request, Response, BackgroundTasks, SecurityScopes)
+
+
+class ProcessExecutor:
+    """Process pool running CPU-bound view methods, started on first use.
+
+    ### Example:
+        >>> executor = ProcessExecutor(max_workers=4)
+        >>> @View(app, process_executor=executor)
+        ... class ReportView:
+        ...     @endpoint("get", path="render", executor="process")
+        ...     def render(self, size: int):
+        ...         ...
+    """
+
+    def __init__(self, max_workers: int | None = None, *, mp_context: BaseContext | None = None) -> None:
+        self.max_workers = max_workers
+        self.mp_context = mp_context
+        self._pool: ProcessPoolExecutor | None = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.max_workers, mp_context=self.mp_context)
+        return self._pool
+
+    async def run(self, function: Callable[..., Any], /, **kwargs: Any) -> Any:
+        """Run `function(**kwargs)` in a worker process and return its result."""
+        return await asyncio.get_running_loop().run_in_executor(self.pool, partial(function, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes; the pool starts again if the executor is used afterwards."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait)
+            self._pool = None
+
+
+def shutdown_on_exit(router: Router, executor: ProcessExecutor) -> None:
+    """Shut `executor` down once the lifespan of `router` ends.
+
+    The lifespan context is wrapped rather than adding a shutdown handler, which Starlette ignores when the
+    application is given a `lifespan`.
+    """
+    lifespan = router.lifespan_context
+
+    @asynccontextmanager
+    async def _lifespan(app: Any) -> AsyncIterator[Any]:
+        try:
+            async with lifespan(app) as state:
+                yield state
+        finally:
+            executor.shutdown()
+
+    router.lifespan_context = _lifespan
+
+
+def check_process_endpoint(function: Callable[..., Any], signature: inspect.Signature) -> None:
+    """Raise `TypeError` when `function` can't run in a worker process.
+
+    The method has to be a plain function (not a coroutine or a generator) defined at module level, so that it and
+    its view instance are pickled by reference, and must not take request-bound objects as parameters. The check runs
+    while the class is being decorated, before it is bound to its module, so it can't try pickling it.
+    """
+    if inspect.iscoroutinefunction(function) or inspect.isasyncgenfunction(function):
+        raise TypeError(f"{function.__qualname__} must be a sync function to run in a process")
+    if inspect.isgeneratorfunction(function):
+        raise TypeError(f"{function.__qualname__} can't be a generator to run in a process")
+    for parameter in signature.parameters.values():
+        if isinstance(parameter.annotation, type) and issubclass(parameter.annotation, UNPICKLABLE_PARAMETER_TYPES):
+            raise TypeError(
+                f"Parameter {parameter.name} of {function.__qualname__} can't be sent to a process "
+                f"({parameter.annotation.__name__})"
+            )
+    if "<locals>" in function.__qualname__:
+        raise TypeError(f"{function.__qualname__} isn't picklable, it must be defined at module level")
+
+
+def process_endpoint(function: Callable[..., Any], executor: ProcessExecutor) -> Callable[..., Any]:
+    """Build a route endpoint running `function` in `executor`.
+
+    The endpoint itself runs on the event loop, so the result is validated against the response model in the parent
+    process as usual.
+    """
+    signature = typed_signature(function)
+    check_process_endpoint(function, signature)
+
+    async def _endpoint(**kwargs: Any) -> Any:
+        return await executor.run(function, **kwargs)
+
+    return copy_signature(_endpoint, function, signature)
@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import inspect
+import sys
+from collections import deque
+from collections.abc import Callable
+from enum import Enum
+from typing import Annotated, Any, get_args, get_origin, get_type_hints
+
+from fastapi import params
+
+from fastapi_class.signature import copy_signature, typed_signature
+
+RESET_HOOK_ATTRIBUTE_NAME = "reset"
+
+
+class InstanceScope(str, Enum):
+    """Lifetime of the view instance handling a request."""
+
+    VIEW = "view"
+    REQUEST = "request"
+
+
+class InstancePool:
+    """Bounded pool of view instances.
+
+    With `size=0` every request gets a fresh instance. Otherwise released instances are kept, after calling their
+    `reset()` hook if they define one, and handed out again to later requests.
+
+    ### Example:
+        >>> pool = InstancePool(MyView, size=32)
+        >>> instance = pool.acquire()
+        >>> pool.release(instance)
+    """
+
+    def __init__(self, factory: Callable[[], Any], *, size: int = 0) -> None:
+        self._factory = factory
+        self._size = size
+        self._free: deque[Any] = deque()
+
+    def acquire(self) -> Any:
+        """Return a pooled instance or build a new one."""
+        try:
+            return self._free.pop()
+        except IndexError:
+            return self._factory()
+
+    def release(self, instance: Any) -> None:
+        """Give an instance back to the pool."""
+        if len(self._free) >= self._size:
+            return
+        reset = getattr(instance, RESET_HOOK_ATTRIBUTE_NAME, None)
+        if reset is not None:
+            reset()
+        self._free.append(instance)
+
+
+def _type_hints(cls: type) -> dict[str, Any]:
+    """Resolve the annotations of `cls` one by one when some can't be, e.g. names only imported under `TYPE_CHECKING`.
+
+    Unresolved annotations are `inspect.Parameter.empty`.
+    """
+    try:
+        return get_type_hints(cls, include_extras=True)
+    except (NameError, TypeError):
+        pass
+    hints: dict[str, Any] = {}
+    for base in reversed(cls.__mro__):
+        globalns = getattr(sys.modules.get(base.__module__), "__dict__", {})
+        for name, annotation in base.__dict__.get("__annotations__", {}).items():
+            holder = type(name, (), {"__annotations__": {name: annotation}})
+            try:
+                hints[name] = get_type_hints(holder, globalns, dict(vars(base)), include_extras=True)[name]
+            except (NameError, TypeError):
+                hints[name] = inspect.Parameter.empty
+    return hints
+
+
+def class_dependencies(cls: type) -> dict[str, inspect.Parameter]:
+    """Collect the class-level dependencies of a view.
+
+    A dependency is either an attribute whose value is `Depends(...)`, or, for classes using `__slots__`, an
+    annotation such as `Annotated[Session, Depends(get_db)]`.
+    """
+    hints = _type_hints(cls)
+    dependencies: dict[str, inspect.Parameter] = {}
+    for name, hint in hints.items():
+        default = getattr(cls, name, inspect.Parameter.empty)
+        annotated = get_origin(hint) is Annotated and any(isinstance(arg, params.Depends) for arg in get_args(hint))
+        if isinstance(default, params.Depends) or annotated:
+            if not isinstance(default, params.Depends):
+                default = inspect.Parameter.empty
+            dependencies[name] = inspect.Parameter(
+                name, inspect.Parameter.KEYWORD_ONLY, default=default, annotation=hint
+            )
+    for name in dir(cls):
+        value = getattr(cls, name, None)
+        if name not in dependencies and isinstance(value, params.Depends):
+            dependencies[name] = inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, default=value)
+    return dependencies
+
+
+def request_scoped_endpoint(
+    function: Callable[..., Any],
+    pool: InstancePool,
+    dependencies: dict[str, inspect.Parameter],
+) -> Callable[..., Any]:
+    """Build a route endpoint that runs `function` on a per-request view instance.
+
+    The endpoint exposes the parameters of `function` (without `self`) plus the class dependencies, which FastAPI
+    resolves and the endpoint assigns to the instance before calling the method. Generator methods keep their
+    instance until the generator is exhausted or closed.
+    """
+    signature = typed_signature(function)
+    parameters = list(signature.parameters.values())[1:]
+    collisions = dependencies.keys() & {parameter.name for parameter in parameters}
+    if collisions:
+        raise ValueError(f"Class dependencies {sorted(collisions)} collide with parameters of {function.__qualname__}")
+    variadic = [parameter for parameter in parameters if parameter.kind is inspect.Parameter.VAR_KEYWORD]
+    parameters = [parameter for parameter in parameters if parameter.kind is not inspect.Parameter.VAR_KEYWORD]
+    signature = signature.replace(parameters=[*parameters, *dependencies.values(), *variadic])
+    names = tuple(dependencies)
+
+    def _bind(kwargs: dict[str, Any]) -> Any:
+        instance = pool.acquire()
+        for name in names:
+            setattr(instance, name, kwargs.pop(name))
+        return instance
+
+    if inspect.isasyncgenfunction(function):
+
+        async def _endpoint(**kwargs):
+            instance = _bind(kwargs)
+            try:
+                async for item in function(instance, **kwargs):
+                    yield item
+            finally:
+                pool.release(instance)
+
+    elif inspect.isgeneratorfunction(function):
+
+        def _endpoint(**kwargs):  # type: ignore[misc]
+            instance = _bind(kwargs)
+            try:
+                yield from function(instance, **kwargs)
+            finally:
+                pool.release(instance)
+
+    elif inspect.iscoroutinefunction(function):
+
+        async def _endpoint(**kwargs):  # type: ignore[misc]
+            instance = _bind(kwargs)
+            try:
+                return await function(instance, **kwargs)
+            finally:
+                pool.release(instance)
+
+    else:
+
+        def _endpoint(**kwargs):  # type: ignore[misc]
+            instance = _bind(kwargs)
+            try:
+                return function(instance, **kwargs)
+            finally:
+                pool.release(instance)
+
+    return copy_signature(_endpoint, function, signature)
@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from bisect import bisect_left
+from collections.abc import Iterator, Sequence
+from time import perf_counter
+
+from fastapi import APIRouter, FastAPI, Request
+from fastapi.responses import Response
+
+from fastapi_class.concurrency import ConcurrencyLimiter
+from fastapi_class.route import Handler, Layer
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class EndpointMetrics:
+    """Counters of a single view method.
+
+    Values are only updated from the event loop, by the route handler, so plain attributes are enough.
+    """
+
+    __slots__ = (
+        "name",
+        "view",
+        "method",
+        "calls",
+        "exceptions",
+        "in_flight",
+        "latency_sum",
+        "bounds",
+        "buckets",
+        "limiter",
+    )
+
+    def __init__(self, name: str, view: str, method: str, bounds: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.name = name
+        self.view = view
+        self.method = method
+        self.calls = 0
+        self.exceptions = 0
+        self.in_flight = 0
+        self.latency_sum = 0.0
+        self.bounds = tuple(bounds)
+        self.buckets = [0] * (len(self.bounds) + 1)
+        self.limiter: ConcurrencyLimiter | None = None
+
+    def observe(self, seconds: float) -> None:
+        """Record a call that took `seconds`."""
+        self.calls += 1
+        self.latency_sum += seconds
+        self.buckets[bisect_left(self.bounds, seconds)] += 1
+
+    def layer(self, handler: Handler) -> Handler:
+        """Wrap a route handler to record its calls."""
+
+        async def _handler(request: Request) -> Response:
+            self.in_flight += 1
+            start = perf_counter()
+            try:
+                return await handler(request)
+            except Exception:
+                self.exceptions += 1
+                raise
+            finally:
+                self.in_flight -= 1
+                self.observe(perf_counter() - start)
+
+        return _handler
+
+
+class MetricsRegistry:
+    """In-process store of `EndpointMetrics`, keyed by route name.
+
+    ### Example:
+        >>> from fastapi import FastAPI
+        >>> from fastapi_class import MetricsRegistry, View
+        >>> metrics = MetricsRegistry()
+        >>> app = FastAPI()
+        >>> @View(app, instrument=metrics)
+        ... class ItemView:
+        ...     async def get(self):
+        ...         ...
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        self.buckets = tuple(sorted(buckets))
+        self._endpoints: dict[str, EndpointMetrics] = {}
+
+    def __iter__(self) -> Iterator[EndpointMetrics]:
+        return iter(list(self._endpoints.values()))
+
+    def __getitem__(self, name: str) -> EndpointMetrics:
+        return self._endpoints[name]
+
+    def endpoint(self, name: str, view: str, method: str) -> EndpointMetrics:
+        """Return the metrics of a route, creating them on first use."""
+        metrics = self._endpoints.get(name)
+        if metrics is None:
+            metrics = self._endpoints[name] = EndpointMetrics(name, view, method, self.buckets)
+        return metrics
+
+    def layer(self, name: str, view: str, method: str) -> Layer:
+        """Return the route layer recording the metrics of a route."""
+        return self.endpoint(name, view, method).layer
+
+
+default_registry = MetricsRegistry()
+
+
+class Exporter(ABC):
+    """Renders a `MetricsRegistry` for a metrics backend."""
+
+    media_type = "text/plain"
+
+    @abstractmethod
+    def render(self, registry: MetricsRegistry) -> str:
+        raise NotImplementedError
+
+    def response(self, registry: MetricsRegistry) -> Response:
+        return Response(self.render(registry), media_type=self.media_type)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class PrometheusExporter(Exporter):
+    """Prometheus text exposition format."""
+
+    media_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, prefix: str = "fastapi_class") -> None:
+        self.prefix = prefix
+
+    def render(self, registry: MetricsRegistry) -> str:
+        prefix = self.prefix
+        lines = [
+            f"# HELP {prefix}_requests_in_flight Requests being handled by the view method.",
+            f"# TYPE {prefix}_requests_in_flight gauge",
+            f"# HELP {prefix}_exceptions_total Requests that raised an exception.",
+            f"# TYPE {prefix}_exceptions_total counter",
+            f"# HELP {prefix}_request_duration_seconds Time spent handling the request.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+            f"# HELP {prefix}_requests_queued Requests waiting for a concurrency slot.",
+            f"# TYPE {prefix}_requests_queued gauge",
+            f"# HELP {prefix}_requests_rejected_total Requests rejected by the concurrency limit.",
+            f"# TYPE {prefix}_requests_rejected_total counter",
+        ]
+        for metrics in registry:
+            labels = f'route="{_escape(metrics.name)}",view="{_escape(metrics.view)}",method="{metrics.method}"'
+            lines.append(f"{prefix}_requests_in_flight{{{labels}}} {metrics.in_flight}")
+            lines.append(f"{prefix}_exceptions_total{{{labels}}} {metrics.exceptions}")
+            cumulative = 0
+            for bound, count in zip((*metrics.bounds, "+Inf"), metrics.buckets):
+                cumulative += count
+                lines.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+            lines.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {metrics.latency_sum}")
+            lines.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {metrics.calls}")
+            if metrics.limiter is not None:
+                lines.append(f"{prefix}_requests_queued{{{labels}}} {metrics.limiter.queued}")
+                lines.append(f"{prefix}_requests_rejected_total{{{labels}}} {metrics.limiter.rejected}")
+        return "\n".join(lines) + "\n"
+
+
+def add_metrics_route(
+    router: FastAPI | APIRouter,
+    path: str = "/metrics",
+    *,
+    registry: MetricsRegistry = default_registry,
+    exporter: Exporter | None = None,
+) -> None:
+    """Expose `registry` on `path`, rendered by `exporter` (Prometheus by default)."""
+    _exporter = exporter or PrometheusExporter()
+
+    async def metrics() -> Response:
+        return _exporter.response(registry)
+
+    router.add_api_route(path, metrics, methods=["GET"], include_in_schema=False)
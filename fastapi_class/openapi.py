@@ -2,12 +2,17 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Any, NoReturn
 
-from fastapi import HTTPException, status
+from fastapi import FastAPI, HTTPException, Request, status
+from fastapi.responses import JSONResponse, Response
 from pydantic import BaseModel, Field
 
 logger = logging.getLogger("fastapi_class")
 
+INTERNED_RESPONSES_SIZE = 1024
+
 
 class ExceptionModel(BaseModel):
     """Exception model."""
@@ -15,11 +20,28 @@ class ExceptionModel(BaseModel):
     detail: str = Field(..., description="Exception details.")
 
 
+class FrozenDict(dict):
+    """Read-only `dict`, shared between routes without risk of one of them mutating it."""
+
+    def _readonly(self, *_: Any, **__: Any) -> NoReturn:
+        raise TypeError(f"{self.__class__.__name__} is read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore
+
+    def __reduce__(self):
+        return self.__class__, (dict(self),)
+
+
 def _exceptions_to_responses(
     exceptions: Iterable[HTTPException | Callable[..., HTTPException]],
 ):
     """Convert exceptions to responses.
 
+    Results are interned: the same group of exceptions maps to the same read-only mapping, so routes sharing an
+    exception group (e.g. `EXCEPTIONS["common"]`) share one object and factories are called only once. The last
+    `INTERNED_RESPONSES_SIZE` groups are kept.
+
     ### example
     >>> from fastapi import HTTPException, status
     >>> from fastapi_class import _exceptions_to_responses
@@ -29,7 +51,20 @@ def _exceptions_to_responses(
 
     `{400: {'description': 'Bad request', 'model': <class 'fastapi_class.exceptions.ExceptionModel'>}}`
     """
-    mapping = {}
+    exceptions = tuple(exceptions)
+    try:
+        return _interned_responses(exceptions)
+    except TypeError:
+        return _build_responses(exceptions)
+
+
+@lru_cache(maxsize=INTERNED_RESPONSES_SIZE)
+def _interned_responses(exceptions: tuple[Any, ...]) -> FrozenDict:
+    return _build_responses(exceptions)
+
+
+def _build_responses(exceptions: tuple[Any, ...]) -> FrozenDict:
+    mapping: dict[int, dict[str, Any]] = {}
 
     for exception in exceptions:
         try:
@@ -37,7 +72,8 @@ def _exceptions_to_responses(
         except TypeError:
             logger.warning(
                 "Exception %s was failed to be parsed. Make sure it's either an HTTPException instance or it's a "
-                "factory function with arguments having default values."
+                "factory function with arguments having default values.",
+                exception,
             )
             exc = HTTPException(status.HTTP_400_BAD_REQUEST, detail=str(exception))
         if exc.status_code not in mapping:
@@ -45,7 +81,42 @@ def _exceptions_to_responses(
                 "description": exc.detail,
                 "model": ExceptionModel,
             }
+            if exc.headers:
+                mapping[exc.status_code]["headers"] = {header: {"schema": {"type": "string"}} for header in exc.headers}
         else:
-            mapping[exc.status_code]["description"] += f" or {exc.detail}"  # type: ignore
+            mapping[exc.status_code]["description"] += f" or {exc.detail}"
+
+    return FrozenDict((status_code, FrozenDict(response)) for status_code, response in mapping.items())
+
+
+def cache_openapi(app: FastAPI) -> None:
+    """Serve the OpenAPI schema of `app` from a response encoded once.
+
+    FastAPI caches the schema but encodes it to JSON on every request to `app.openapi_url`. The replacement route
+    re-encodes only when `app.openapi()` returns a new schema, e.g. after `app.openapi_schema = None`, and wraps the
+    encoded body in a new response for every request.
+
+    ### Example:
+        >>> from fastapi import FastAPI
+        >>> from fastapi_class.openapi import cache_openapi
+        >>> app = FastAPI()
+        >>> cache_openapi(app)
+    """
+    openapi_url = app.openapi_url
+    if not openapi_url:
+        raise ValueError("The application doesn't serve an OpenAPI schema")
+    app.router.routes[:] = [route for route in app.router.routes if getattr(route, "path", None) != openapi_url]
+    server_urls = {server["url"] for server in app.servers if server.get("url")}
+    cached: list[Any] = [None, None]
+
+    async def openapi(request: Request) -> Response:
+        root_path = request.scope.get("root_path", "").rstrip("/")
+        if root_path and root_path not in server_urls and app.root_path_in_servers:
+            app.servers.insert(0, {"url": root_path})
+            server_urls.add(root_path)
+        schema = app.openapi()
+        if schema is not cached[0]:
+            cached[:] = [schema, JSONResponse(schema).body]
+        return Response(cached[1], media_type=JSONResponse.media_type)
 
-    return mapping
+    app.add_route(openapi_url, openapi, include_in_schema=False)
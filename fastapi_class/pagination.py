@@ -0,0 +1,203 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import hmac
+import inspect
+import json
+import secrets
+import time
+from collections.abc import AsyncIterator, Awaitable, Callable, Sequence
+from typing import Annotated, Any, Generic, Optional, TypeVar, Union, get_args, get_origin
+
+from fastapi import HTTPException, Query, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from starlette.concurrency import run_in_threadpool
+
+T = TypeVar("T")
+Estimate = Callable[[], Union[Awaitable[Optional[int]], Optional[int]]]
+
+
+def _invalid_cursor() -> HTTPException:
+    return HTTPException(status.HTTP_400_BAD_REQUEST, "Invalid cursor.")
+
+
+PAGINATION_EXCEPTIONS = (_invalid_cursor,)
+
+
+class Page(BaseModel, Generic[T]):
+    """A page of items and the cursor of the next one, `None` on the last page."""
+
+    items: list[T]
+    next_cursor: Optional[str] = None
+    total_estimate: Optional[int] = None
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class CursorSigner:
+    """Encode keyset positions as opaque cursors, signed with HMAC-SHA256 so clients can't forge them.
+
+    Positions are JSON-encoded: datetimes, UUIDs and the like come back as strings.
+    """
+
+    def __init__(self, secret: str | bytes) -> None:
+        self._secret = secret.encode("utf-8") if isinstance(secret, str) else secret
+
+    def encode(self, position: Sequence[Any]) -> str:
+        payload = json.dumps(jsonable_encoder(list(position)), separators=(",", ":")).encode("utf-8")
+        return f"{_b64encode(payload)}.{_b64encode(self._signature(payload))}"
+
+    def decode(self, cursor: str) -> tuple[Any, ...]:
+        """Return the position of `cursor`, or raise a 400 `HTTPException` when it's malformed or forged."""
+        try:
+            payload, signature = (_b64decode(part) for part in cursor.split("."))
+            if not hmac.compare_digest(signature, self._signature(payload)):
+                raise ValueError(cursor)
+            return tuple(json.loads(payload))
+        except ValueError:
+            raise _invalid_cursor() from None
+
+    def _signature(self, payload: bytes) -> bytes:
+        return hmac.new(self._secret, payload, hashlib.sha256).digest()[:16]
+
+
+class PageRequest:
+    """Page asked for by a client: the keyset position to start `after` and the number of items, `limit`.
+
+    Fetch `fetch_size` rows (one more than `limit`, telling whether there's a next page) after `after`, ordered by
+    the key of the paginator, and turn them into a `Page` with `page()`.
+    """
+
+    __slots__ = ("paginator", "after", "limit", "total_estimate")
+
+    def __init__(
+        self,
+        paginator: Paginator,
+        after: tuple[Any, ...] | None,
+        limit: int,
+        total_estimate: int | None = None,
+    ) -> None:
+        self.paginator = paginator
+        self.after = after
+        self.limit = limit
+        self.total_estimate = total_estimate
+
+    @property
+    def fetch_size(self) -> int:
+        return self.limit + 1
+
+    def page(self, rows: Sequence[T]) -> Page[T]:
+        items = list(rows[: self.limit])
+        next_cursor = None
+        if len(rows) > self.limit:
+            next_cursor = self.paginator.signer.encode(self.paginator.key(items[-1]))
+        return Page(items=items, next_cursor=next_cursor, total_estimate=self.total_estimate)
+
+    async def walk(self, fetch: Callable[[PageRequest], Awaitable[Sequence[T]] | Sequence[T]]) -> AsyncIterator[T]:
+        """Yield the items of this page and of the following ones, fetching each page only once the previous one
+        was consumed. Sync `fetch` functions run in the threadpool, and may return an awaitable.
+        """
+        request = self
+        while True:
+            if inspect.iscoroutinefunction(fetch):
+                rows = await fetch(request)
+            else:
+                rows = await run_in_threadpool(fetch, request)
+                if inspect.isawaitable(rows):
+                    rows = await rows
+            items = rows[: request.limit]
+            for item in items:
+                yield item
+            if len(rows) <= request.limit:
+                return
+            request = PageRequest(self.paginator, tuple(self.paginator.key(items[-1])), request.limit)
+
+
+class Paginator:
+    """Keyset pagination dependency, parsing the `cursor` and `limit` query parameters into a `PageRequest`.
+
+    `key` returns the position of an item, the values the rows are ordered by (e.g. `(created_at, id)`), which the
+    next page starts after. `limit` defaults to `default_limit` and can't exceed `max_limit`. Cursors are signed
+    with `secret`, random per process by default, so set it when several processes serve the same clients.
+    `estimate` returns an approximate number of items, e.g. from the planner statistics instead of `COUNT(*)`,
+    computed at most every `estimate_ttl` seconds and returned with first pages.
+
+    Methods taking a `PageRequest` get `Page[response_model]` as response model.
+
+    ### Example:
+        >>> items = Paginator(lambda item: (item.created_at, item.id), max_limit=100)
+        >>> @View(app)
+        ... class ItemView:
+        ...     response_model = {"get": Item}
+        ...     async def get(self, page: PageRequest = Depends(items)):
+        ...         return page.page(await repository.list(after=page.after, limit=page.fetch_size))
+    """
+
+    def __init__(
+        self,
+        key: Callable[[Any], Sequence[Any]],
+        *,
+        default_limit: int = 50,
+        max_limit: int = 200,
+        secret: str | bytes | None = None,
+        estimate: Estimate | None = None,
+        estimate_ttl: float = 60.0,
+    ) -> None:
+        self.key = key
+        self.default_limit = default_limit
+        self.max_limit = max_limit
+        self.signer = CursorSigner(secret if secret is not None else secrets.token_bytes(32))
+        self.estimate = estimate
+        self.estimate_ttl = estimate_ttl
+        self._estimated: tuple[float, int | None] | None = None
+        self.__signature__ = inspect.Signature(
+            [
+                inspect.Parameter(
+                    "cursor",
+                    inspect.Parameter.KEYWORD_ONLY,
+                    default=Query(None, description="Cursor of the page, from `next_cursor`."),
+                    annotation=Optional[str],
+                ),
+                inspect.Parameter(
+                    "limit",
+                    inspect.Parameter.KEYWORD_ONLY,
+                    default=Query(default_limit, ge=1, le=max_limit, description="Number of items of the page."),
+                    annotation=int,
+                ),
+            ]
+        )
+
+    async def __call__(self, *, cursor: str | None = None, limit: int | None = None) -> PageRequest:
+        after = self.signer.decode(cursor) if cursor else None
+        total_estimate = await self._estimate() if after is None else None
+        return PageRequest(self, after, min(limit or self.default_limit, self.max_limit), total_estimate)
+
+    async def _estimate(self) -> int | None:
+        if self.estimate is None:
+            return None
+        if self._estimated is None or self._estimated[0] < time.monotonic():
+            if inspect.iscoroutinefunction(self.estimate):
+                value = await self.estimate()
+            else:
+                value = await run_in_threadpool(self.estimate)
+            self._estimated = (time.monotonic() + self.estimate_ttl, value)  # type: ignore[assignment]
+        return self._estimated[1]
+
+
+def page_request_parameter(signature: inspect.Signature) -> str | None:
+    """Name of the `PageRequest` parameter of a view method, if it's paginated."""
+    for parameter in signature.parameters.values():
+        annotation = parameter.annotation
+        if get_origin(annotation) is Annotated:
+            annotation = get_args(annotation)[0]
+        if annotation is PageRequest:
+            return parameter.name
+    return None
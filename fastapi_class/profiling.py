@@ -0,0 +1,288 @@
+from __future__ import annotations
+
+import heapq
+import inspect
+import itertools
+import random
+import sys
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator, Sequence
+from contextvars import ContextVar
+from time import perf_counter
+from types import CodeType, FrameType
+from typing import Any, Literal
+
+from fastapi import APIRouter, FastAPI, Request, params
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
+
+from fastapi_class.route import Handler
+from fastapi_class.signature import copy_signature, typed_signature
+
+_current_sample: ContextVar[Sample | None] = ContextVar("fastapi_class_profile_sample", default=None)
+
+
+class Sample:
+    """Profile of one sampled request.
+
+    `phases` splits its duration into dependency resolution (including request parsing), the view method itself and
+    the serialization of its result. `stacks` counts the collapsed call stacks of the method seen by the sampler.
+    """
+
+    __slots__ = ("started_at", "duration", "status_code", "handler_started", "handler_ended", "stacks")
+
+    def __init__(self) -> None:
+        self.started_at = time.time()
+        self.duration = 0.0
+        self.status_code: int | None = None
+        self.handler_started: float | None = None
+        self.handler_ended: float | None = None
+        self.stacks: Counter[str] = Counter()
+
+    def phases(self, start: float) -> dict[str, float]:
+        if self.handler_started is None or self.handler_ended is None:
+            return {"dependencies": self.duration, "handler": 0.0, "serialization": 0.0}
+        return {
+            "dependencies": self.handler_started - start,
+            "handler": self.handler_ended - self.handler_started,
+            "serialization": start + self.duration - self.handler_ended,
+        }
+
+
+class StackSampler:
+    """Background thread sampling the call stacks of the view methods being profiled, every `interval` seconds.
+
+    The thread only wakes up while a sampled request runs its method. A stack is recorded when it goes through the
+    method's code, so concurrent coroutines sharing the event loop thread aren't attributed to it.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._active: dict[int, tuple[int, CodeType, Sample]] = {}
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self, sample: Sample, code: CodeType) -> None:
+        with self._lock:
+            self._active[id(sample)] = (threading.get_ident(), code, sample)
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="fastapi_class-profiler", daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def stop(self, sample: Sample) -> None:
+        with self._lock:
+            self._active.pop(id(sample), None)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._active:
+                    self._wakeup.clear()
+            self._wakeup.wait()
+            frames = sys._current_frames()
+            with self._lock:
+                for thread_id, code, sample in self._active.values():
+                    stack = _collapsed_stack(frames.get(thread_id), code)
+                    if stack is not None:
+                        sample.stacks[stack] += 1
+            time.sleep(self.interval)
+
+
+def _collapsed_stack(frame: FrameType | None, code: CodeType) -> str | None:
+    names: list[str] = []
+    while frame is not None:
+        names.append(getattr(frame.f_code, "co_qualname", frame.f_code.co_name))
+        if frame.f_code is code:
+            return ";".join(reversed(names))
+        frame = frame.f_back
+    return None
+
+
+class EndpointProfile:
+    """Sampled requests of a single view method, keeping the `keep` slowest ones."""
+
+    __slots__ = ("name", "view", "method", "rate", "keep", "sampled", "_slowest", "_counter")
+
+    def __init__(self, name: str, view: str, method: str, rate: float, keep: int) -> None:
+        self.name = name
+        self.view = view
+        self.method = method
+        self.rate = rate
+        self.keep = keep
+        self.sampled = 0
+        self._slowest: list[tuple[float, int, dict[str, Any]]] = []
+        self._counter = itertools.count()
+
+    def samples(self) -> list[dict[str, Any]]:
+        """The slowest samples, slowest first."""
+        return [sample for _, _, sample in sorted(self._slowest, reverse=True)]
+
+    def record(self, sample: Sample, start: float) -> None:
+        self.sampled += 1
+        entry = (
+            sample.duration,
+            next(self._counter),
+            {
+                "started_at": sample.started_at,
+                "duration": sample.duration,
+                "status_code": sample.status_code,
+                "phases": sample.phases(start),
+                "stacks": dict(sample.stacks),
+            },
+        )
+        if len(self._slowest) < self.keep:
+            heapq.heappush(self._slowest, entry)
+        elif entry[0] > self._slowest[0][0]:
+            heapq.heapreplace(self._slowest, entry)
+
+    def layer(self, handler: Handler) -> Handler:
+        """Wrap a route handler to profile a fraction `rate` of its requests."""
+
+        async def _handler(request: Request) -> Response:
+            if random.random() >= self.rate:
+                return await handler(request)
+            sample = Sample()
+            token = _current_sample.set(sample)
+            start = perf_counter()
+            try:
+                response = await handler(request)
+                sample.status_code = response.status_code
+                return response
+            finally:
+                sample.duration = perf_counter() - start
+                _current_sample.reset(token)
+                self.record(sample, start)
+
+        return _handler
+
+
+class Profiler:
+    """In-process store of `EndpointProfile`, keyed by route name.
+
+    `rate` is the fraction of requests profiled, `keep` the number of slowest samples kept per method and `interval`
+    the period of the stack sampler in seconds.
+
+    ### Example:
+        >>> profiler = Profiler(rate=0.05)
+        >>> @View(app, profile=profiler, profile_path="/_profile")
+        ... class ItemView:
+        ...     async def get(self):
+        ...         ...
+    """
+
+    def __init__(self, rate: float = 0.01, *, keep: int = 20, interval: float = 0.005) -> None:
+        self.rate = rate
+        self.keep = keep
+        self.sampler = StackSampler(interval)
+        self._endpoints: dict[str, EndpointProfile] = {}
+
+    def __iter__(self) -> Iterator[EndpointProfile]:
+        return iter(list(self._endpoints.values()))
+
+    def __getitem__(self, name: str) -> EndpointProfile:
+        return self._endpoints[name]
+
+    def endpoint(self, name: str, view: str, method: str) -> EndpointProfile:
+        """Return the profile of a route, creating it on first use."""
+        profile = self._endpoints.get(name)
+        if profile is None:
+            profile = self._endpoints[name] = EndpointProfile(name, view, method, self.rate, self.keep)
+        return profile
+
+    def to_json(self, view: str | None = None) -> dict[str, Any]:
+        return {
+            profile.name: {
+                "view": profile.view,
+                "method": profile.method,
+                "sampled": profile.sampled,
+                "samples": profile.samples(),
+            }
+            for profile in self
+            if view is None or profile.view == view
+        }
+
+    def to_collapsed(self, view: str | None = None) -> str:
+        """Render the samples as collapsed stacks weighted in microseconds, as consumed by flame graph tools."""
+        weights: Counter[str] = Counter()
+        interval = round(self.sampler.interval * 1_000_000)
+        for profile in self:
+            if view is not None and profile.view != view:
+                continue
+            root = f"{profile.view}.{profile.method}"
+            for sample in profile.samples():
+                stacked = 0
+                for stack, count in sample["stacks"].items():
+                    weights[f"{root};handler;{stack}"] += count * interval
+                    stacked += count * interval
+                for phase, seconds in sample["phases"].items():
+                    weight = round(seconds * 1_000_000) - (stacked if phase == "handler" else 0)
+                    if weight > 0:
+                        weights[f"{root};{phase}"] += weight
+        return "".join(f"{stack} {weight}\n" for stack, weight in sorted(weights.items()))
+
+
+default_profiler = Profiler()
+
+
+def profiled_endpoint(function: Callable[..., Any], sampler: StackSampler) -> Callable[..., Any]:
+    """Build a route endpoint marking the handler phase of sampled requests, keeping `function` sync or async."""
+    signature = typed_signature(function)
+    code = getattr(getattr(function, "__func__", function), "__code__", None)
+
+    def _start() -> Sample | None:
+        sample = _current_sample.get()
+        if sample is not None:
+            sample.handler_started = perf_counter()
+            if code is not None:
+                sampler.start(sample, code)
+        return sample
+
+    def _stop(sample: Sample) -> None:
+        sample.handler_ended = perf_counter()
+        sampler.stop(sample)
+
+    if inspect.iscoroutinefunction(function):
+
+        async def _async_endpoint(**kwargs: Any) -> Any:
+            sample = _start()
+            try:
+                return await function(**kwargs)
+            finally:
+                if sample is not None:
+                    _stop(sample)
+
+        return copy_signature(_async_endpoint, function, signature)
+
+    def _endpoint(**kwargs: Any) -> Any:
+        sample = _start()
+        try:
+            return function(**kwargs)
+        finally:
+            if sample is not None:
+                _stop(sample)
+
+    return copy_signature(_endpoint, function, signature)
+
+
+def add_profile_route(
+    router: FastAPI | APIRouter,
+    path: str = "/_profile",
+    *,
+    profiler: Profiler = default_profiler,
+    view: str | None = None,
+    dependencies: Sequence[params.Depends] | None = None,
+) -> None:
+    """Expose the samples of `profiler` on `path`, limited to the methods of `view` when given.
+
+    `?format=collapsed` returns collapsed stacks instead of JSON. `dependencies` guard the route, e.g. authentication.
+    """
+
+    async def profile(format: Literal["json", "collapsed"] = "json") -> Response:
+        if format == "collapsed":
+            return PlainTextResponse(profiler.to_collapsed(view))
+        return JSONResponse(profiler.to_json(view))
+
+    router.add_api_route(path, profile, methods=["GET"], include_in_schema=False, dependencies=dependencies)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import math
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import Response
+
+from fastapi_class.route import Handler, Layer
+
+PERIODS = {
+    "s": 1.0,
+    "second": 1.0,
+    "m": 60.0,
+    "minute": 60.0,
+    "h": 3600.0,
+    "hour": 3600.0,
+    "d": 86400.0,
+    "day": 86400.0,
+}
+RATE = re.compile(r"^\s*(\d+)\s*/\s*(\d*\.?\d*)\s*(second|minute|hour|day|s|m|h|d)s?\s*$")
+RETRY_AFTER_HEADER = "Retry-After"
+
+
+def _too_many_requests(retry_after: float = 1.0) -> HTTPException:
+    return HTTPException(
+        status.HTTP_429_TOO_MANY_REQUESTS,
+        "Too many requests.",
+        headers={RETRY_AFTER_HEADER: str(max(1, math.ceil(retry_after)))},
+    )
+
+
+RATE_LIMIT_EXCEPTIONS = (_too_many_requests,)
+
+
+def client_key(request: Request) -> str:
+    """Identify the client of a request by its address."""
+    return request.client.host if request.client is not None else "anonymous"
+
+
+class RateLimitBackend(ABC):
+    """Storage of the rate limiter state, one theoretical arrival time per key (GCRA).
+
+    A shared backend, e.g. backed by Redis, lets several processes enforce one limit.
+    """
+
+    @abstractmethod
+    async def hit(self, key: str, interval: float, burst: int) -> float:
+        """Record a request for `key` and return `0` when allowed, or the seconds to wait before retrying.
+
+        Requests are allowed every `interval` seconds on average, with up to `burst` of them at once.
+        """
+        raise NotImplementedError
+
+
+class InMemoryRateLimiter(RateLimitBackend):
+    """Process-local GCRA store, split in `shards` LRU maps holding `max_keys` keys overall.
+
+    Each key costs one float and a check is O(1). Keys whose bucket is full again are idle and evicted as they are
+    met, and the least recently seen keys are dropped when a shard is full, which at worst resets their limit.
+    """
+
+    def __init__(self, *, shards: int = 16, max_keys: int = 65536) -> None:
+        self.max_keys = max_keys
+        self._shard_size = max(1, max_keys // shards)
+        self._shards: tuple[OrderedDict[str, float], ...] = tuple(OrderedDict() for _ in range(shards))
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+    async def hit(self, key: str, interval: float, burst: int) -> float:
+        now = time.monotonic()
+        shard = self._shards[hash(key) % len(self._shards)]
+        arrival = max(shard.get(key, now), now)
+        wait = arrival - now - (burst - 1) * interval
+        if wait > 0:
+            return wait
+        shard[key] = arrival + interval
+        shard.move_to_end(key)
+        for _ in range(2):
+            oldest = next(iter(shard))
+            if oldest == key or (shard[oldest] > now and len(shard) <= self._shard_size):
+                break
+            del shard[oldest]
+        return 0.0
+
+
+default_rate_limiter = InMemoryRateLimiter()
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Rate limiting policy of a view method: `limit` requests every `period` seconds per client.
+
+    Up to `burst` requests (`limit` by default) can be made at once, after which they are spaced evenly. `key`
+    identifies the client of a request, by its address by default. Requests over the limit are rejected with a 429
+    and a `Retry-After` header.
+
+    ### Example:
+        >>> @endpoint("post", path="login", rate_limit="5/minute")
+        ... async def login(self):
+        ...     ...
+        >>> RateLimit(100, 60, burst=10, key=lambda request: request.headers.get("x-api-key", ""))
+    """
+
+    limit: int
+    period: float = 1.0
+    burst: int | None = None
+    key: Callable[[Request], str] = field(default=client_key, compare=False)
+    backend: RateLimitBackend = field(default=default_rate_limiter, compare=False)
+
+    @classmethod
+    def parse(cls, value: RateLimit | str | int | None) -> RateLimit | None:
+        """Accept a `RateLimit`, a rate such as `"100/minute"` or `"10/5s"`, a number of requests per second or `None`."""
+        if value is None or isinstance(value, RateLimit):
+            return value
+        if isinstance(value, int):
+            return cls(value)
+        match = RATE.match(value.lower())
+        if match is None:
+            raise ValueError(f"Invalid rate limit {value!r}, expected e.g. '100/minute'")
+        limit, count, unit = match.groups()
+        return cls(int(limit), float(count or 1) * PERIODS[unit])
+
+    def layer(self, namespace: str) -> Layer:
+        """Return the route layer rejecting the requests over the limit, counted per client under `namespace`."""
+        interval = self.period / self.limit
+        burst = self.burst if self.burst is not None else self.limit
+
+        def _layer(handler: Handler) -> Handler:
+            async def _handler(request: Request) -> Response:
+                wait = await self.backend.hit(f"{namespace}:{self.key(request)}", interval, burst)
+                if wait > 0:
+                    raise _too_many_requests(wait)
+                return await handler(request)
+
+            return _handler
+
+        return _layer
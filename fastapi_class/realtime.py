@@ -0,0 +1,332 @@
+from __future__ import annotations
+
+import asyncio
+import inspect
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import WebSocket, WebSocketDisconnect
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from starlette.concurrency import iterate_in_threadpool
+
+from fastapi_class.signature import copy_signature, typed_signature
+
+HEARTBEAT_FRAME = b": ping\n\n"
+
+
+@dataclass(frozen=True)
+class Realtime:
+    """Connection policy of `websocket` and `sse` view methods.
+
+    Messages go through a send queue of `queue_size` messages per connection. When nothing was sent for `heartbeat`
+    seconds, websocket clients get the `ping` text and event streams a comment line, which keeps proxies from closing
+    idle connections. `heartbeat=None` disables it.
+    """
+
+    heartbeat: float | None = 15.0
+    queue_size: int = 64
+    ping: str = '{"type":"ping"}'
+
+
+DEFAULT_REALTIME = Realtime()
+
+
+class Message:
+    """A message serialized once, whatever the number of clients it is sent to.
+
+    `text` is the JSON payload sent to websockets; `frame` is the server-sent event, built on first use.
+    """
+
+    __slots__ = ("text", "event", "id", "_frame")
+
+    def __init__(self, text: str, *, event: str | None = None, id: str | None = None) -> None:
+        self.text = text
+        self.event = event
+        self.id = id
+        self._frame: bytes | None = None
+
+    @classmethod
+    def encode(cls, data: Any, *, event: str | None = None, id: str | None = None) -> Message:
+        """Serialize `data` to JSON, unless it's already a `Message`."""
+        if isinstance(data, Message):
+            return data
+        return cls(json.dumps(jsonable_encoder(data), separators=(",", ":")), event=event, id=id)
+
+    @property
+    def frame(self) -> bytes:
+        if self._frame is None:
+            lines = [f"event: {self.event}"] if self.event is not None else []
+            if self.id is not None:
+                lines.append(f"id: {self.id}")
+            lines.extend(f"data: {line}" for line in self.text.splitlines() or [""])
+            self._frame = ("\n".join(lines) + "\n\n").encode("utf-8")
+        return self._frame
+
+
+class Subscription:
+    """Bounded queue of the messages published by a `Broadcaster` to one subscriber.
+
+    Iterating it yields messages until it's closed, which discards the pending ones. A subscriber whose queue is full is
+    dropped rather than slowing down the others, and `dropped` is set.
+    """
+
+    def __init__(self, broadcaster: Broadcaster, queue_size: int) -> None:
+        self.broadcaster = broadcaster
+        self.dropped = False
+        self._queue: asyncio.Queue[Message | None] = asyncio.Queue(queue_size)
+        self._closed = False
+
+    def offer(self, message: Message) -> bool:
+        if self._closed:
+            return False
+        try:
+            self._queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped = True
+            self.close()
+            return False
+        return True
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self.broadcaster.unsubscribe(self)
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def __aenter__(self) -> Subscription:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def __aiter__(self) -> AsyncIterator[Message]:
+        return self
+
+    async def __anext__(self) -> Message:
+        message = await self._queue.get()
+        if message is None:
+            raise StopAsyncIteration
+        return message
+
+
+class Broadcaster:
+    """Fan messages out to many subscribers, serializing each of them once.
+
+    Subscribers are `Subscription`s, from `subscribe()`, or `WebSocketConnection`s attached with `attach()`.
+
+    ### Example:
+        >>> news = Broadcaster()
+        >>> @View(app)
+        ... class NewsView:
+        ...     async def sse(self):
+        ...         async with news.subscribe() as subscription:
+        ...             async for message in subscription:
+        ...                 yield message
+        >>> news.publish({"title": "..."})
+    """
+
+    def __init__(self, *, queue_size: int = 64) -> None:
+        self.queue_size = queue_size
+        self._subscribers: dict[Any, None] = {}
+
+    def __len__(self) -> int:
+        return len(self._subscribers)
+
+    def subscribe(self, queue_size: int | None = None) -> Subscription:
+        subscription = Subscription(self, queue_size or self.queue_size)
+        self._subscribers[subscription] = None
+        return subscription
+
+    def attach(self, connection: WebSocketConnection) -> None:
+        self._subscribers[connection] = None
+        connection._broadcasters.append(self)
+
+    def unsubscribe(self, subscriber: Any) -> None:
+        self._subscribers.pop(subscriber, None)
+
+    def publish(self, data: Any, *, event: str | None = None, id: str | None = None) -> int:
+        """Send `data` to every subscriber and return how many got it; slow subscribers are dropped."""
+        message = Message.encode(data, event=event, id=id)
+        delivered = 0
+        for subscriber in list(self._subscribers):
+            if subscriber.offer(message):
+                delivered += 1
+            else:
+                self.unsubscribe(subscriber)
+        return delivered
+
+
+class WebSocketConnection:
+    """Accepted websocket whose outgoing messages go through a bounded queue drained by a background task.
+
+    `send()` waits for room in the queue, while `offer()`, used by `Broadcaster`, drops the connection (closing it with
+    code 1013) when the queue is full.
+    """
+
+    def __init__(self, websocket: WebSocket, realtime: Realtime = DEFAULT_REALTIME) -> None:
+        self.websocket = websocket
+        self.realtime = realtime
+        self.close_code = 1000
+        self._queue: asyncio.Queue[str | None] = asyncio.Queue(realtime.queue_size)
+        self._sender: asyncio.Future[None] | None = None
+        self._broadcasters: list[Broadcaster] = []
+
+    def start(self) -> asyncio.Future[None]:
+        """Start the background task sending the queued messages."""
+        self._sender = asyncio.ensure_future(self._run())
+        return self._sender
+
+    async def send(self, data: Any) -> None:
+        if self._sender is not None and self._sender.done():
+            raise WebSocketDisconnect(1006)
+        await self._queue.put(Message.encode(data).text)
+
+    def offer(self, data: Any) -> bool:
+        try:
+            self._queue.put_nowait(Message.encode(data).text)
+        except asyncio.QueueFull:
+            self.close_code = 1013
+            while not self._queue.empty():
+                self._queue.get_nowait()
+            self._queue.put_nowait(None)
+            return False
+        return True
+
+    async def close(self, code: int = 1000) -> None:
+        """Close the websocket with `code` once the queued messages are sent."""
+        self.close_code = code
+        await self._queue.put(None)
+
+    def detach(self) -> None:
+        """Unsubscribe the connection from the broadcasters it was attached to."""
+        for broadcaster in self._broadcasters:
+            broadcaster.unsubscribe(self)
+        self._broadcasters.clear()
+
+    async def receive_text(self) -> str:
+        return await self.websocket.receive_text()
+
+    async def receive_bytes(self) -> bytes:
+        return await self.websocket.receive_bytes()
+
+    async def receive_json(self) -> Any:
+        return await self.websocket.receive_json()
+
+    def __aiter__(self) -> AsyncIterator[str]:
+        return self.websocket.iter_text()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                text = await asyncio.wait_for(self._queue.get(), self.realtime.heartbeat)
+            except asyncio.TimeoutError:
+                text = self.realtime.ping
+            if text is None:
+                await self.websocket.close(self.close_code)
+                return
+            await self.websocket.send_text(text)
+
+
+def _connection_parameter(signature: inspect.Signature) -> str | None:
+    for parameter in signature.parameters.values():
+        if parameter.annotation is WebSocketConnection:
+            return parameter.name
+    return None
+
+
+def websocket_endpoint(function: Callable[..., Any], realtime: Realtime = DEFAULT_REALTIME) -> Callable[..., Any]:
+    """Build the endpoint of a `websocket` view method.
+
+    A method taking a `WebSocketConnection` gets the websocket accepted and wrapped, with its send queue and
+    heartbeat; the connection is closed once the method returns, and its sender stopped and broadcasters left however
+    the method ends. Methods taking a plain `WebSocket` are left as is.
+    """
+    signature = typed_signature(function)
+    name = _connection_parameter(signature)
+    if name is None:
+        return function
+
+    async def _endpoint(**kwargs: Any) -> None:
+        websocket: WebSocket = kwargs[name]
+        await websocket.accept()
+        connection = kwargs[name] = WebSocketConnection(websocket, realtime)
+        sender = connection.start()
+        try:
+            await function(**kwargs)
+            if not sender.done():
+                await connection.close()
+            await asyncio.wait((sender,))
+        except WebSocketDisconnect:
+            pass
+        finally:
+            connection.detach()
+            sender.cancel()
+            await asyncio.wait((sender,))
+            if not sender.cancelled():
+                sender.exception()  # a disconnection of the client, retrieved so it isn't logged
+
+    parameters = [
+        parameter.replace(annotation=WebSocket) if parameter.name == name else parameter
+        for parameter in signature.parameters.values()
+    ]
+    return copy_signature(_endpoint, function, signature.replace(parameters=parameters))
+
+
+class EventStreamResponse(StreamingResponse):
+    """Server-sent events."""
+
+    media_type = "text/event-stream"
+
+    def __init__(self, content: Any, **kwargs: Any) -> None:
+        super().__init__(content, **kwargs)
+        self.headers.setdefault("cache-control", "no-cache")
+        self.headers.setdefault("x-accel-buffering", "no")
+
+
+async def _event_frames(items: AsyncIterable[Any] | Iterable[Any], realtime: Realtime) -> AsyncIterator[bytes]:
+    iterator = items if isinstance(items, AsyncIterable) else iterate_in_threadpool(iter(items))
+    queue: asyncio.Queue[bytes | None] = asyncio.Queue(realtime.queue_size)
+
+    async def _produce() -> None:
+        # No sentinel once cancelled: the stream is closed and waiting for room in a full queue would never end.
+        try:
+            async for item in iterator:
+                await queue.put(Message.encode(item).frame)
+        except Exception:
+            await queue.put(None)
+            raise
+        await queue.put(None)
+
+    producer = asyncio.ensure_future(_produce())
+    try:
+        while True:
+            try:
+                frame = await asyncio.wait_for(queue.get(), realtime.heartbeat)
+            except asyncio.TimeoutError:
+                yield HEARTBEAT_FRAME
+                continue
+            if frame is None:
+                break
+            yield frame
+        await producer
+    finally:
+        producer.cancel()
+
+
+def event_stream_endpoint(function: Callable[..., Any], realtime: Realtime = DEFAULT_REALTIME) -> Callable[..., Any]:
+    """Build the endpoint of an `sse` view method, a generator whose items are sent as server-sent events.
+
+    Items are JSON-encoded unless they are `Message`s, which are sent as they are.
+    """
+    signature = typed_signature(function)
+
+    async def _endpoint(**kwargs: Any) -> EventStreamResponse:
+        return EventStreamResponse(_event_frames(function(**kwargs), realtime))
+
+    return copy_signature(_endpoint, function, signature)
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import os
+from collections.abc import Callable
+from typing import Any
+
+from fastapi import APIRouter, FastAPI
+
+from fastapi_class.snapshot import RouteTable
+
+
+class ViewRegistry:
+    """Collects views at decoration time and registers their routes in one pass.
+
+    Decorating a class with `View(router, registry=registry)` only records it; introspecting the class and building
+    the FastAPI routes (signature analysis, pydantic models) is deferred until `register()` or `include_router()`.
+    Note that `include_router` builds every route a second time on the including app, so registering views straight
+    on the app is cheapest.
+
+    ### Example:
+        >>> from fastapi import APIRouter, FastAPI
+        >>> from fastapi_class import View, ViewRegistry
+
+        >>> registry = ViewRegistry()
+        >>> router = APIRouter()
+        >>> @View(router, registry=registry)
+        ... class MyView:
+        ...     async def get(self):
+        ...         return {"message": "Hello, world!"}
+        >>> app = FastAPI()
+        >>> registry.include_router(app, router)
+    """
+
+    def __init__(self) -> None:
+        self._pending: list[Callable[..., None]] = []
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def add(self, register: Callable[..., None]) -> None:
+        """Record a pending view registration."""
+        self._pending.append(register)
+
+    def register(self, *, openapi: bool = True) -> int:
+        """Register every pending view and return how many were registered.
+
+        `openapi=False` leaves out the metadata only used by the OpenAPI schema, see `register_snapshot()`.
+        """
+        pending, self._pending = self._pending, []
+        for register in pending:
+            if openapi:
+                register()
+            else:
+                register(openapi=False)
+        return len(pending)
+
+    def register_snapshot(self, app: FastAPI, path: str | os.PathLike[str], *, source_hash: str) -> bool:
+        """Register pending views on `app` using the route table saved at `path`, or save it there.
+
+        When the table matches `source_hash` and the routes of the views, they are registered without their
+        OpenAPI-only metadata and the schema of `app` is loaded from the table, so it isn't generated on the first
+        request. Otherwise views are registered normally, replacing the routes checked against the table, and the
+        table is saved for the next startup. Returns whether the saved table was used.
+
+        ### Example:
+            >>> registry.register_snapshot(app, "routes.json.gz", source_hash=source_hash(views))
+        """
+        table = RouteTable.load(path, source_hash)
+        if table is not None:
+            pending, routes = list(self._pending), list(app.router.routes)
+            self.register(openapi=False)
+            if table.matches(app):
+                table.restore(app)
+                return True
+            app.router.routes[:] = routes
+            self._pending = pending
+        self.register()
+        RouteTable.capture(app, source_hash).dump(path)
+        return False
+
+    def include_router(self, app: FastAPI | APIRouter, router: APIRouter, **kwargs: Any) -> None:
+        """Register pending views, then include `router` into `app`."""
+        self.register()
+        app.include_router(router, **kwargs)
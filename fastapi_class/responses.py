@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import inspect
+import json
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from fastapi import params
+from fastapi.dependencies.utils import get_dependant, get_parameterless_sub_dependant
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from fastapi_class.signature import copy_signature, typed_signature
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore
+
+
+class ModelJSONResponse(JSONResponse):
+    """JSON response encoding pydantic models with their compiled serializer.
+
+    Other content is encoded with `orjson` when it's installed, and the standard library otherwise.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return content.model_dump_json(by_alias=True).encode("utf-8")
+        if orjson is not None:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode(
+            "utf-8"
+        )
+
+
+def _declares_response(function: Callable[..., Any], dependencies: Iterable[params.Depends]) -> bool:
+    """Whether `function`, its route `dependencies` or any of their sub-dependencies take a `Response` parameter."""
+    dependants = [
+        get_dependant(path="", call=function),
+        *(get_parameterless_sub_dependant(depends=depends, path="") for depends in dependencies),
+    ]
+    while dependants:
+        dependant = dependants.pop()
+        if dependant.response_param_name is not None:
+            return True
+        dependants.extend(dependant.dependencies)
+    return False
+
+
+def model_response_endpoint(
+    function: Callable[..., Any],
+    response_class: type[ModelJSONResponse],
+    response_model: Any | None,
+    status_code: int | None,
+    dependencies: Iterable[params.Depends] = (),
+) -> Callable[..., Any]:
+    """Build a route endpoint wrapping the models returned by `function` straight into `response_class`.
+
+    FastAPI would validate the returned model against the response model, convert it to a `dict` and encode that.
+    When the returned value is an instance of exactly the response model (or any model, without a response model)
+    those steps are no-ops, so the endpoint returns the response itself. Endpoints taking a `Response` parameter,
+    directly or through one of their dependencies or the route `dependencies`, are returned unchanged, as FastAPI
+    only applies its headers to responses it builds.
+    """
+    if _declares_response(function, dependencies):
+        return function
+    signature = typed_signature(function)
+
+    def _response(result: Any) -> Any:
+        if isinstance(result, BaseModel) and (response_model is None or type(result) is response_model):
+            return response_class(result, status_code=status_code or 200)
+        return result
+
+    if inspect.iscoroutinefunction(function):
+
+        async def _endpoint(**kwargs: Any) -> Any:
+            return _response(await function(**kwargs))
+
+    else:
+
+        def _endpoint(**kwargs: Any) -> Any:  # type: ignore[misc]
+            return _response(function(**kwargs))
+
+    return copy_signature(_endpoint, function, signature)
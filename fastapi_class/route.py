@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Awaitable, Callable, Sequence
+from contextvars import ContextVar
+from typing import Any, ClassVar
+
+from fastapi import Request
+from fastapi.responses import Response
+from fastapi.routing import APIRoute
+
+from fastapi_class.signature import copy_signature, typed_signature
+
+Handler = Callable[[Request], Awaitable[Response]]
+Layer = Callable[[Handler], Handler]
+
+_replayed_response: ContextVar[Response | None] = ContextVar("fastapi_class_replayed_response", default=None)
+
+
+class ViewRoute(APIRoute):
+    """`APIRoute` whose request handler is wrapped by `layers`, the first one being the outermost.
+
+    A layer sees the `Request` before FastAPI resolves dependencies and the serialized `Response` afterwards, so it
+    can time, short-circuit or rewrite the whole request. Layers are class attributes so they survive
+    `include_router`, which rebuilds routes from `type(route)`.
+    """
+
+    layers: ClassVar[tuple[Layer, ...]] = ()
+
+    def get_route_handler(self) -> Handler:  # type: ignore[override]
+        handler: Handler = super().get_route_handler()
+        for layer in reversed(self.layers):
+            handler = layer(handler)
+        return handler
+
+
+def route_class(layers: Sequence[Layer]) -> type[APIRoute] | None:
+    """Return a `ViewRoute` subclass applying `layers`, or `None` when there is nothing to apply."""
+    if not layers:
+        return None
+    return type(ViewRoute.__name__, (ViewRoute,), {"layers": tuple(layers)})
+
+
+async def replay(handler: Handler, request: Request, response: Response) -> Response:
+    """Run `handler`, so the route still resolves its dependencies (e.g. authentication), but answer with `response`
+    instead of calling the view method, which has to be wrapped by `replayable_endpoint()`.
+
+    Layers serving a stored or shared response use it rather than returning the response before the dependencies run.
+    """
+    token = _replayed_response.set(response)
+    try:
+        return await handler(request)
+    finally:
+        _replayed_response.reset(token)
+
+
+def replaying() -> bool:
+    """Whether the current request is answered by `replay()`, which the inner layers can let through."""
+    return _replayed_response.get() is not None
+
+
+def replayable_endpoint(function: Callable[..., Any]) -> Callable[..., Any]:
+    """Build a route endpoint returning the response given to `replay()`, or calling `function` (kept sync or async)."""
+    signature = typed_signature(function)
+
+    if inspect.iscoroutinefunction(function):
+
+        async def _async_endpoint(**kwargs: Any) -> Any:
+            response = _replayed_response.get()
+            return response if response is not None else await function(**kwargs)
+
+        return copy_signature(_async_endpoint, function, signature)
+
+    def _endpoint(**kwargs: Any) -> Any:
+        response = _replayed_response.get()
+        return response if response is not None else function(**kwargs)
+
+    return copy_signature(_endpoint, function, signature)
@@ -1,14 +1,22 @@
 from __future__ import annotations
 
 from collections.abc import Callable, Iterable
-from dataclasses import dataclass
+from dataclasses import FrozenInstanceError
 from enum import Enum
-from functools import wraps
-from typing import Any, ClassVar
+from typing import Any, Literal
+from weakref import WeakValueDictionary
 
 from fastapi.responses import Response
 from pydantic import BaseModel
 
+from fastapi_class.cache import Cache
+from fastapi_class.coalesce import Coalesce
+from fastapi_class.compression import Compress
+from fastapi_class.conditional import ETag, Version
+from fastapi_class.executors import PROCESS_EXECUTOR
+from fastapi_class.ratelimit import RateLimit
+from fastapi_class.realtime import Realtime
+
 
 class Method(str, Enum):
     """HTTP methods."""
@@ -20,26 +28,163 @@ class Method(str, Enum):
     PUT = "put"
 
 
-@dataclass(frozen=True, init=True, repr=True)
+class Channel(str, Enum):
+    """Realtime methods, served by a websocket route or as server-sent events."""
+
+    WEBSOCKET = "websocket"
+    SSE = "sse"
+
+
+METADATA_FIELDS = (
+    "methods",
+    "name",
+    "path",
+    "status_code",
+    "response_model",
+    "response_class",
+    "cache",
+    "coalesce",
+    "max_concurrency",
+    "queue_limit",
+    "queue_timeout",
+    "executor",
+    "etag",
+    "compress",
+    "realtime",
+    "rate_limit",
+    "timeout",
+)
+_interned: WeakValueDictionary[tuple[Any, ...], Metadata] = WeakValueDictionary()
+
+
 class Metadata:
-    """Metadata class, used to store endpoint metadata."""
-
-    methods: Iterable[str | Method]
-    name: str | None = None
-    path: str | None = None
-    status_code: int | None = None
-    response_model: type[BaseModel] | None = None
-    response_class: type[Response] | None = None
-    __default_method_suffix: ClassVar[str] = "_or_default"
-
-    def __getattr__(self, __name: str, /) -> Any | Callable[[Any], Any]:
-        """Dynamically return the value of the attribute."""
-        if __name.endswith(Metadata.__default_method_suffix):
-            prefix = __name.replace(Metadata.__default_method_suffix, "")
-            if hasattr(self, prefix):
-                return lambda _default: getattr(self, prefix, None) or _default
-            return getattr(self, prefix)
-        raise AttributeError(f"{self.__class__.__name__} has no attribute {__name}")
+    """Metadata class, used to store endpoint metadata.
+
+    Instances are immutable and hashable: `methods` is a frozenset and the hash is computed once, so metadata can
+    key registries and caches. `None` means a field is unset, which `resolve()` and `merge()` fill from defaults.
+
+    ### Example:
+        >>> metadata = Metadata(["get"], path="items")
+        >>> metadata.resolve("status_code", 200)
+        200
+        >>> metadata.merge(status_code=201).status_code
+        201
+    """
+
+    __slots__ = (*METADATA_FIELDS, "_values", "_hash", "__weakref__")
+
+    methods: frozenset[str | Method]
+    name: str | None
+    path: str | None
+    status_code: int | None
+    response_model: type[BaseModel] | None
+    response_class: type[Response] | None
+    cache: Cache | None
+    coalesce: Coalesce | None
+    max_concurrency: int | None
+    queue_limit: int | None
+    queue_timeout: float | None
+    executor: str | None
+    etag: ETag | None
+    compress: Compress | Literal[False] | None
+    realtime: Realtime | None
+    rate_limit: RateLimit | None
+    timeout: float | None
+    _values: tuple[Any, ...]
+    _hash: int
+
+    def __init__(
+        self,
+        methods: Iterable[str | Method],
+        name: str | None = None,
+        path: str | None = None,
+        status_code: int | None = None,
+        response_model: type[BaseModel] | None = None,
+        response_class: type[Response] | None = None,
+        cache: Cache | None = None,
+        coalesce: Coalesce | None = None,
+        max_concurrency: int | None = None,
+        queue_limit: int | None = None,
+        queue_timeout: float | None = None,
+        executor: str | None = None,
+        etag: ETag | None = None,
+        compress: Compress | Literal[False] | None = None,
+        realtime: Realtime | None = None,
+        rate_limit: RateLimit | None = None,
+        timeout: float | None = None,
+    ) -> None:
+        values = (
+            frozenset(methods),
+            name,
+            path,
+            status_code,
+            response_model,
+            response_class,
+            cache,
+            coalesce,
+            max_concurrency,
+            queue_limit,
+            queue_timeout,
+            executor,
+            etag,
+            compress,
+            realtime,
+            rate_limit,
+            timeout,
+        )
+        for field, value in zip(METADATA_FIELDS, values):
+            object.__setattr__(self, field, value)
+        object.__setattr__(self, "_values", values)
+        object.__setattr__(self, "_hash", hash(values))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise FrozenInstanceError(f"cannot assign to field {name!r}")
+
+    def __delattr__(self, name: str) -> None:
+        raise FrozenInstanceError(f"cannot delete field {name!r}")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Metadata):
+            return NotImplemented
+        return self._values == other._values
+
+    def __hash__(self) -> int:
+        return self._hash
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{field}={getattr(self, field)!r}" for field in METADATA_FIELDS)
+        return f"{self.__class__.__name__}({fields})"
+
+    def __reduce__(self) -> tuple[type[Metadata], tuple[Any, ...]]:
+        return self.__class__, self._values
+
+    def resolve(self, field: str, default: Any = None) -> Any:
+        """Return the value of `field`, or `default` when it is unset."""
+        value = getattr(self, field)
+        return default if value is None else value
+
+    def replace(self, **changes: Any) -> Metadata:
+        """Return a copy of the metadata with `changes` applied."""
+        return self.__class__(**{field: changes.get(field, getattr(self, field)) for field in METADATA_FIELDS})
+
+    def merge(self, defaults: Metadata | None = None, /, **fields: Any) -> Metadata:
+        """Return the metadata with its unset fields taken from `defaults` and `fields`, the latter taking precedence.
+
+        Fields of `self` always win, so class-level or view-level defaults never override what an endpoint sets.
+        """
+        changes = {field: getattr(defaults, field) for field in METADATA_FIELDS[1:]} if defaults is not None else {}
+        changes.update(fields)
+        changes = {
+            field: value for field, value in changes.items() if value is not None and getattr(self, field) is None
+        }
+        return self.replace(**changes) if changes else self
+
+    def intern(self) -> Metadata:
+        """Return the canonical instance equal to this metadata, so equal metadata are shared.
+
+        Canonical instances are keyed by their field values, which don't reference them, so they are freed once unused.
+        """
+        return _interned.setdefault(self._values, self)
 
 
 def endpoint(
@@ -50,9 +195,36 @@ def endpoint(
     status_code: int | None = None,
     response_model: type[BaseModel] | None = None,
     response_class: type[Response] | None = None,
+    cache: Cache | float | None = None,
+    coalesce: Coalesce | bool | None = None,
+    max_concurrency: int | None = None,
+    queue_limit: int | None = None,
+    queue_timeout: float | None = None,
+    executor: str | None = None,
+    etag: ETag | bool | Version | None = None,
+    compress: Compress | bool | int | None = None,
+    realtime: Realtime | None = None,
+    rate_limit: RateLimit | str | int | None = None,
+    timeout: float | None = None,
 ):
     """Endpoint decorator for FastAPI.
 
+    `cache` enables response caching for the endpoint, either as a `Cache` policy or as a TTL in seconds.
+    `coalesce` makes concurrent identical requests share one execution, either `True` or a `Coalesce` policy.
+    `max_concurrency`, `queue_limit` and `queue_timeout` bound the concurrent executions of the endpoint, see
+    `fastapi_class.concurrency.ConcurrencyLimiter`.
+    `executor="process"` runs the (sync) endpoint in the process pool of its view, see
+    `fastapi_class.executors.ProcessExecutor`.
+    `etag` answers conditional requests with `304 Not Modified`, either `True`, a version function or an `ETag` policy.
+    `compress` compresses large responses with the negotiated coding, either `True`, a minimum size in bytes or a
+    `Compress` policy, while `False` opts out of the compression of the view.
+    `"websocket"` and `"sse"` methods serve a websocket or server-sent events, see `fastapi_class.realtime`, with the
+    heartbeat and send queue of `realtime`.
+    `rate_limit` rejects clients over a rate with a 429, either a `RateLimit` policy, a rate such as `"100/minute"` or
+    a number of requests per second.
+    `timeout` cancels the endpoint after that many seconds with a 504, or when the client disconnects, see
+    `fastapi_class.timeouts.Deadline`.
+
     ### Example:
         >>> from fastapi import FastAPI
         >>> from fastapi_class import endpoint
@@ -70,36 +242,51 @@ def endpoint(
         )
         if _type is not None
     ), "Response model and response class must be subclasses of BaseModel and Response respectively."
+    assert executor in (None, PROCESS_EXECUTOR), f"Executor must be None or {PROCESS_EXECUTOR!r}."
     assert isinstance(methods, (Iterable, str)) or methods is None, (
         "Methods must be an string, iterable of strings or Method enums."
     )
 
     def _decorator(function: Callable):
-        """Decorate the function."""
-
-        @wraps(function)
-        async def _wrapper(*args, **kwargs):
-            """Wrapper for the function."""
-            return await function(*args, **kwargs)
+        """Attach the endpoint metadata to the function and return it unchanged.
 
-        parsed_method = set()
+        The function itself is registered as the route, so sync functions keep running in FastAPI's threadpool and
+        there is no extra frame on every call.
+        """
+        parsed_method: set[Method | Channel] = set()
         _methods = (methods,) if isinstance(methods, str) else methods or ((name,) if name else (function.__name__,))
         for method in _methods:
-            if isinstance(method, Method):
+            if isinstance(method, (Method, Channel)):
                 parsed_method.add(method)
                 continue
             try:
                 parsed_method.add(Method[method.upper()])
-            except KeyError as exc:
-                raise ValueError(f"HTTP Method {method} is not allowed") from exc
-        _wrapper.__endpoint_metadata = Metadata(  # type: ignore
+            except KeyError:
+                try:
+                    parsed_method.add(Channel(method.lower()))
+                except ValueError as exc:
+                    raise ValueError(f"HTTP Method {method} is not allowed") from exc
+        if len(parsed_method) > 1 and any(isinstance(method, Channel) for method in parsed_method):
+            raise ValueError(f"{sorted(parsed_method)} can't be combined, realtime methods need their own endpoint")
+        function.__endpoint_metadata = Metadata(  # type: ignore
             methods=parsed_method,
-            name=name,
+            name=name or None,
             path=path,
             status_code=status_code,
             response_class=response_class,
             response_model=response_model,
-        )
-        return _wrapper
+            cache=Cache.parse(cache),
+            coalesce=Coalesce.parse(coalesce),
+            max_concurrency=max_concurrency,
+            queue_limit=queue_limit,
+            queue_timeout=queue_timeout,
+            executor=executor,
+            etag=ETag.parse(etag),
+            compress=False if compress is False else Compress.parse(compress),
+            realtime=realtime,
+            rate_limit=RateLimit.parse(rate_limit),
+            timeout=timeout,
+        ).intern()
+        return function
 
     return _decorator
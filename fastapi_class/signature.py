@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import inspect
+from collections.abc import Callable
+from typing import Any, get_type_hints
+
+
+def typed_signature(function: Callable[..., Any]) -> inspect.Signature:
+    """Return the signature of `function` with its string annotations evaluated.
+
+    Endpoints generated by fastapi_class live in this package, so FastAPI would otherwise evaluate postponed
+    annotations against the wrong module globals.
+    """
+    signature = inspect.signature(function)
+    try:
+        hints = get_type_hints(function, include_extras=True)
+    except (NameError, TypeError):
+        return signature
+    return signature.replace(
+        parameters=[
+            parameter.replace(annotation=hints.get(parameter.name, parameter.annotation))
+            for parameter in signature.parameters.values()
+        ],
+        return_annotation=hints.get("return", signature.return_annotation),
+    )
+
+
+def copy_signature(
+    wrapper: Callable[..., Any],
+    function: Callable[..., Any],
+    signature: inspect.Signature | None = None,
+) -> Callable[..., Any]:
+    """Make `wrapper` look like `function` to FastAPI.
+
+    Unlike `functools.wraps` this doesn't set `__wrapped__`, so FastAPI inspects the wrapper itself (sync or async)
+    rather than unwrapping down to `function`.
+    """
+    for attribute in ("__module__", "__name__", "__qualname__", "__doc__"):
+        setattr(wrapper, attribute, getattr(function, attribute, None))
+    wrapper.__signature__ = signature or typed_signature(function)  # type: ignore
+    return wrapper
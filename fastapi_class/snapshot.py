@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import gzip
+import hashlib
+import inspect
+import json
+import os
+import platform
+from collections.abc import Iterable
+from pathlib import Path
+from types import ModuleType
+from typing import Any
+
+import fastapi
+import pydantic
+from fastapi import FastAPI
+from fastapi.routing import APIRoute, APIWebSocketRoute
+
+SNAPSHOT_FORMAT = 1
+
+
+def _qualified_name(value: Any) -> str | None:
+    if value is None:
+        return None
+    if hasattr(value, "__qualname__"):
+        return f"{value.__module__}.{value.__qualname__}"
+    return repr(value)
+
+
+def _source_files(source: ModuleType | type | str | os.PathLike[str]) -> Iterable[Path]:
+    if isinstance(source, (ModuleType, type)):
+        source = inspect.getsourcefile(source) or ""
+    path = Path(source)
+    return sorted(path.rglob("*.py")) if path.is_dir() else (path,)
+
+
+def source_hash(*sources: ModuleType | type | str | os.PathLike[str]) -> str:
+    """Hash the source files of `sources` (modules, classes, files or directories), along with the versions of
+    Python, FastAPI, pydantic and fastapi_class, so a snapshot is discarded whenever the routes could differ.
+    """
+    from fastapi_class import __version__
+
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(f"{platform.python_version()}|{fastapi.__version__}|{pydantic.VERSION}|{__version__}".encode())
+    for source in sources:
+        for path in _source_files(source):
+            digest.update(str(path.name).encode("utf-8"))
+            digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def _route_entry(route: APIRoute | APIWebSocketRoute) -> dict[str, Any]:
+    if isinstance(route, APIWebSocketRoute):
+        return {"path": route.path, "name": route.name, "websocket": True}
+    return {
+        "path": route.path,
+        "methods": sorted(route.methods),
+        "name": route.name,
+        "operation_id": route.operation_id,
+        "status_code": route.status_code,
+        "response_class": _qualified_name(getattr(route.response_class, "value", route.response_class)),
+        "response_model": _qualified_name(route.response_model),
+        "responses": sorted(str(status_code) for status_code in route.responses),
+        "endpoint": _qualified_name(route.endpoint),
+    }
+
+
+def _route_key(entry: dict[str, Any]) -> tuple[Any, ...]:
+    return (entry["path"], tuple(entry.get("methods", ())), entry["name"], entry.get("status_code"))
+
+
+class RouteTable:
+    """Resolved routes of an application and its OpenAPI schema, saved to disk to speed up the next startups.
+
+    A route table is tied to the `source_hash` of the code that produced it. Loading it back with the same hash
+    lets a `ViewRegistry` register views without their OpenAPI-only metadata (error responses, operationIds) and
+    preloads `app.openapi_schema`, see `ViewRegistry.register_snapshot()`. FastAPI still analyses the signature of
+    every endpoint, which it needs to handle requests.
+
+    ### Example:
+        >>> table = RouteTable.capture(app, source_hash(views))
+        >>> table.dump("routes.json.gz")
+        >>> RouteTable.load("routes.json.gz", source_hash(views)).restore(app)
+    """
+
+    def __init__(self, source_hash: str, routes: list[dict[str, Any]], openapi: dict[str, Any]) -> None:
+        self.source_hash = source_hash
+        self.routes = routes
+        self.openapi = openapi
+
+    @classmethod
+    def capture(cls, app: FastAPI, source_hash: str) -> RouteTable:
+        """Snapshot the API routes of `app`, generating its OpenAPI schema if needed."""
+        return cls(source_hash, _route_entries(app), app.openapi())
+
+    @classmethod
+    def load(cls, path: str | os.PathLike[str], source_hash: str) -> RouteTable | None:
+        """Read a route table, or return `None` when it's missing, unreadable or was made from other sources."""
+        try:
+            data = Path(path).read_bytes()
+            document = json.loads(gzip.decompress(data) if data[:2] == b"\x1f\x8b" else data)
+        except (OSError, ValueError):
+            return None
+        if document.get("format") != SNAPSHOT_FORMAT or document.get("source_hash") != source_hash:
+            return None
+        return cls(source_hash, document["routes"], document["openapi"])
+
+    def dump(self, path: str | os.PathLike[str]) -> None:
+        """Write the route table as compact JSON, gzipped when `path` ends with `.gz`."""
+        document = {"format": SNAPSHOT_FORMAT, "source_hash": self.source_hash, "routes": self.routes}
+        data = json.dumps({**document, "openapi": self.openapi}, separators=(",", ":")).encode("utf-8")
+        path = Path(path)
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(gzip.compress(data, mtime=0) if path.suffix == ".gz" else data)
+        tmp.replace(path)
+
+    def matches(self, app: FastAPI) -> bool:
+        """Whether `app` serves the routes of the table."""
+        return sorted(map(_route_key, _route_entries(app))) == sorted(map(_route_key, self.routes))
+
+    def restore(self, app: FastAPI) -> None:
+        """Preload the OpenAPI schema of `app`, raising `ValueError` if its routes differ from the table's."""
+        if not self.matches(app):
+            raise ValueError("The routes of the application don't match the snapshot, which is out of date")
+        app.openapi_schema = self.openapi
+
+
+def _route_entries(app: FastAPI) -> list[dict[str, Any]]:
+    return [_route_entry(route) for route in app.routes if isinstance(route, (APIRoute, APIWebSocketRoute))]
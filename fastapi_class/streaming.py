@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import inspect
+import json
+from collections.abc import AsyncIterable, AsyncIterator, Callable, Iterable
+from typing import Any, ClassVar
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from starlette.concurrency import iterate_in_threadpool
+
+from fastapi_class.signature import copy_signature, typed_signature
+
+
+class StreamingJSONResponse(StreamingResponse):
+    """Base of the responses streaming the items yielded by a generator view method.
+
+    Subclasses define how items are framed: `prefix` and `suffix` wrap the stream and `separator` goes between
+    items, while `terminator` follows each item.
+    """
+
+    prefix: ClassVar[bytes] = b""
+    separator: ClassVar[bytes] = b""
+    terminator: ClassVar[bytes] = b""
+    suffix: ClassVar[bytes] = b""
+
+
+class NDJSONResponse(StreamingJSONResponse):
+    """One JSON document per line, the default for generator view methods."""
+
+    media_type = "application/x-ndjson"
+    terminator = b"\n"
+
+
+class JSONArrayResponse(StreamingJSONResponse):
+    """A single JSON array, written item by item."""
+
+    media_type = "application/json"
+    prefix = b"["
+    separator = b","
+    suffix = b"]"
+
+
+def is_streaming(function: Callable[..., Any]) -> bool:
+    """Whether `function` is a sync or async generator function."""
+    return inspect.isasyncgenfunction(function) or inspect.isgeneratorfunction(function)
+
+
+def item_serializer(response_model: Any | None) -> Callable[[Any], bytes]:
+    """Return a function encoding one item, validated against `response_model` when there is one."""
+    if response_model is None:
+        return lambda item: json.dumps(jsonable_encoder(item), separators=(",", ":")).encode("utf-8")
+    adapter: TypeAdapter[Any] = TypeAdapter(response_model)
+    return lambda item: adapter.dump_json(adapter.validate_python(item, from_attributes=True))
+
+
+async def _frames(
+    items: AsyncIterable[Any] | Iterable[Any],
+    serialize: Callable[[Any], bytes],
+    response_class: type[StreamingJSONResponse],
+) -> AsyncIterator[bytes]:
+    iterator = items if isinstance(items, AsyncIterable) else iterate_in_threadpool(iter(items))
+    if response_class.prefix:
+        yield response_class.prefix
+    first = True
+    async for item in iterator:
+        chunk = serialize(item) + response_class.terminator
+        yield chunk if first else response_class.separator + chunk
+        first = False
+    if response_class.suffix:
+        yield response_class.suffix
+
+
+def streaming_endpoint(
+    function: Callable[..., Any],
+    response_class: type[StreamingJSONResponse] = NDJSONResponse,
+    response_model: Any | None = None,
+) -> Callable[..., Any]:
+    """Build a route endpoint returning the items yielded by `function` as a streaming response.
+
+    Items are serialized one at a time as the client consumes the response, so memory stays flat whatever the number
+    of items.
+    """
+    serialize = item_serializer(response_model)
+    signature = typed_signature(function).replace(return_annotation=inspect.Signature.empty)
+
+    async def _endpoint(**kwargs: Any) -> Response:
+        return response_class(_frames(function(**kwargs), serialize, response_class))
+
+    return copy_signature(_endpoint, function, signature)
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import time
+
+from fastapi import HTTPException, Request, status
+from fastapi.responses import Response
+
+from fastapi_class.route import Handler, Layer
+
+DEADLINE_SCOPE_KEY = "fastapi_class.deadline"
+CLIENT_CLOSED_REQUEST = 499
+
+
+def _gateway_timeout() -> HTTPException:
+    return HTTPException(status.HTTP_504_GATEWAY_TIMEOUT, "Timed out handling the request.")
+
+
+TIMEOUT_EXCEPTIONS = (_gateway_timeout,)
+
+
+class Deadline:
+    """Time budget of a request, set by `endpoint(timeout=...)` or the `timeout` of its view.
+
+    View methods get it with `Depends(get_deadline)` and pass `budget()` as the timeout of downstream calls, while
+    sync methods, which can't be cancelled, can give up once it has `expired`.
+
+    ### Example:
+        >>> @endpoint("get", path="report", timeout=2.0)
+        ... async def report(self, deadline: Deadline = Depends(get_deadline)):
+        ...     return await client.get(url, timeout=deadline.budget(1.0))
+    """
+
+    __slots__ = ("timeout", "expires_at")
+
+    def __init__(self, timeout: float | None = None) -> None:
+        self.timeout = timeout
+        self.expires_at = time.monotonic() + timeout if timeout is not None else math.inf
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(remaining={self.remaining:.3f})"
+
+    @property
+    def remaining(self) -> float:
+        """Seconds left, `inf` without a timeout."""
+        return max(0.0, self.expires_at - time.monotonic())
+
+    @property
+    def expired(self) -> bool:
+        return time.monotonic() >= self.expires_at
+
+    def budget(self, timeout: float | None = None) -> float | None:
+        """Timeout of a downstream call: the remaining time, capped by `timeout`, or `None` when unbounded."""
+        remaining = self.remaining
+        if timeout is not None:
+            remaining = min(remaining, timeout)
+        return None if remaining == math.inf else remaining
+
+
+def get_deadline(request: Request) -> Deadline:
+    """Dependency returning the `Deadline` of the request, which never expires on methods without a timeout."""
+    deadline = request.scope.get(DEADLINE_SCOPE_KEY)
+    return deadline if deadline is not None else Deadline()
+
+
+def timeout_layer(timeout: float) -> Layer:
+    """Return the route layer cancelling the handler after `timeout` seconds, or as soon as the client disconnects.
+
+    Timed out requests are answered with a 504. To notice disconnections, the request body is read upfront. A sync
+    method keeps running in its thread once cancelled, so it should check `Deadline.expired` in long loops.
+    """
+
+    def _layer(handler: Handler) -> Handler:
+        async def _handler(request: Request) -> Response:
+            request.scope[DEADLINE_SCOPE_KEY] = Deadline(timeout)
+            body_read = asyncio.Event()
+
+            async def _handle() -> Response:
+                await request.body()
+                body_read.set()
+                return await handler(request)
+
+            async def _disconnected() -> None:
+                await body_read.wait()
+                while (await request.receive())["type"] != "http.disconnect":
+                    pass
+
+            task = asyncio.ensure_future(_handle())
+            watcher = asyncio.ensure_future(_disconnected())
+            try:
+                await asyncio.wait((task, watcher), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                watcher.cancel()
+                if not task.done():
+                    task.cancel()
+                    await asyncio.wait((task,))
+            if not task.cancelled():
+                return task.result()
+            if watcher.done() and not watcher.cancelled():
+                return Response(status_code=CLIENT_CLOSED_REQUEST)
+            raise _gateway_timeout()
+
+        return _handler
+
+    return _layer
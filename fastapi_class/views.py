@@ -2,34 +2,148 @@ from __future__ import annotations
 
 import re
 from collections.abc import Callable, Iterable
+from functools import partial
+from typing import Any
+from weakref import WeakKeyDictionary
 
-from fastapi import APIRouter, FastAPI, HTTPException, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, FastAPI, HTTPException, params, status
+from fastapi.responses import JSONResponse, Response
+from fastapi.routing import APIRoute
 
+from fastapi_class.batch import BATCH_PATH, BatchOperation, batch_endpoint
+from fastapi_class.cache import INVALIDATING_METHODS, Cache, invalidation_layer
+from fastapi_class.compression import Compress
+from fastapi_class.concurrency import LIMIT_EXCEPTIONS, ConcurrencyLimiter
+from fastapi_class.conditional import NOT_MODIFIED_RESPONSE, ETag
+from fastapi_class.executors import PROCESS_EXECUTOR, ProcessExecutor, process_endpoint, shutdown_on_exit
+from fastapi_class.lifecycle import InstancePool, InstanceScope, class_dependencies, request_scoped_endpoint
+from fastapi_class.metrics import MetricsRegistry, default_registry
 from fastapi_class.openapi import _exceptions_to_responses
-from fastapi_class.routers import Metadata, Method
+from fastapi_class.pagination import PAGINATION_EXCEPTIONS, Page, page_request_parameter
+from fastapi_class.profiling import Profiler, add_profile_route, default_profiler, profiled_endpoint
+from fastapi_class.ratelimit import RATE_LIMIT_EXCEPTIONS, RateLimit
+from fastapi_class.realtime import DEFAULT_REALTIME, EventStreamResponse, event_stream_endpoint, websocket_endpoint
+from fastapi_class.registry import ViewRegistry
+from fastapi_class.responses import ModelJSONResponse, model_response_endpoint
+from fastapi_class.route import Layer, replayable_endpoint, route_class
+from fastapi_class.routers import Channel, Metadata, Method
+from fastapi_class.signature import typed_signature
+from fastapi_class.streaming import NDJSONResponse, StreamingJSONResponse, is_streaming, streaming_endpoint
+from fastapi_class.timeouts import TIMEOUT_EXCEPTIONS, timeout_layer
 
 COMMON_KEYWORD = "common"
 RESPONSE_MODEL_ATTRIBUTE_NAME = "response_model"
 RESPONSE_CLASS_ATTRIBUTE_NAME = "response_class"
 ENDPOINT_METADATA_ATTRIBUTE_NAME = "__endpoint_metadata"
 EXCEPTIONS_ATTRIBUTE_NAME = "EXCEPTIONS"
+CACHE_ATTRIBUTE_NAME = "CACHE"
+ETAG_ATTRIBUTE_NAME = "ETAG"
+DEPENDENCIES_ATTRIBUTE_NAME = "DEPENDENCIES"
+RATE_LIMITS_ATTRIBUTE_NAME = "RATE_LIMITS"
+METHOD_NAMES = frozenset(Method)
+CHANNEL_NAMES = frozenset(Channel)
+CLASS_NAME_WORD = re.compile(r"[A-Z][^A-Z]*")
+OPERATION_ID_SEPARATOR = re.compile(r"\W+")
+OPERATION_IDS_ATTRIBUTE_NAME = "_fastapi_class_operation_ids"
+# Per view class, weakly, so classes built at runtime can be freed along with their closures.
+_route_names_by_class: WeakKeyDictionary[type, dict[tuple[Callable, str], str]] = WeakKeyDictionary()
+_endpoint_names_by_class: WeakKeyDictionary[type, tuple[str, ...]] = WeakKeyDictionary()
 
 
 def _view_class_name_default_parser(cls: object, method: str):
-    class_name = " ".join(re.findall(r"[A-Z][^A-Z]*", cls.__name__.replace("View", "")))  # type: ignore
+    class_name = " ".join(CLASS_NAME_WORD.findall(cls.__name__.replace("View", "")))  # type: ignore
     return f"{method.capitalize()} {class_name}"
 
 
+def _route_name(name_parser: Callable[[object, str], str], cls: type, method: str) -> str:
+    """Route name of the method `method` of `cls`, computed once per parser, class and method."""
+    names = _route_names_by_class.setdefault(cls, {})
+    name = names.get((name_parser, method))
+    if name is None:
+        name = names[name_parser, method] = name_parser(cls, method)
+    return name
+
+
+def _operation_id(name: str, method: str | None = None) -> str:
+    """OpenAPI operationId derived from a route name, e.g. `get_item` for `Get Item`."""
+    operation_id = OPERATION_ID_SEPARATOR.sub("_", name).strip("_").lower()
+    return f"{operation_id}_{method.lower()}" if method is not None else operation_id
+
+
+def _claim_operation_id(router: APIRouter, operation_id: str, owner: str, path: str, *, explicit: bool) -> str:
+    """Reserve `operation_id` on `router` for `owner`, the endpoint of an `explicit` name or of a parsed one.
+
+    An id already used by another route gets the path appended, e.g. `get_item_v2_items`, then a counter. Two
+    endpoints given the same explicit `name` raise a `ValueError`.
+    """
+    claimed: dict[str, tuple[str, bool]] | None = getattr(router, OPERATION_IDS_ATTRIBUTE_NAME, None)
+    if claimed is None:
+        claimed = {
+            route.operation_id: (route.path, False)
+            for route in router.routes
+            if isinstance(route, APIRoute) and route.operation_id
+        }
+        setattr(router, OPERATION_IDS_ATTRIBUTE_NAME, claimed)
+    previous = claimed.get(operation_id)
+    if previous is not None:
+        if explicit and previous[1] and previous[0] != owner:
+            raise ValueError(
+                f"Duplicate operationId {operation_id!r} for {owner}, already used by {previous[0]}; "
+                "give the endpoints different names"
+            )
+        base = operation_id = _operation_id(f"{operation_id} {path}")
+        counter = 1
+        while operation_id in claimed:
+            counter += 1
+            operation_id = f"{base}_{counter}"
+    claimed[operation_id] = (owner, explicit)
+    return operation_id
+
+
+def _endpoint_names(cls: type) -> tuple[str, ...]:
+    """Names of the attributes of `cls` that are registered as routes."""
+    names = _endpoint_names_by_class.get(cls)
+    if names is None:
+        names = _endpoint_names_by_class[cls] = tuple(
+            name
+            for name in dir(cls)
+            if name in METHOD_NAMES
+            or name in CHANNEL_NAMES
+            or hasattr(getattr(cls, name, None), ENDPOINT_METADATA_ATTRIBUTE_NAME)
+        )
+    return names
+
+
 def View(
     router: FastAPI | APIRouter,
     *,
     path: str = "/",
     default_status_code: int = status.HTTP_200_OK,
     name_parser: Callable[[object, str], str] = _view_class_name_default_parser,
+    instance_scope: str | InstanceScope = InstanceScope.VIEW,
+    pool_size: int = 0,
+    registry: ViewRegistry | None = None,
+    instrument: bool | MetricsRegistry = False,
+    default_response_class: type[Response] = JSONResponse,
+    max_concurrency: int | None = None,
+    queue_limit: int | None = None,
+    queue_timeout: float | None = None,
+    process_executor: ProcessExecutor | None = None,
+    batch: bool = False,
+    batch_concurrency: int = 8,
+    max_batch_size: int | None = 100,
+    compress: Compress | bool | int | None = None,
+    profile: bool | Profiler = False,
+    profile_path: str | None = None,
+    timeout: float | None = None,
+    operation_ids: bool = False,
 ):
     """Class-based view decorator for FastAPI.
 
+    Methods named after HTTP methods or channels (`websocket`, `sse`), and those decorated with `endpoint()`, become
+    routes under `path`, named by `name_parser`. The other arguments are view-wide defaults of the features described
+    in the README, which class-level mappings and `endpoint()` refine per method. The class is returned unchanged.
+
     ### Example:
         >>> from fastapi import FastAPI
         >>> from fastapi_class import View
@@ -40,38 +154,393 @@ def View(
         ...     async def get(self):
         ...         return {"message": "Hello, world!"}
     """
+    scope = InstanceScope(instance_scope)
+    metrics = default_registry if instrument is True else instrument or None
+    profiler = default_profiler if profile is True else profile or None
 
-    def _decorator(cls) -> None:
-        obj = cls()
-        cls_based_response_model = getattr(obj, RESPONSE_MODEL_ATTRIBUTE_NAME, {})
-        cls_based_response_class = getattr(obj, RESPONSE_CLASS_ATTRIBUTE_NAME, {})
-        common_exceptions = getattr(obj, EXCEPTIONS_ATTRIBUTE_NAME, {}).get(COMMON_KEYWORD, ())
-        for _callable_name in dir(obj):
-            _callable = getattr(obj, _callable_name)
-            if _callable_name in set(Method) or hasattr(_callable, ENDPOINT_METADATA_ATTRIBUTE_NAME):
-                metadata: Metadata = getattr(
-                    _callable,
-                    ENDPOINT_METADATA_ATTRIBUTE_NAME,
-                    Metadata([_callable_name]),
-                )
-                exceptions: Iterable[HTTPException] = getattr(obj, ENDPOINT_METADATA_ATTRIBUTE_NAME, {}).get(
-                    _callable_name, []
-                )
-                exceptions += common_exceptions
-                _path = path
-                if metadata and metadata.path:
-                    _path = path + metadata.path
-                router.add_api_route(
-                    _path,
-                    _callable,
-                    methods=list(metadata.methods),
-                    response_class=metadata.response_class_or_default(
-                        cls_based_response_class.get(_callable_name, JSONResponse)
-                    ),
-                    response_model=metadata.response_model_or_default(cls_based_response_model.get(_callable_name)),
-                    responses=_exceptions_to_responses(exceptions),
-                    name=metadata.name_or_default(name_parser(cls, _callable_name)),
-                    status_code=metadata.status_code_or_default(default_status_code),
-                )
+    def _decorator(cls):
+        register = partial(
+            _register_view,
+            router,
+            cls,
+            path=path,
+            name_parser=name_parser,
+            scope=scope,
+            pool_size=pool_size,
+            metrics=metrics,
+            default_response_class=default_response_class,
+            defaults=Metadata(
+                (),
+                status_code=default_status_code,
+                max_concurrency=max_concurrency,
+                queue_limit=queue_limit,
+                queue_timeout=queue_timeout,
+                compress=Compress.parse(compress),
+                timeout=timeout,
+            ).intern(),
+            process_executor=process_executor,
+            profiling=(profiler, profile_path) if profiler is not None else None,
+            operation_ids=operation_ids,
+            batch=(batch_concurrency, max_batch_size) if batch else None,
+        )
+        if registry is None:
+            register()
+        else:
+            registry.add(register)
+        return cls
 
     return _decorator
+
+
+def _register_view(
+    router: FastAPI | APIRouter,
+    cls: type,
+    *,
+    path: str,
+    name_parser: Callable[[object, str], str],
+    scope: InstanceScope,
+    pool_size: int,
+    metrics: MetricsRegistry | None,
+    default_response_class: type[Response],
+    defaults: Metadata,
+    process_executor: ProcessExecutor | None = None,
+    batch: tuple[int, int | None] | None = None,
+    profiling: tuple[Profiler, str | None] | None = None,
+    operation_ids: bool = False,
+    openapi: bool = True,
+) -> None:
+    """Add a route to `router` for every endpoint of the view class `cls`.
+
+    `openapi=False` leaves out what only matters to the OpenAPI schema, error responses and operationIds, for
+    applications whose schema is restored from a `fastapi_class.snapshot.RouteTable`.
+    """
+    _router = router.router if isinstance(router, FastAPI) else router
+    if scope is InstanceScope.REQUEST:
+        obj = cls
+        pool = InstancePool(cls, size=pool_size)
+        dependencies = class_dependencies(cls)
+    else:
+        obj = cls()
+    cls_based_exceptions = getattr(obj, EXCEPTIONS_ATTRIBUTE_NAME, {})
+    cls_based_dependencies = getattr(obj, DEPENDENCIES_ATTRIBUTE_NAME, {})
+    common_exceptions = cls_based_exceptions.get(COMMON_KEYWORD, ())
+    common_dependencies: tuple[params.Depends, ...] = tuple(cls_based_dependencies.get(COMMON_KEYWORD, ()))
+    endpoints = _view_endpoints(cls, obj, defaults)
+    cache_backends = [metadata.cache.backend for _, metadata in endpoints.values() if metadata.cache is not None]
+    namespace = f"{cls.__module__}.{cls.__qualname__}"
+    batch_operations: dict[str, BatchOperation] = {}
+    for _callable_name, (_callable, metadata) in endpoints.items():
+        method_dependencies = tuple(cls_based_dependencies.get(_callable_name, ()))
+        route_dependencies = (
+            (*common_dependencies, *method_dependencies) if method_dependencies else common_dependencies
+        )
+        if metadata.executor == PROCESS_EXECUTOR:
+            if scope is InstanceScope.REQUEST:
+                raise ValueError(f"{cls.__name__}.{_callable_name} can't run in a process with a request scope")
+            if process_executor is None:
+                process_executor = ProcessExecutor()
+                shutdown_on_exit(_router, process_executor)
+            _callable = process_endpoint(_callable, process_executor)
+        if scope is InstanceScope.REQUEST:
+            _callable = request_scoped_endpoint(_callable, pool, dependencies)
+        _path = path + metadata.path if metadata.path else path
+        name = metadata.name if metadata.name is not None else _route_name(name_parser, cls, _callable_name)
+        if Channel.WEBSOCKET in metadata.methods:
+            _router.add_api_websocket_route(
+                _path,
+                websocket_endpoint(_callable, metadata.realtime or DEFAULT_REALTIME),
+                name=name,
+                dependencies=route_dependencies,
+            )
+            continue
+        limiter = _limiter(metadata)
+        paginated = page_request_parameter(typed_signature(_callable)) is not None
+        layers = _endpoint_layers(
+            metadata,
+            name=name,
+            view=cls.__name__,
+            method_name=_callable_name,
+            namespace=namespace,
+            limiter=limiter,
+            metrics=metrics,
+            cache_backends=cache_backends,
+            profiler=profiling[0] if profiling is not None else None,
+        )
+        if profiling is not None and not is_streaming(_callable):
+            _callable = profiled_endpoint(_callable, profiling[0].sampler)
+        response_model: Any = metadata.response_model
+        if paginated and not is_streaming(_callable):
+            response_model = Page[response_model or Any]  # type: ignore[misc]
+        status_code: int = metadata.resolve("status_code", status.HTTP_200_OK)
+        if batch is not None and _batchable(layers, method_dependencies, _callable):
+            operation = BatchOperation.build(cls.__name__, _callable_name, _callable, response_model, status_code)
+            if operation is not None:
+                batch_operations[_callable_name] = operation
+        exceptions = (*cls_based_exceptions.get(_callable_name, ()), *common_exceptions)
+        _add_endpoint_routes(
+            _router,
+            _path,
+            *_endpoint_response(
+                _callable,
+                metadata,
+                response_model,
+                status_code,
+                _endpoint_responses(metadata, exceptions, limiter=limiter, paginated=paginated),
+                default_response_class,
+                route_dependencies,
+            ),
+            methods=["GET"] if Channel.SSE in metadata.methods else sorted(m.upper() for m in metadata.methods),
+            name=name,
+            status_code=status_code,
+            dependencies=route_dependencies,
+            layers=layers,
+            owner=f"{namespace}.{_callable_name}",
+            explicit_name=metadata.name is not None,
+            operation_ids=operation_ids and openapi,
+            openapi=openapi,
+        )
+    if profiling is not None and profiling[1] is not None:
+        add_profile_route(
+            _router,
+            path.rstrip("/") + profiling[1],
+            profiler=profiling[0],
+            view=cls.__name__,
+            dependencies=common_dependencies,
+        )
+    if batch is not None and batch_operations:
+        _add_batch_route(
+            _router,
+            cls,
+            batch_operations,
+            path=path,
+            name=_route_name(name_parser, cls, BATCH_PATH),
+            namespace=namespace,
+            batch=batch,
+            metrics=metrics,
+            dependencies=common_dependencies,
+            operation_ids=operation_ids and openapi,
+            openapi=openapi,
+        )
+
+
+def _view_endpoints(cls: type, obj: Any, defaults: Metadata) -> dict[str, tuple[Callable, Metadata]]:
+    """Endpoints of the view `cls` taken from `obj`, the class or its instance, with their merged metadata."""
+    cls_based_response_model = getattr(obj, RESPONSE_MODEL_ATTRIBUTE_NAME, {})
+    cls_based_response_class = getattr(obj, RESPONSE_CLASS_ATTRIBUTE_NAME, {})
+    cls_based_cache = getattr(obj, CACHE_ATTRIBUTE_NAME, {})
+    cls_based_etag = getattr(obj, ETAG_ATTRIBUTE_NAME, {})
+    cls_based_rate_limits = getattr(obj, RATE_LIMITS_ATTRIBUTE_NAME, {})
+    endpoints: dict[str, tuple[Callable, Metadata]] = {}
+    for _callable_name in _endpoint_names(cls):
+        _callable = getattr(obj, _callable_name)
+        metadata = getattr(_callable, ENDPOINT_METADATA_ATTRIBUTE_NAME, None) or Metadata([_callable_name])
+        endpoints[_callable_name] = (
+            _callable,
+            metadata.merge(
+                defaults,
+                response_model=cls_based_response_model.get(_callable_name),
+                response_class=cls_based_response_class.get(_callable_name),
+                cache=Cache.parse(cls_based_cache.get(_callable_name)),
+                etag=ETag.parse(cls_based_etag.get(_callable_name)),
+                rate_limit=RateLimit.parse(cls_based_rate_limits.get(_callable_name)),
+            ),
+        )
+    return endpoints
+
+
+def _endpoint_layers(
+    metadata: Metadata,
+    *,
+    name: str,
+    view: str,
+    method_name: str,
+    namespace: str,
+    limiter: ConcurrencyLimiter | None,
+    metrics: MetricsRegistry | None,
+    cache_backends: list[Any],
+    profiler: Profiler | None,
+) -> list[Layer]:
+    """Route layers of an endpoint, outermost first."""
+    layers: list[Layer] = []
+    if metrics is not None:
+        endpoint_metrics = metrics.endpoint(name, view, method_name)
+        endpoint_metrics.limiter = limiter
+        layers.append(endpoint_metrics.layer)
+    if metadata.rate_limit is not None:
+        layers.append(metadata.rate_limit.layer(f"{namespace}.{method_name}"))
+    if metadata.timeout is not None:
+        layers.append(timeout_layer(metadata.timeout))
+    if metadata.etag is not None:
+        layers.append(metadata.etag.layer())
+    compress = metadata.compress or None
+    variant = compress.negotiate if compress is not None else None
+    if metadata.coalesce is not None:
+        layers.append(metadata.coalesce.layer(variant))
+    if metadata.cache is not None:
+        layers.append(metadata.cache.layer(namespace, variant))
+    elif cache_backends and INVALIDATING_METHODS & {method.upper() for method in metadata.methods}:
+        layers.append(invalidation_layer(namespace, cache_backends))
+    if compress is not None:
+        layers.append(compress.layer())
+    if limiter is not None:
+        layers.append(limiter.layer)
+    if profiler is not None:
+        layers.append(profiler.endpoint(name, view, method_name).layer)
+    return layers
+
+
+def _endpoint_responses(
+    metadata: Metadata,
+    exceptions: Iterable[HTTPException | Callable[..., HTTPException]],
+    *,
+    limiter: ConcurrencyLimiter | None,
+    paginated: bool,
+) -> dict[int | str, dict[str, Any]]:
+    """OpenAPI responses of an endpoint: its exceptions and those its layers may raise."""
+    if limiter is not None:
+        exceptions = (*exceptions, *LIMIT_EXCEPTIONS)
+    if metadata.rate_limit is not None:
+        exceptions = (*exceptions, *RATE_LIMIT_EXCEPTIONS)
+    if metadata.timeout is not None:
+        exceptions = (*exceptions, *TIMEOUT_EXCEPTIONS)
+    if paginated:
+        exceptions = (*exceptions, *PAGINATION_EXCEPTIONS)
+    responses = _exceptions_to_responses(exceptions)
+    if metadata.etag is not None:
+        responses = {**responses, status.HTTP_304_NOT_MODIFIED: NOT_MODIFIED_RESPONSE}
+    return responses
+
+
+def _endpoint_response(
+    function: Callable,
+    metadata: Metadata,
+    response_model: Any,
+    status_code: int,
+    responses: dict[int | str, dict[str, Any]],
+    default_response_class: type[Response],
+    dependencies: tuple[params.Depends, ...] = (),
+) -> tuple[Callable, type[Response], Any, dict[int | str, dict[str, Any]]]:
+    """Wrap the endpoint of a method for the way it responds, and return it with its response class, model and
+    OpenAPI responses.
+    """
+    response_class = metadata.response_class
+    if Channel.SSE in metadata.methods:
+        function = event_stream_endpoint(function, metadata.realtime or DEFAULT_REALTIME)
+        response_class, response_model = EventStreamResponse, None
+        responses = {
+            **responses,
+            status_code: {"description": "Server-sent events", "content": {EventStreamResponse.media_type: {}}},
+        }
+    elif is_streaming(function):
+        if not (isinstance(response_class, type) and issubclass(response_class, StreamingJSONResponse)):
+            response_class = NDJSONResponse
+        function = streaming_endpoint(function, response_class, response_model)
+        if response_model is not None:
+            responses = {**responses, status_code: {"model": response_model}}
+        response_model = None
+    if response_class is None:
+        response_class = default_response_class
+    if issubclass(response_class, ModelJSONResponse):
+        function = model_response_endpoint(function, response_class, response_model, status_code, dependencies)
+    if metadata.cache is not None or metadata.coalesce is not None:
+        function = replayable_endpoint(function)
+    return function, response_class, response_model, responses
+
+
+def _add_endpoint_routes(
+    router: APIRouter,
+    path: str,
+    function: Callable,
+    response_class: type[Response],
+    response_model: Any,
+    responses: dict[int | str, dict[str, Any]],
+    *,
+    methods: list[str],
+    name: str,
+    status_code: int,
+    dependencies: tuple[params.Depends, ...],
+    layers: list[Layer],
+    owner: str,
+    explicit_name: bool,
+    operation_ids: bool,
+    openapi: bool,
+) -> None:
+    """Add one route per HTTP method of an endpoint, so that each gets an operationId of its own."""
+    for method in methods:
+        router.add_api_route(
+            path,
+            function,
+            methods=[method],
+            response_class=response_class,
+            response_model=response_model,
+            responses=responses if openapi else None,
+            name=name,
+            status_code=status_code,
+            dependencies=dependencies,
+            operation_id=_claim_operation_id(
+                router,
+                _operation_id(name, method if len(methods) > 1 else None),
+                owner,
+                path,
+                explicit=explicit_name,
+            )
+            if operation_ids
+            else None,
+            route_class_override=route_class(layers),
+        )
+
+
+def _add_batch_route(
+    router: APIRouter,
+    cls: type,
+    operations: dict[str, BatchOperation],
+    *,
+    path: str,
+    name: str,
+    namespace: str,
+    batch: tuple[int, int | None],
+    metrics: MetricsRegistry | None,
+    dependencies: tuple[params.Depends, ...],
+    operation_ids: bool,
+    openapi: bool,
+) -> None:
+    """Add the `POST {path}/batch` route calling the batchable methods of the view `cls`."""
+    batch_concurrency, max_batch_size = batch
+    function, result_model = batch_endpoint(
+        cls.__name__, operations, max_concurrency=batch_concurrency, max_size=max_batch_size
+    )
+    layers = [metrics.endpoint(name, cls.__name__, BATCH_PATH).layer] if metrics is not None else []
+    batch_path = path.rstrip("/") + "/" + BATCH_PATH
+    responses: dict[int | str, dict[str, Any]] = {
+        status.HTTP_200_OK: {"model": list[result_model]}  # type: ignore[valid-type]
+    }
+    router.add_api_route(
+        batch_path,
+        function,
+        methods=["POST"],
+        responses=responses if openapi else None,
+        name=name,
+        dependencies=dependencies,
+        operation_id=_claim_operation_id(
+            router, _operation_id(name), f"{namespace}.{BATCH_PATH}", batch_path, explicit=False
+        )
+        if operation_ids
+        else None,
+        route_class_override=route_class(layers),
+    )
+
+
+def _batchable(layers: list[Layer], dependencies: tuple[params.Depends, ...], function: Callable) -> bool:
+    """Whether a method can be called from the batch route, which calls it directly, without its dependencies and
+    route layers (limits, caching, conditional requests, compression, coalescing, metrics and profiling).
+    """
+    return not layers and not dependencies and not is_streaming(function)
+
+
+def _limiter(metadata: Metadata) -> ConcurrencyLimiter | None:
+    """Build the concurrency limiter of an endpoint from its metadata, merged with the view's defaults."""
+    if metadata.max_concurrency is None:
+        return None
+    return ConcurrencyLimiter(
+        metadata.max_concurrency, queue_limit=metadata.queue_limit, queue_timeout=metadata.queue_timeout
+    )
@@ -0,0 +1,7 @@
+#!/usr/bin/env bash
+
+set -e
+set -x
+
+export PYTHONPATH=.
+python -m benchmarks "$@"
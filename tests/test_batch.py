@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from fastapi_class import Cache, View, endpoint
+from fastapi_class.batch import BatchOperation, arguments_model
+from fastapi_class.signature import typed_signature
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+def _app(**kwargs) -> FastAPI:
+    app = FastAPI()
+
+    @View(app, path="/items", batch=True, **kwargs)
+    class ItemView:
+        response_model = {"get": Item}
+
+        async def get(self, id: int = Query()):
+            if id == 0:
+                raise HTTPException(status_code=404, detail="Item not found")
+            return {"id": id, "name": f"item-{id}", "secret": "hidden"}
+
+        def post(self, item: Item):
+            return item
+
+        @endpoint("get", path="me", response_model=Item)
+        async def me(self, request: Request):
+            return request
+
+        @endpoint("get", path="user")
+        async def user(self, user: str = Depends(lambda: "user")):
+            return user
+
+    return app
+
+
+def test_view__batch_runs_items_in_order():
+    client = TestClient(_app())
+    response = client.post(
+        "/items/batch",
+        json=[
+            {"method": "get", "arguments": {"id": 1}},
+            {"method": "post", "arguments": {"item": {"id": 2, "name": "two"}}},
+            {"method": "get", "arguments": {"id": 0}},
+        ],
+    )
+    assert response.status_code == 200
+    assert response.json() == [
+        {"status_code": 200, "result": {"id": 1, "name": "item-1"}},
+        {"status_code": 200, "result": {"id": 2, "name": "two"}},
+        {"status_code": 404, "detail": "Item not found"},
+    ]
+
+
+def test_view__batch_rejects_invalid_and_oversized_batches():
+    client = TestClient(_app(max_batch_size=2))
+    assert client.post("/items/batch", json=[{"method": "me", "arguments": {}}]).status_code == 422
+    assert client.post("/items/batch", json=[{"method": "get", "arguments": {}}]).status_code == 422
+    assert client.post("/items/batch", json=[{"method": "get", "arguments": {"id": 1}}] * 3).status_code == 422
+
+
+def test_view__batch_openapi_uses_method_models():
+    schema = _app().openapi()
+    operation = schema["paths"]["/items/batch"]["post"]
+    assert "ItemViewGetBatchItem" in str(operation["requestBody"])
+    assert set(schema["components"]["schemas"]) >= {
+        "ItemViewGetArguments",
+        "ItemViewPostArguments",
+        "ItemViewBatchResult",
+    }
+    assert "ItemViewMeArguments" not in schema["components"]["schemas"]
+
+
+def test_view__batch_disabled_by_default():
+    app = FastAPI()
+
+    @View(app)
+    class PlainView:
+        async def get(self):
+            return 1
+
+    assert all(getattr(route, "path", None) != "/batch" for route in app.routes)
+
+
+def test_arguments_model__rejects_request_bound_parameters():
+    async def function(id: int, request: Request):
+        return id
+
+    async def plain(id: int, name: str = "x"):
+        return id
+
+    assert arguments_model("Function", typed_signature(function)) is None
+    model = arguments_model("Plain", typed_signature(plain))
+    assert model is not None
+    assert model(id=1).name == "x"
+
+
+@pytest.mark.asyncio
+async def test_batch_operation__validates_results_with_its_adapter():
+    def get(id: int):
+        return {"id": id, "name": "item", "extra": True}
+
+    operation = BatchOperation.build("ItemView", "get", get, Item, 200)
+    assert operation is not None
+    assert operation.adapter is not None
+    result = await operation(operation.arguments(id=1))
+    assert result == {"status_code": 200, "result": {"id": 1, "name": "item"}}
+
+
+def test_view__batch_leaves_out_rate_limited_methods():
+    app = FastAPI()
+
+    @View(app, batch=True)
+    class LoginView:
+        RATE_LIMITS = {"post": "2/minute"}
+
+        async def get(self):
+            return {}
+
+        @endpoint("get", path="slow", timeout=1.0)
+        async def slow(self):
+            return {}
+
+        async def post(self, password: str):
+            return {}
+
+    client = TestClient(app)
+    assert client.post("/batch", json=[{"method": "get", "arguments": {}}]).status_code == 200
+    attempts = [{"method": "post", "arguments": {"password": str(index)}} for index in range(50)]
+    assert client.post("/batch", json=attempts).status_code == 422
+    assert client.post("/batch", json=[{"method": "slow", "arguments": {}}]).status_code == 422
+
+
+def test_view__batched_post_does_not_bypass_cache_invalidation():
+    app = FastAPI()
+    state = {"v": 1}
+
+    @View(app, batch=True)
+    class ValueView:
+        CACHE = {"get": Cache(ttl=60)}
+
+        async def get(self):
+            return dict(state)
+
+        async def post(self, v: int):
+            state["v"] = v
+            return dict(state)
+
+        @endpoint("get", path="plain")
+        async def plain(self):
+            return {}
+
+    client = TestClient(app)
+    assert client.get("/").json() == {"v": 1}
+    assert client.post("/batch", json=[{"method": "post", "arguments": {"v": 2}}]).status_code == 422
+    assert client.post("/", params={"v": 2}).status_code == 200
+    assert client.get("/").json() == {"v": 2}
+    assert client.post("/batch", json=[{"method": "plain", "arguments": {}}]).status_code == 200
+
+
+def test_view__batched_items_respect_max_concurrency():
+    app = FastAPI()
+
+    @View(app, batch=True)
+    class SlowView:
+        @endpoint("get", max_concurrency=1, queue_limit=0)
+        async def get(self):
+            return {}  # pragma: no cover
+
+        @endpoint("get", path="free")
+        async def free(self):
+            return {}
+
+    client = TestClient(app)
+    items = [{"method": "get", "arguments": {}} for _ in range(5)]
+    assert client.post("/batch", json=items).status_code == 422
+    assert client.post("/batch", json=[{"method": "free", "arguments": {}}] * 5).status_code == 200
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from benchmarks.__main__ import MODULES, compare, run
+
+
+def test_benchmarks__run_every_module():
+    results = run(scale=0.001)
+    assert set(results["results"]) == set(MODULES)
+    assert all(value > 0 for metrics in results["results"].values() for value in metrics.values())
+
+
+def test_benchmarks__compare():
+    baseline = {"results": {"bench": {"latency_ns": 100.0, "throughput_rps": 100.0}}}
+    current = {"results": {"bench": {"latency_ns": 50.0, "throughput_rps": 50.0, "new_ns": 1.0}}}
+    assert compare(current, baseline) == [
+        "bench.latency_ns: 100 -> 50 (x0.50, better)",
+        "bench.throughput_rps: 100 -> 50 (x0.50, worse)",
+    ]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, Header, HTTPException, Response
+from fastapi.testclient import TestClient
+
+from fastapi_class import Cache, View, endpoint
+from fastapi_class.cache import CachedResponse, InMemoryCache
+
+
+def _entry(body: bytes = b"{}") -> CachedResponse:
+    return CachedResponse(200, ((b"content-type", b"application/json"),), body)
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache__lru_eviction():
+    backend = InMemoryCache(max_entries=2)
+    for key in ("a", "b"):
+        await backend.set("view", key, _entry(), ttl=60)
+    assert await backend.get("view", "a") is not None
+    await backend.set("view", "c", _entry(), ttl=60)
+    assert await backend.get("view", "b") is None
+    assert await backend.get("view", "a") is not None
+    assert len(backend) == 2
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache__ttl_size_and_invalidation():
+    backend = InMemoryCache(max_bytes=4)
+    await backend.set("view", "expired", _entry(b"1"), ttl=-1)
+    assert await backend.get("view", "expired") is None
+    await backend.set("view", "large", _entry(b"12345"), ttl=60)
+    assert await backend.get("view", "large") is None
+    await backend.set("view", "a", _entry(b"12"), ttl=60)
+    await backend.set("other", "a", _entry(b"12"), ttl=60)
+    await backend.invalidate("view")
+    assert await backend.get("view", "a") is None
+    assert await backend.get("other", "a") is not None
+
+
+def test_cache__parse():
+    assert Cache.parse(None) is None
+    assert Cache.parse(5) == Cache(ttl=5)
+    policy = Cache(ttl=1, vary=("authorization",))
+    assert Cache.parse(policy) is policy
+    assert Cache().vary == ("authorization", "cookie")
+
+
+def _authenticate(authorization: str = Header("")) -> str:
+    if authorization != "secret":
+        raise HTTPException(401)
+    return authorization
+
+
+def test_view__cache_hits_run_dependencies():
+    app = FastAPI()
+    calls = []
+
+    @View(app)
+    class SecretView:
+        DEPENDENCIES = {"common": [Depends(_authenticate)]}
+        CACHE = {"get": Cache(ttl=60, vary=(), backend=InMemoryCache())}
+
+        def get(self):
+            calls.append(1)
+            return {"secret": "data"}
+
+    client = TestClient(app)
+    assert client.get("/", headers={"authorization": "secret"}).json() == {"secret": "data"}
+    assert client.get("/").status_code == 401
+    assert client.get("/", headers={"authorization": "secret"}).json() == {"secret": "data"}
+    assert calls == [1]
+
+
+async def _slow_authenticate(authorization: str = Header("")) -> str:
+    await asyncio.sleep(0.05)
+    return _authenticate(authorization)
+
+
+@pytest.mark.asyncio
+async def test_view__waiters_of_a_failed_fill_run_the_method():
+    app = FastAPI()
+
+    @View(app)
+    class SecretView:
+        DEPENDENCIES = {"get": [Depends(_slow_authenticate)]}
+        CACHE = {"get": Cache(ttl=60, vary=(), backend=InMemoryCache())}
+
+        async def get(self):
+            return {"secret": "data"}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        anonymous, authenticated = await asyncio.gather(
+            client.get("/"),
+            client.get("/", headers={"authorization": "secret"}),
+        )
+    assert anonymous.status_code == 401
+    assert authenticated.json() == {"secret": "data"}
+
+
+def test_view__cached_get_and_invalidation():
+    app = FastAPI()
+    calls = []
+
+    @View(app)
+    class ItemView:
+        CACHE = {"get": Cache(ttl=60, vary=("authorization",), backend=InMemoryCache())}
+
+        async def get(self, q: str = ""):
+            calls.append(q)
+            return {"calls": len(calls)}
+
+        async def post(self):
+            return {}
+
+        @endpoint("get", path="cookie", cache=60)
+        async def cookie(self, response: Response):
+            calls.append("cookie")
+            response.set_cookie("session", "secret")
+            return {}
+
+    client = TestClient(app)
+    assert client.get("/").json() == {"calls": 1}
+    assert client.get("/").json() == {"calls": 1}
+    assert client.get("/", params={"q": "x"}).json() == {"calls": 2}
+    assert client.get("/", headers={"authorization": "other"}).json() == {"calls": 3}
+    client.post("/")
+    assert client.get("/").json() == {"calls": 4}
+    client.get("/cookie")
+    client.get("/cookie")
+    assert calls.count("cookie") == 2
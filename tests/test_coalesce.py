@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import Depends, FastAPI, Header, HTTPException, Response
+
+from fastapi_class import Coalesce, View, endpoint
+
+
+def test_coalesce__parse():
+    assert Coalesce.parse(None) is None
+    assert Coalesce.parse(False) is None
+    assert Coalesce.parse(True) == Coalesce()
+    policy = Coalesce(vary=("authorization",))
+    assert Coalesce.parse(policy) is policy
+
+
+@pytest.fixture(name="calls")
+def fixture_calls():
+    return []
+
+
+@pytest.fixture(name="client")
+def fixture_client(calls: list):
+    app = FastAPI()
+
+    @View(app)
+    class ReportView:
+        @endpoint("get", path="report", coalesce=True)
+        async def report(self, q: str = ""):
+            calls.append(q)
+            await asyncio.sleep(0.05)
+            return {"calls": len(calls)}
+
+        @endpoint("get", path="failure", coalesce=True)
+        async def failure(self):
+            calls.append("failure")
+            await asyncio.sleep(0.05)
+            raise HTTPException(503, "unavailable")
+
+        @endpoint("get", path="cookie", coalesce=Coalesce(vary=("authorization",)))
+        async def cookie(self, response: Response):
+            calls.append("cookie")
+            await asyncio.sleep(0.05)
+            response.set_cookie("session", "secret")
+            return {}
+
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test")
+
+
+@pytest.mark.asyncio
+async def test_view__coalesces_identical_concurrent_requests(client: httpx.AsyncClient, calls: list):
+    responses = await asyncio.gather(
+        *(client.get("/report") for _ in range(5)),
+        client.get("/report", params={"q": "other"}),
+    )
+    assert len({response.content for response in responses[:5]}) == 1
+    assert sorted(calls) == ["", "other"]
+    assert (await client.get("/report")).json() == {"calls": 3}
+
+
+@pytest.mark.asyncio
+async def test_view__failures_are_not_shared(client: httpx.AsyncClient, calls: list):
+    responses = await asyncio.gather(*(client.get("/failure") for _ in range(3)))
+    assert [response.status_code for response in responses] == [503] * 3
+    assert calls == ["failure"] * 3
+
+
+@pytest.mark.asyncio
+async def test_view__responses_setting_cookies_are_not_shared(client: httpx.AsyncClient, calls: list):
+    await asyncio.gather(*(client.get("/cookie") for _ in range(3)))
+    assert calls == ["cookie"] * 3
+
+
+def _authenticate(authorization: str = Header("")) -> str:
+    if authorization != "secret":
+        raise HTTPException(401)
+    return authorization
+
+
+@pytest.mark.asyncio
+async def test_view__waiters_run_their_dependencies():
+    app = FastAPI()
+    calls = []
+
+    @View(app)
+    class SecretView:
+        DEPENDENCIES = {"common": [Depends(_authenticate)]}
+
+        @endpoint("get", coalesce=Coalesce(vary=()))
+        async def get(self):
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return {"secret": 1}
+
+    assert Coalesce().vary == ("authorization", "cookie")
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        authenticated, anonymous, other = await asyncio.gather(
+            client.get("/", headers={"authorization": "secret"}),
+            client.get("/"),
+            client.get("/", headers={"authorization": "secret"}),
+        )
+    assert authenticated.json() == other.json() == {"secret": 1}
+    assert anonymous.status_code == 401
+    assert calls == [1]
+
+
+async def _slow_authenticate(authorization: str = Header("")) -> str:
+    await asyncio.sleep(0.05)
+    return _authenticate(authorization)
+
+
+@pytest.mark.asyncio
+async def test_view__waiters_of_a_failed_leader_run_the_method():
+    app = FastAPI()
+
+    @View(app)
+    class SecretView:
+        DEPENDENCIES = {"get": [Depends(_slow_authenticate)]}
+
+        @endpoint("get", coalesce=Coalesce(vary=()))
+        async def get(self):
+            return {"secret": 1}
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        anonymous, authenticated = await asyncio.gather(
+            client.get("/"),
+            client.get("/", headers={"authorization": "secret"}),
+        )
+    assert anonymous.status_code == 401
+    assert authenticated.json() == {"secret": 1}
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+import gzip
+
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from fastapi_class import Cache, Compress, InMemoryCache, View, endpoint
+from fastapi_class.compression import accepted_encodings
+
+
+def _request(accept_encoding: str | None) -> Request:
+    headers = [(b"accept-encoding", accept_encoding.encode())] if accept_encoding is not None else []
+    return Request({"type": "http", "method": "GET", "path": "/", "query_string": b"", "headers": headers})
+
+
+def test_accepted_encodings__parses_quality_values():
+    assert accepted_encodings("gzip, br;q=0.5, zstd;q=x, ") == {"gzip": 1.0, "br": 0.5, "zstd": 0.0}
+
+
+def test_compress__negotiates_preferred_available_coding():
+    compress = Compress(encodings=("br", "gzip"))
+    assert compress.negotiate(_request("gzip;q=0.5, unknown")) == "gzip"
+    assert compress.negotiate(_request("gzip;q=0")) == "identity"
+    assert compress.negotiate(_request("*")) in ("br", "gzip")
+    assert compress.negotiate(_request(None)) == "identity"
+    assert Compress(encodings=()).negotiate(_request("gzip")) == "identity"
+
+
+def test_compress__parse():
+    assert Compress.parse(True) == Compress()
+    assert Compress.parse(1024) == Compress(minimum_size=1024)
+    assert Compress.parse(False) is None
+    assert Compress.parse(None) is None
+
+
+def test_view__compresses_large_responses():
+    app = FastAPI()
+
+    @View(app, compress=100)
+    class ReportView:
+        async def get(self):
+            return {"rows": ["row"] * 100}
+
+        @endpoint("get", path="small")
+        async def small(self):
+            return {"rows": []}
+
+        @endpoint("get", path="text", response_class=PlainTextResponse, compress=False)
+        async def text(self):
+            return "text" * 100
+
+    client = TestClient(app)
+    response = client.get("/", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.json() == {"rows": ["row"] * 100}
+    identity = client.get("/", headers={"accept-encoding": "identity"})
+    assert "content-encoding" not in identity.headers
+    assert identity.headers["vary"] == "Accept-Encoding"
+    assert "content-encoding" not in client.get("/small", headers={"accept-encoding": "gzip"}).headers
+    assert "content-encoding" not in client.get("/text", headers={"accept-encoding": "gzip"}).headers
+
+
+def test_view__caches_compressed_variants():
+    app = FastAPI()
+    backend = InMemoryCache()
+    calls = 0
+
+    @View(app)
+    class ReportView:
+        @endpoint("get", cache=Cache(ttl=60, backend=backend), compress=True)
+        async def get(self):
+            nonlocal calls
+            calls += 1
+            return {"rows": ["row"] * 200}
+
+    client = TestClient(app)
+    for _ in range(2):
+        assert client.get("/", headers={"accept-encoding": "gzip"}).headers["content-encoding"] == "gzip"
+        assert "content-encoding" not in client.get("/", headers={"accept-encoding": "identity"}).headers
+    assert calls == 2
+    assert len(backend) == 2
+    stored = [entry for _, entry in backend._entries.values()]
+    assert any(gzip.decompress(entry.body) for entry in stored if (b"content-encoding", b"gzip") in entry.headers)
@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+from fastapi import FastAPI, HTTPException
+
+from fastapi_class import MetricsRegistry, PrometheusExporter, View, endpoint
+from fastapi_class.concurrency import ConcurrencyLimiter, SingleFlight
+
+
+@pytest.mark.asyncio
+async def test_single_flight__shares_result_between_concurrent_calls():
+    flight: SingleFlight[int] = SingleFlight()
+    calls = 0
+
+    async def function():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+
+    assert await asyncio.gather(*(flight.do("key", function) for _ in range(5))) == [1] * 5
+    assert len(flight) == 0
+    assert await flight.do("key", function) == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight__propagates_exceptions_to_waiters():
+    flight: SingleFlight[None] = SingleFlight()
+
+    async def function():
+        await asyncio.sleep(0.01)
+        raise ValueError("boom")
+
+    results = await asyncio.gather(*(flight.do("key", function) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_single_flight__waiters_retry_when_leader_is_cancelled():
+    flight: SingleFlight[str] = SingleFlight()
+    started = asyncio.Event()
+
+    async def slow():
+        started.set()
+        await asyncio.sleep(10)
+        return "slow"  # pragma: no cover
+
+    async def fast():
+        return "fast"
+
+    leader = asyncio.create_task(flight.do("key", slow))
+    await started.wait()
+    waiter = asyncio.create_task(flight.do("key", fast))
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await waiter == "fast"
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter__queues_in_order_and_rejects_when_full():
+    limiter = ConcurrencyLimiter(1, queue_limit=1)
+    order = []
+
+    async def run(name: str):
+        await limiter.acquire()
+        order.append(name)
+        await asyncio.sleep(0.01)
+        limiter.release()
+
+    first, second = asyncio.create_task(run("first")), asyncio.create_task(run("second"))
+    await asyncio.sleep(0)
+    assert (limiter.active, limiter.queued) == (1, 1)
+    with pytest.raises(HTTPException) as exc_info:
+        await limiter.acquire()
+    assert exc_info.value.status_code == 503
+    await asyncio.gather(first, second)
+    assert order == ["first", "second"]
+    assert (limiter.active, limiter.queued, limiter.rejected) == (0, 0, 1)
+
+
+@pytest.mark.asyncio
+async def test_concurrency_limiter__queue_timeout_and_cancellation():
+    limiter = ConcurrencyLimiter(1, queue_timeout=0.01)
+    await limiter.acquire()
+    with pytest.raises(HTTPException):
+        await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert limiter.queued == 0
+    limiter.release()
+    assert limiter.active == 0
+    assert limiter.rejected == 1
+
+
+@pytest.mark.asyncio
+async def test_view__concurrency_limits():
+    app = FastAPI()
+    metrics = MetricsRegistry()
+    running = []
+
+    @View(app, max_concurrency=1, queue_limit=0, instrument=metrics)
+    class ReportView:
+        async def get(self):
+            running.append(True)
+            await asyncio.sleep(0.05)
+
+        @endpoint("get", path="queued", queue_limit=10)
+        async def queued(self):
+            await asyncio.sleep(0.01)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
+        responses = await asyncio.gather(*(client.get("/") for _ in range(3)))
+        assert sorted(response.status_code for response in responses) == [200, 503, 503]
+        responses = await asyncio.gather(*(client.get("/queued") for _ in range(3)))
+        assert [response.status_code for response in responses] == [200] * 3
+
+    assert metrics["Get Report"].limiter.rejected == 2
+    assert "503" in app.openapi()["paths"]["/"]["get"]["responses"]
+    assert 'fastapi_class_requests_rejected_total{route="Get Report"' in PrometheusExporter().render(metrics)
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_class import Cache, ETag, View, endpoint
+from fastapi_class.conditional import entity_tag, etag_matches, not_modified_since
+
+
+def test_etag_matches__uses_weak_comparison():
+    tag = entity_tag(b"body")
+    assert etag_matches(tag, tag)
+    assert etag_matches(f'"other", W/{tag}', tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches('"other"', tag)
+    assert entity_tag(b"body", weak=True) == "W/" + tag
+
+
+def test_not_modified_since__compares_seconds():
+    modified = datetime(2024, 1, 1, 12, 0, 0, 500, tzinfo=timezone.utc)
+    assert not_modified_since("Mon, 01 Jan 2024 12:00:00 GMT", modified)
+    assert not not_modified_since("Mon, 01 Jan 2024 11:59:59 GMT", modified)
+    assert not not_modified_since("not a date", modified)
+
+
+def test_view__etag_from_body_answers_304():
+    app = FastAPI()
+    calls = 0
+
+    @View(app)
+    class ItemView:
+        ETAG = {"get": True}
+
+        async def get(self):
+            nonlocal calls
+            calls += 1
+            return {"id": 1}
+
+        async def post(self):
+            return {"id": 1}
+
+    client = TestClient(app)
+    response = client.get("/")
+    etag = response.headers["etag"]
+    assert etag == entity_tag(response.content)
+    not_modified = client.get("/", headers={"if-none-match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+    assert not_modified.headers["etag"] == etag
+    assert client.get("/", headers={"if-none-match": '"stale"'}).status_code == 200
+    assert "etag" not in client.post("/").headers
+    assert calls == 3
+
+
+def test_view__etag_version_skips_method():
+    app = FastAPI()
+    version = "1"
+    modified = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    calls = 0
+
+    async def last_modified(request):
+        return modified
+
+    @View(app)
+    class ItemView:
+        @endpoint(
+            "get",
+            path="items",
+            etag=ETag(weak=True, version=lambda request: version, last_modified=last_modified),
+            cache=Cache(ttl=60),
+        )
+        def items(self):
+            nonlocal calls
+            calls += 1
+            return [1, 2]
+
+    client = TestClient(app)
+    response = client.get("/items")
+    etag = response.headers["etag"]
+    assert etag.startswith("W/")
+    assert response.headers["last-modified"] == "Mon, 01 Jan 2024 00:00:00 GMT"
+    assert client.get("/items", headers={"if-none-match": etag}).status_code == 304
+    assert client.get("/items", headers={"if-modified-since": response.headers["last-modified"]}).status_code == 304
+    version = "2"
+    assert client.get("/items", headers={"if-none-match": etag}).status_code == 200
+    assert calls == 1
+
+
+def test_view__etag_declares_304_in_openapi():
+    app = FastAPI()
+
+    @View(app)
+    class ItemView:
+        @endpoint("get", etag=True)
+        async def get(self):
+            return {}
+
+    assert "304" in app.openapi()["paths"]["/"]["get"]["responses"]
@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi.testclient import TestClient
+
+from fastapi_class import Profiler, View, memoize
+
+_introspected: list[str] = []
+
+
+def _introspect(authorization: str = Header()):
+    _introspected.append(authorization)
+    return {"user": authorization}
+
+
+_current_user = memoize(_introspect, ttl=60)
+
+
+def test_memoize__caches_results_per_arguments():
+    app = FastAPI()
+
+    @app.get("/")
+    async def get(user: Annotated[dict, Depends(_current_user)]):
+        return user
+
+    client = TestClient(app)
+    assert client.get("/", headers={"authorization": "a"}).json() == {"user": "a"}
+    assert client.get("/", headers={"authorization": "a"}).json() == {"user": "a"}
+    assert client.get("/", headers={"authorization": "b"}).json() == {"user": "b"}
+    assert _introspected == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_memoize__expires_evicts_and_deduplicates():
+    calls: list[int] = []
+
+    async def load(value: int):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    cached = memoize(load, ttl=60, max_entries=2)
+    assert await asyncio.gather(cached(value=1), cached(value=1)) == [2, 2]
+    await cached(value=2)
+    await cached(value=3)
+    await cached(value=1)
+    assert calls == [1, 2, 3, 1]
+
+    expired = memoize(load, ttl=0)
+    await expired(value=4)
+    await expired(value=4)
+    assert calls[-2:] == [4, 4]
+
+
+def test_memoize__custom_key_and_generators():
+    def load(values: list[int]):
+        return sum(values)
+
+    cached = memoize(load, ttl=60, key=lambda values: tuple(values))
+    assert asyncio.run(cached(values=[1, 2])) == 3
+
+    def session():
+        yield None
+
+    with pytest.raises(TypeError, match="teardown"):
+        memoize(session, ttl=60)
+
+
+def test_view__dependencies_run_once_per_request():
+    calls: list[str] = []
+
+    def authenticate(authorization: str = Header()):
+        calls.append(authorization)
+        if authorization != "secret":
+            raise HTTPException(401)
+        return authorization
+
+    def require_admin(token: str = Depends(authenticate)):
+        calls.append("admin")
+
+    app = FastAPI()
+
+    class ItemView:
+        DEPENDENCIES = {"common": [Depends(authenticate)], "delete": [Depends(require_admin)]}
+
+        async def get(self, token: str = Depends(authenticate)):
+            return {"token": token}
+
+        async def post(self):
+            return {}
+
+        async def delete(self):
+            return {}
+
+    View(app, profile=Profiler(rate=0.0), profile_path="/_profile")(ItemView)
+    View(app, path="/items", batch=True)(ItemView)
+    client = TestClient(app)
+    headers = {"authorization": "secret"}
+    assert client.get("/", headers=headers).json() == {"token": "secret"}
+    assert calls == ["secret"]
+    assert client.delete("/", headers=headers).status_code == 200
+    assert calls == ["secret", "secret", "admin"]
+    assert client.post("/").status_code == 422
+    assert client.post("/", headers={"authorization": "wrong"}).status_code == 401
+    assert client.get("/_profile").status_code == 422
+    assert client.post("/items/batch", json=[{"method": "post"}], headers=headers).status_code == 200
+    assert client.post("/items/batch", json=[{"method": "delete"}], headers=headers).status_code == 422
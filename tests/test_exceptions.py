@@ -1,13 +1,19 @@
 from __future__ import annotations
 
+import json
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
 
 from fastapi_class.exception import (
     UNKOWN_SERVER_ERROR_DETAIL,
     ExceptionAbstract,
     FormattedMessageException,
+    PreparedHTTPException,
+    prepared_exception_handler,
 )
 
 
@@ -34,3 +40,50 @@ def test_formatted_message_factory__format_string(arg: str | int | float | bool)
 def test_formatted_message_factory__format_string__missing_key():
     _instance = FormattedMessageException(exceptions=((500, "Test {test}"),))
     assert _instance().detail == "Test {test}"
+
+
+def test_formatted_message_factory__compiled_static_detail_is_encoded_once():
+    _instance = FormattedMessageException(exceptions=((401, "Not {{authorized}}"),), compiled=True)
+    first, second = _instance(), _instance(user="ignored")
+    assert isinstance(first, PreparedHTTPException)
+    assert first.detail == second.detail == "Not {authorized}"
+    assert first.body is second.body
+    assert json.loads(first.body) == {"detail": "Not {authorized}"}
+
+
+def test_formatted_message_factory__compiled_template():
+    _instance = FormattedMessageException(exceptions=((404, "Item {item_id} not found"),), compiled=True)
+    assert json.loads(_instance(item_id=1).body) == {"detail": "Item 1 not found"}
+    assert _instance().detail == "Item {item_id} not found"
+
+
+def test_formatted_message_factory__compiled_template_matches_str_format():
+    template = 'Item {item.id!r:>5} "{name}" costs {price:.2f}\n'
+    _instance = FormattedMessageException(exceptions=((404, template),), compiled=True)
+    kwargs = {"item": SimpleNamespace(id=7), "name": "é\\", "price": 1.5}
+    exception = _instance(**kwargs)
+    assert exception.detail == template.format(**kwargs)
+    assert (
+        exception.body == json.dumps({"detail": exception.detail}, ensure_ascii=False, separators=(",", ":")).encode()
+    )
+    nested = FormattedMessageException(exceptions=((404, "{price:{width}}"),), compiled=True)
+    assert nested(price=1, width=3).detail == "  1"
+
+
+@pytest.mark.parametrize("status_code", (404, 304))
+def test_prepared_exception_handler(status_code: int):
+    app = FastAPI()
+    app.add_exception_handler(PreparedHTTPException, prepared_exception_handler)
+    _instance = FormattedMessageException(exceptions=((status_code, "Item {item_id} not found"),), compiled=True)
+
+    @app.get("/{item_id}")
+    async def get(item_id: int):
+        raise _instance(item_id=item_id)
+
+    response = TestClient(app).get("/3")
+    assert response.status_code == status_code
+    if status_code == 404:
+        assert response.json() == {"detail": "Item 3 not found"}
+        assert response.headers["content-type"] == "application/json"
+    else:
+        assert response.content == b""
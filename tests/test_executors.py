@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import os
+from contextlib import asynccontextmanager
+
+import pytest
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from fastapi_class import ProcessExecutor, View, endpoint
+from fastapi_class.executors import check_process_endpoint, process_endpoint, shutdown_on_exit
+from fastapi_class.signature import typed_signature
+
+
+class Digest(BaseModel):
+    pid: int
+    total: int
+
+
+app = FastAPI()
+executor = ProcessExecutor(max_workers=1)
+
+
+@View(app, process_executor=executor)
+class DigestView:
+    factor = 3
+
+    @endpoint("get", path="digest", executor="process", response_model=Digest)
+    def digest(self, n: int):
+        return {"pid": os.getpid(), "total": sum(range(n)) * self.factor, "extra": True}
+
+    @endpoint("get", path="local")
+    def local(self):
+        return {"pid": os.getpid()}
+
+
+def test_view__runs_process_endpoint_in_worker():
+    with TestClient(app) as client:
+        response = client.get("/digest", params={"n": 10})
+        assert response.status_code == 200
+        assert response.json()["total"] == 135
+        assert "extra" not in response.json()
+        assert response.json()["pid"] != os.getpid()
+        assert client.get("/local").json()["pid"] == os.getpid()
+        assert client.get("/digest").status_code == 422
+    executor.shutdown()
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    yield
+
+
+def test_view__owns_and_shuts_down_default_executor():
+    _app = FastAPI(lifespan=lifespan)
+    View(_app)(DigestView)
+    route = next(route for route in _app.routes if getattr(route, "path", None) == "/digest")
+    assert route.endpoint.__name__ == "digest"
+    assert _app.router.lifespan_context is not lifespan
+
+
+def test_shutdown_on_exit__runs_with_application_lifespan():
+    _app = FastAPI(lifespan=lifespan)
+    _executor = ProcessExecutor(max_workers=1)
+    shutdown_on_exit(_app.router, _executor)
+    with TestClient(_app):
+        assert _executor.pool is not None
+    assert _executor._pool is None
+
+
+def test_view__rejects_process_endpoint_with_request_scope():
+    class ScopedView:
+        @endpoint("get", executor="process")
+        def get(self):
+            return 1
+
+    with pytest.raises(ValueError, match="request scope"):
+        View(FastAPI(), instance_scope="request")(ScopedView)
+
+
+def test_check_process_endpoint__rejects_unsupported_functions():
+    async def coroutine():
+        return 1
+
+    def needs_request(request: Request):
+        return request
+
+    def local():
+        return 1
+
+    for function, message in ((coroutine, "sync function"), (needs_request, "Request"), (local, "module level")):
+        with pytest.raises(TypeError, match=message):
+            check_process_endpoint(function, typed_signature(function))
+
+
+def test_process_endpoint__keeps_signature():
+    function = process_endpoint(DigestView().digest, ProcessExecutor())
+    assert list(typed_signature(function).parameters) == ["n"]
+    assert function.__name__ == "digest"
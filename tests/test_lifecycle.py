@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import inspect
+from typing import TYPE_CHECKING, Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_class import View, endpoint
+from fastapi_class.lifecycle import InstancePool, class_dependencies, request_scoped_endpoint
+
+if TYPE_CHECKING:
+    from sqlite3 import Connection
+
+
+def get_user(token: str = "anonymous") -> str:
+    return token
+
+
+class Counter:
+    def __init__(self) -> None:
+        self.calls = 0
+        self.resets = 0
+
+    def reset(self) -> None:
+        self.resets += 1
+
+
+def test_instance_pool__without_size_builds_new_instances():
+    pool = InstancePool(Counter)
+    instance = pool.acquire()
+    pool.release(instance)
+    assert pool.acquire() is not instance
+    assert instance.resets == 0
+
+
+def test_instance_pool__reuses_and_resets_released_instances():
+    pool = InstancePool(Counter, size=1)
+    first, second = pool.acquire(), pool.acquire()
+    pool.release(first)
+    pool.release(second)
+    assert first.resets == 1
+    assert second.resets == 0
+    assert pool.acquire() is first
+
+
+def test_class_dependencies__attributes_and_annotations():
+    class SlottedView:
+        __slots__ = ("user",)
+        user: Annotated[str, Depends(get_user)]
+
+    class AttributeView:
+        user: str = Depends(get_user)
+        other = Depends(get_user)
+        plain: int = 1
+
+    assert list(class_dependencies(SlottedView)) == ["user"]
+    assert sorted(class_dependencies(AttributeView)) == ["other", "user"]
+
+
+def test_class_dependencies__unresolvable_annotations():
+    class TypeCheckingView:
+        connection: Connection = Depends(get_user)
+        user: Annotated[str, Depends(get_user)]
+
+    dependencies = class_dependencies(TypeCheckingView)
+    assert sorted(dependencies) == ["connection", "user"]
+    assert dependencies["connection"].annotation is inspect.Parameter.empty
+
+
+def test_request_scoped_endpoint__collision():
+    class CollisionView:
+        user: str = Depends(get_user)
+
+        async def get(self, user: str):
+            pass  # pragma: no cover
+
+    with pytest.raises(ValueError):
+        request_scoped_endpoint(CollisionView.get, InstancePool(CollisionView), class_dependencies(CollisionView))
+
+
+def test_view__request_scope_resolves_class_dependencies():
+    app = FastAPI()
+    instances = set()
+
+    @View(app, instance_scope="request")
+    class UserView:
+        user: str = Depends(get_user)
+
+        async def get(self, suffix: str = ""):
+            instances.add(id(self))
+            return {"user": self.user + suffix}
+
+        @endpoint("post", path="sync")
+        def sync(self):
+            return {"user": self.user}
+
+    client = TestClient(app)
+    assert client.get("/", params={"token": "alice", "suffix": "!"}).json() == {"user": "alice!"}
+    assert client.get("/").json() == {"user": "anonymous"}
+    assert client.post("/sync", params={"token": "bob"}).json() == {"user": "bob"}
+    assert len(instances) == 2
+
+
+def test_view__request_scope_pool_with_slots():
+    app = FastAPI()
+    instances = []
+
+    @View(app, instance_scope="request", pool_size=4)
+    class SlottedView:
+        __slots__ = ("user", "seen")
+        user: Annotated[str, Depends(get_user)]
+
+        def __init__(self) -> None:
+            self.seen = 0
+
+        def reset(self) -> None:
+            self.seen = 0
+
+        async def get(self):
+            instances.append(self)
+            self.seen += 1
+            return {"user": self.user, "seen": self.seen}
+
+    client = TestClient(app)
+    assert client.get("/", params={"token": "alice"}).json() == {"user": "alice", "seen": 1}
+    assert client.get("/").json() == {"user": "anonymous", "seen": 1}
+    assert instances[0] is instances[1]
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+import gc
+import pickle
+import weakref
+from dataclasses import FrozenInstanceError
 from typing import Any
 
 import pytest
@@ -31,35 +35,61 @@ def fixture_metadata(metadata_factory: Factory[Metadata]):
     return metadata_factory()
 
 
-def test_metadata_dynamic_optional_fields__get_when_field_exist(metadata: Metadata):
-    assert metadata.methods == ["GET"]
+def test_metadata__stores_fields(metadata: Metadata):
+    assert metadata.methods == frozenset({"GET"})
     assert metadata.name == "test"
     assert metadata.status_code == 200
     assert metadata.response_model == BaseModel
     assert metadata.response_class == Response
 
 
-def test_metadata_dynamic_optional_fields__raise_when_field_doesnt_exist(
-    metadata: Metadata,
-):
+def test_metadata__is_immutable_and_slotted(metadata: Metadata):
+    with pytest.raises(FrozenInstanceError):
+        metadata.name = "other"  # type: ignore[misc]
     with pytest.raises(AttributeError):
-        metadata.non_existing
-    with pytest.raises(AttributeError):
-        metadata.or_default
+        metadata.non_existing  # type: ignore[attr-defined]
+    assert not hasattr(metadata, "__dict__")
+
+
+def test_metadata__is_hashable_and_comparable(metadata_factory: Factory[Metadata]):
+    first, second = metadata_factory(), metadata_factory({"methods": ("GET",)})
+    assert first == second
+    assert hash(first) == hash(second)
+    assert first != metadata_factory({"name": "other"})
+    assert len({first, second}) == 1
+    assert pickle.loads(pickle.dumps(first)) == first
+
 
+def test_metadata__intern_shares_equal_instances(metadata_factory: Factory[Metadata]):
+    first = metadata_factory().intern()
+    assert metadata_factory().intern() is first
 
-def test_metadata_dynamic_optional_fields_default__when_field_exists(
-    metadata_factory: Factory[Metadata],
-):
-    metadata = metadata_factory({"name": "", "methods": [], "status_code": None})
 
-    assert metadata.name_or_default("test") == "test"
-    assert metadata.methods_or_default(["test"]) == ["test"]
-    assert metadata.status_code_or_default(123) == 123
+def test_metadata__intern_frees_unused_instances(metadata_factory: Factory[Metadata]):
+    metadata = metadata_factory({"name": "interned once"}).intern()
+    reference = weakref.ref(metadata)
+    del metadata
+    gc.collect()
+    assert reference() is None
 
 
-def test_metadata_dynamic_optional_fields_default__when_field_doesnt_exist(
-    metadata: Metadata,
-):
+def test_metadata__resolve_falls_back_on_unset_fields(metadata_factory: Factory[Metadata]):
+    metadata = metadata_factory({"name": "", "status_code": None})
+
+    assert metadata.resolve("name", "test") == ""
+    assert metadata.resolve("status_code", 123) == 123
     with pytest.raises(AttributeError):
-        metadata.non_existing_or_default("test")
+        metadata.resolve("non_existing", "test")
+
+
+def test_metadata__merge_keeps_set_fields(metadata_factory: Factory[Metadata]):
+    metadata = metadata_factory({"status_code": None, "path": None})
+    defaults = Metadata((), status_code=201, path="defaults", max_concurrency=2)
+
+    merged = metadata.merge(defaults, path="class", name="class")
+    assert merged.status_code == 201
+    assert merged.path == "class"
+    assert merged.name == "test"
+    assert merged.max_concurrency == 2
+    assert merged.methods == metadata.methods
+    assert metadata.merge() is metadata
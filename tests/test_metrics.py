@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import FastAPI, HTTPException
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+
+from fastapi_class import View
+from fastapi_class.metrics import EndpointMetrics, MetricsRegistry, PrometheusExporter, add_metrics_route
+from fastapi_class.route import ViewRoute
+
+
+class ItemView:
+    async def get(self):
+        return {"item": 1}
+
+    async def delete(self):
+        raise HTTPException(404, "missing")
+
+
+def test_endpoint_metrics__observe_buckets():
+    metrics = EndpointMetrics("Get Item", "ItemView", "get", bounds=(0.1, 1.0))
+    for seconds in (0.05, 0.1, 0.5, 2.0):
+        metrics.observe(seconds)
+    assert metrics.calls == 4
+    assert metrics.buckets == [2, 1, 1]
+    assert metrics.latency_sum == pytest.approx(2.65)
+
+
+def test_view__instrument_records_calls_and_exceptions():
+    app = FastAPI()
+    metrics = MetricsRegistry()
+    View(app, instrument=metrics)(ItemView)
+    client = TestClient(app)
+    client.get("/")
+    client.get("/")
+    client.delete("/")
+    assert metrics["Get Item"].calls == 2
+    assert metrics["Get Item"].exceptions == 0
+    assert metrics["Delete Item"].calls == 1
+    assert metrics["Delete Item"].exceptions == 1
+    assert metrics["Delete Item"].in_flight == 0
+
+
+def test_view__not_instrumented_keeps_default_route_class():
+    app = FastAPI()
+    View(app)(ItemView)
+    assert {type(route) for route in app.routes if isinstance(route, APIRoute)} == {APIRoute}
+    View(app, path="/instrumented", instrument=MetricsRegistry())(ItemView)
+    assert any(isinstance(route, ViewRoute) for route in app.routes)
+
+
+def test_prometheus_exporter__route():
+    app = FastAPI()
+    metrics = MetricsRegistry(buckets=(1.0,))
+    View(app, instrument=metrics)(ItemView)
+    add_metrics_route(app, registry=metrics)
+    client = TestClient(app)
+    client.get("/")
+    response = client.get("/metrics")
+    assert response.headers["content-type"] == PrometheusExporter.media_type
+    labels = 'route="Get Item",view="ItemView",method="get"'
+    assert f'fastapi_class_request_duration_seconds_bucket{{{labels},le="+Inf"}} 1' in response.text
+    assert f"fastapi_class_request_duration_seconds_count{{{labels}}} 1" in response.text
+    assert f"fastapi_class_exceptions_total{{{labels}}} 0" in response.text
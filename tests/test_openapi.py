@@ -1,7 +1,12 @@
+import asyncio
+import pickle
+
 import pytest
-from fastapi import HTTPException
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.testclient import TestClient
 
 from fastapi_class import ExceptionModel, _exceptions_to_responses
+from fastapi_class.openapi import INTERNED_RESPONSES_SIZE, _interned_responses, cache_openapi
 
 
 def test_exceptions_to_responses__exception():
@@ -36,3 +41,62 @@ def test_exceptions_to_response__broad_exception():
 @pytest.mark.parametrize("data", ("test", 5, 3.14, (1, 2, 3)))
 def test_exception_to_response__random_data(data):
     assert _exceptions_to_responses({data}) == {400: {"description": str(data), "model": ExceptionModel}}
+
+
+def test_exceptions_to_responses__interned_for_same_exceptions():
+    exceptions = (HTTPException(401, "unauthorized"), lambda: HTTPException(404, "missing"))
+    responses = _exceptions_to_responses(exceptions)
+    assert _exceptions_to_responses(list(exceptions)) is responses
+    assert _exceptions_to_responses(exceptions[:1]) is not responses
+
+
+def test_exceptions_to_responses__interning_is_bounded():
+    for index in range(INTERNED_RESPONSES_SIZE + 1):
+        _exceptions_to_responses((HTTPException(400, f"bounded {index}"),))
+    assert _interned_responses.cache_info().currsize <= INTERNED_RESPONSES_SIZE
+
+
+def test_exceptions_to_responses__read_only():
+    responses = _exceptions_to_responses((HTTPException(400, "frozen"),))
+    with pytest.raises(TypeError):
+        responses[500] = {}
+    with pytest.raises(TypeError):
+        responses[400]["description"] = "changed"
+    assert pickle.loads(pickle.dumps(responses)) == responses
+
+
+def test_exceptions_to_responses__unhashable_exceptions_are_not_cached():
+    assert _exceptions_to_responses([["unhashable"]]) == {
+        400: {"description": "['unhashable']", "model": ExceptionModel}
+    }
+
+
+def test_cache_openapi__serves_encoded_schema_until_invalidated():
+    app = FastAPI()
+
+    @app.get("/items")
+    async def items():
+        pass  # pragma: no cover
+
+    cache_openapi(app)
+    client = TestClient(app)
+    first = client.get("/openapi.json")
+    assert first.json() == app.openapi()
+    assert client.get("/openapi.json").content == first.content
+    assert first.headers["content-type"] == "application/json"
+    route = next(route for route in app.routes if getattr(route, "path", None) == "/openapi.json")
+    request = Request({"type": "http", "root_path": ""})
+    assert asyncio.run(route.endpoint(request)) is not asyncio.run(route.endpoint(request))
+    assert sum(getattr(route, "path", None) == "/openapi.json" for route in app.routes) == 1
+
+    @app.get("/users")
+    async def users():
+        pass  # pragma: no cover
+
+    app.openapi_schema = None
+    assert "/users" in client.get("/openapi.json").json()["paths"]
+
+
+def test_cache_openapi__without_openapi_url():
+    with pytest.raises(ValueError):
+        cache_openapi(FastAPI(openapi_url=None))
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI, HTTPException
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from fastapi_class import PageRequest, Paginator, View
+from fastapi_class.pagination import CursorSigner
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+ROWS = [{"id": index, "name": f"item-{index}"} for index in range(1, 8)]
+estimates: list[int] = []
+
+
+def _estimate() -> int:
+    estimates.append(1)
+    return 7
+
+
+def _fetch(page: PageRequest) -> list[dict]:
+    after = page.after[0] if page.after is not None else 0
+    return [row for row in ROWS if row["id"] > after][: page.fetch_size]
+
+
+items = Paginator(lambda row: (row["id"],), default_limit=3, max_limit=5, secret="secret", estimate=_estimate)
+
+
+def test_cursor_signer__rejects_forged_cursors():
+    signer = CursorSigner("secret")
+    cursor = signer.encode(("2024-01-01", 3))
+    assert signer.decode(cursor) == ("2024-01-01", 3)
+    payload, signature = cursor.split(".")
+    for forged in (CursorSigner("other").encode(("2024-01-01", 3)), f"{payload}x.{signature}", "garbage", "a.b.c"):
+        with pytest.raises(HTTPException) as exc_info:
+            signer.decode(forged)
+        assert exc_info.value.status_code == 400
+
+
+def test_view__paginates_by_cursor():
+    app = FastAPI()
+
+    @View(app)
+    class ItemView:
+        response_model = {"get": Item}
+
+        def get(self, page: Annotated[PageRequest, Depends(items)]):
+            return page.page(_fetch(page))
+
+    client = TestClient(app)
+    first = client.get("/").json()
+    assert [item["id"] for item in first["items"]] == [1, 2, 3]
+    assert first["total_estimate"] == 7
+    second = client.get("/", params={"cursor": first["next_cursor"], "limit": 4}).json()
+    assert [item["id"] for item in second["items"]] == [4, 5, 6, 7]
+    assert second["next_cursor"] is None
+    assert second["total_estimate"] is None
+    client.get("/")
+    assert len(estimates) == 1
+    assert client.get("/", params={"limit": 6}).status_code == 422
+    assert client.get("/", params={"cursor": "forged.cursor"}).status_code == 400
+
+    operation = app.openapi()["paths"]["/"]["get"]
+    assert operation["responses"]["200"]["content"]["application/json"]["schema"]["$ref"].endswith("Page_Item_")
+    assert operation["responses"]["400"]["description"] == "Invalid cursor."
+
+
+def test_view__streams_all_pages():
+    app = FastAPI()
+    fetched: list[int] = []
+
+    async def fetch(page: PageRequest) -> list[dict]:
+        fetched.append(page.limit)
+        return _fetch(page)
+
+    @View(app)
+    class ItemView:
+        response_model = {"get": Item}
+
+        async def get(self, page: Annotated[PageRequest, Depends(items)]):
+            async for row in page.walk(lambda request: fetch(request)):
+                yield row
+
+    response = TestClient(app).get("/", params={"limit": 2})
+    assert response.text.splitlines() == [Item(**row).model_dump_json() for row in ROWS]
+    assert fetched == [2, 2, 2, 2]
@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import time
+
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_class import Profiler, View, endpoint
+from fastapi_class.profiling import EndpointProfile, Sample
+
+
+def _slow_dependency():
+    time.sleep(0.01)
+    return 1
+
+
+def _busy(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def test_endpoint_profile__keeps_slowest_samples():
+    profile = EndpointProfile("route", "View", "get", rate=1.0, keep=2)
+    for duration in (0.3, 0.1, 0.5, 0.2):
+        sample = Sample()
+        sample.duration = duration
+        profile.record(sample, 0.0)
+    assert [sample["duration"] for sample in profile.samples()] == [0.5, 0.3]
+    assert profile.sampled == 4
+
+
+def test_view__profiles_phases_and_stacks():
+    app = FastAPI()
+    profiler = Profiler(rate=1.0, interval=0.001)
+
+    @View(app, profile=profiler, profile_path="/_profile")
+    class ReportView:
+        def get(self, value: int = Depends(_slow_dependency)):
+            _busy(0.05)
+            return {"value": value}
+
+        @endpoint("get", path="async")
+        async def report(self):
+            _busy(0.02)
+            return {}
+
+    client = TestClient(app)
+    assert client.get("/").json() == {"value": 1}
+    assert client.get("/async").status_code == 200
+
+    data = client.get("/_profile").json()
+    (sample,) = data["Get Report"]["samples"]
+    assert sample["status_code"] == 200
+    assert sample["phases"]["dependencies"] >= 0.01
+    assert sample["phases"]["handler"] >= 0.05
+    assert any("_busy" in stack for stack in sample["stacks"])
+    assert data["Report Report"]["sampled"] == 1
+
+    collapsed = client.get("/_profile", params={"format": "collapsed"}).text
+    assert "ReportView.get;dependencies " in collapsed
+    assert "ReportView.get;handler;" in collapsed
+    assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed.splitlines())
+
+
+def test_view__profile_rate_zero_records_nothing():
+    app = FastAPI()
+    profiler = Profiler(rate=0.0)
+
+    @View(app, profile=profiler)
+    class ItemView:
+        async def get(self):
+            return {}
+
+    TestClient(app).get("/")
+    assert profiler.to_json() == {"Get Item": {"view": "ItemView", "method": "get", "sampled": 0, "samples": []}}
+    assert all(getattr(route, "path", None) != "/_profile" for route in app.routes)
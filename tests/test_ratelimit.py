@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_class import InMemoryRateLimiter, RateLimit, View, endpoint
+
+
+def test_rate_limit__parse():
+    assert RateLimit.parse(None) is None
+    assert RateLimit.parse(10) == RateLimit(10)
+    assert RateLimit.parse("100/minute") == RateLimit(100, 60.0)
+    assert RateLimit.parse("10 / 5s") == RateLimit(10, 5.0)
+    assert RateLimit.parse("1/hours") == RateLimit(1, 3600.0)
+    with pytest.raises(ValueError, match="Invalid rate limit"):
+        RateLimit.parse("10 per minute")
+
+
+@pytest.mark.asyncio
+async def test_in_memory_rate_limiter__allows_bursts_then_spaces_requests():
+    limiter = InMemoryRateLimiter()
+    assert [await limiter.hit("client", 10.0, 3) for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert 9.0 < await limiter.hit("client", 10.0, 3) <= 10.0
+    assert await limiter.hit("other", 10.0, 3) == 0.0
+    with patch("fastapi_class.ratelimit.time.monotonic", return_value=8147.462950905293):
+        assert await limiter.hit("rounding", 60.0, 1) == 0.0
+
+
+@pytest.mark.asyncio
+async def test_in_memory_rate_limiter__bounded_memory_and_idle_eviction():
+    limiter = InMemoryRateLimiter(shards=2, max_keys=4)
+    for index in range(100):
+        await limiter.hit(f"client-{index}", 10.0, 1)
+    assert len(limiter) <= 4
+
+    idle = InMemoryRateLimiter(shards=1)
+    for index in range(10):
+        await idle.hit(f"client-{index}", 0.0, 1)
+    assert len(idle) <= 2
+
+
+def test_view__rate_limits():
+    app = FastAPI()
+    limiter = InMemoryRateLimiter()
+
+    @View(app)
+    class LoginView:
+        RATE_LIMITS = {"post": RateLimit(2, 60, backend=limiter)}
+
+        async def post(self):
+            return {}
+
+        @endpoint("get", path="status", rate_limit=RateLimit(1, 60, backend=limiter))
+        async def status(self):
+            return {}
+
+    client = TestClient(app)
+    assert [client.post("/").status_code for _ in range(3)] == [200, 200, 429]
+    response = client.post("/")
+    assert response.json() == {"detail": "Too many requests."}
+    assert 1 <= int(response.headers["retry-after"]) <= 30
+    assert client.get("/status").status_code == 200
+    assert client.get("/status").status_code == 429
+
+    responses = app.openapi()["paths"]["/"]["post"]["responses"]
+    assert responses["429"]["headers"] == {"Retry-After": {"schema": {"type": "string"}}}
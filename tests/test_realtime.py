@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from fastapi import FastAPI, WebSocket
+from fastapi.testclient import TestClient
+
+from fastapi_class import Broadcaster, Message, Realtime, View, WebSocketConnection, endpoint
+from fastapi_class.realtime import _event_frames
+
+
+def test_message__frames_server_sent_event_once():
+    message = Message.encode({"a": 1}, event="update", id="7")
+    assert message.text == '{"a":1}'
+    assert message.frame == b'event: update\nid: 7\ndata: {"a":1}\n\n'
+    assert message.frame is message.frame
+    assert Message.encode(message) is message
+
+
+@pytest.mark.asyncio
+async def test_broadcaster__fans_out_and_drops_slow_subscribers():
+    broadcaster = Broadcaster(queue_size=2)
+    fast, slow = broadcaster.subscribe(queue_size=8), broadcaster.subscribe()
+    assert broadcaster.publish({"n": 1}) == 2
+    assert broadcaster.publish({"n": 2}) == 2
+    assert broadcaster.publish({"n": 3}) == 1
+    assert slow.dropped
+    assert len(broadcaster) == 1
+    assert [message async for message in slow] == []
+    async with fast:
+        first = await fast.__anext__()
+    assert first.text == '{"n":1}'
+    assert len(broadcaster) == 0
+
+
+@pytest.mark.asyncio
+async def test_event_frames__closing_with_a_full_queue_stops_the_producer():
+    async def items():
+        while True:
+            yield {"value": 1}
+
+    frames = _event_frames(items(), Realtime(heartbeat=None, queue_size=1))
+    await frames.__anext__()
+    await asyncio.sleep(0.01)
+    await frames.aclose()
+    await asyncio.sleep(0.01)
+    assert asyncio.all_tasks() == {asyncio.current_task()}
+
+
+def test_endpoint__rejects_realtime_with_http_methods():
+    with pytest.raises(ValueError, match="can't be combined"):
+        endpoint(("get", "sse"))(lambda: None)
+
+
+def _app(realtime: Realtime | None = None) -> FastAPI:
+    app = FastAPI()
+
+    @View(app)
+    class ChatView:
+        async def websocket(self, connection: WebSocketConnection, prefix: str = ">"):
+            async for text in connection:
+                if text == "bye":
+                    return
+                await connection.send({"echo": prefix + text})
+
+        @endpoint("websocket", path="raw", realtime=realtime)
+        async def raw(self, websocket: WebSocket):
+            await websocket.accept()
+            await websocket.send_text("raw")
+            await websocket.close()
+
+        @endpoint("websocket", path="idle", realtime=realtime)
+        async def idle(self, connection: WebSocketConnection):
+            await connection.receive_text()
+
+        async def sse(self, count: int = 2):
+            for index in range(count):
+                yield {"index": index}
+            yield Message.encode("done", event="end")
+
+        @endpoint("sse", path="slow", realtime=realtime)
+        async def slow(self):
+            await asyncio.sleep(0.2)
+            yield 1
+
+    return app
+
+
+def test_view__websocket_methods():
+    client = TestClient(_app(Realtime(heartbeat=0.05, ping="ping")))
+    with client.websocket_connect("/?prefix=$") as websocket:
+        websocket.send_text("hi")
+        assert websocket.receive_json() == {"echo": "$hi"}
+        websocket.send_text("bye")
+    with client.websocket_connect("/raw") as websocket:
+        assert websocket.receive_text() == "raw"
+    with client.websocket_connect("/idle") as websocket:
+        assert websocket.receive_text() == "ping"
+        websocket.send_text("done")
+
+
+def test_view__websocket_method_errors_stop_the_connection():
+    app = FastAPI()
+    broadcaster = Broadcaster()
+    connections: list[WebSocketConnection] = []
+
+    @View(app)
+    class FailingView:
+        async def websocket(self, connection: WebSocketConnection):
+            broadcaster.attach(connection)
+            connections.append(connection)
+            raise ValueError("failed")
+
+    with pytest.raises(ValueError, match="failed"), TestClient(app).websocket_connect("/") as websocket:
+        websocket.receive_text()
+    assert connections[0]._sender is not None
+    assert connections[0]._sender.done()
+    assert len(broadcaster) == 0
+
+
+def test_view__sse_methods():
+    client = TestClient(_app(Realtime(heartbeat=0.05)))
+    response = client.get("/", params={"count": 3})
+    assert response.headers["content-type"].startswith("text/event-stream")
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.text == (
+        'data: {"index":0}\n\ndata: {"index":1}\n\ndata: {"index":2}\n\nevent: end\ndata: "done"\n\n'
+    )
+    assert client.get("/slow").text.startswith(": ping\n\n")
+
+    operation = client.app.openapi()["paths"]["/"]["get"]
+    assert "text/event-stream" in operation["responses"]["200"]["content"]
+    assert [parameter["name"] for parameter in operation["parameters"]] == ["count"]
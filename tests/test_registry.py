@@ -0,0 +1,41 @@
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+
+from fastapi_class import View, ViewRegistry, endpoint
+
+
+def test_registry__defers_registration_until_register():
+    registry = ViewRegistry()
+    router = APIRouter()
+
+    class ItemView:
+        async def get(self):
+            return {"item": 1}
+
+    View(router, registry=registry)(ItemView)
+    assert len(registry) == 1
+    assert router.routes == []
+    assert registry.register() == 1
+    assert len(registry) == 0
+    assert [route.path for route in router.routes] == ["/"]
+    assert registry.register() == 0
+
+
+def test_registry__include_router():
+    registry = ViewRegistry()
+    router = APIRouter()
+
+    class ItemView:
+        async def get(self):
+            return {"item": 1}
+
+        @endpoint("post", path="items")
+        async def create(self):
+            return {"created": True}
+
+    View(router, registry=registry)(ItemView)
+    app = FastAPI()
+    registry.include_router(app, router, prefix="/v1")
+    client = TestClient(app)
+    assert client.get("/v1/").json() == {"item": 1}
+    assert client.post("/v1/items").json() == {"created": True}
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from fastapi import Depends, FastAPI, Response
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, Field
+
+from fastapi_class import ModelJSONResponse, View, endpoint
+from fastapi_class.responses import model_response_endpoint
+
+
+class Item(BaseModel):
+    id: int
+    name: str = Field("item", alias="itemName")
+
+
+class ExtendedItem(Item):
+    secret: str = "hidden"
+
+
+def test_model_json_response__render():
+    assert ModelJSONResponse(Item(id=1)).body == b'{"id":1,"itemName":"item"}'
+    assert ModelJSONResponse({"id": 1}).body == b'{"id":1}'
+
+
+def test_model_response_endpoint__skips_functions_declaring_a_response():
+    def get(response: Response):
+        pass  # pragma: no cover
+
+    assert model_response_endpoint(get, ModelJSONResponse, Item, 200) is get
+
+
+def _set_header(response: Response) -> None:
+    response.headers["x-dependency"] = "set"
+
+
+def _nested(_: None = Depends(_set_header)) -> None:
+    pass
+
+
+def test_view__model_responses_keep_headers_set_by_dependencies():
+    app = FastAPI()
+
+    @View(app, default_response_class=ModelJSONResponse)
+    class ItemView:
+        response_model = {"get": Item, "put": Item}
+        DEPENDENCIES = {"put": [Depends(_set_header)]}
+
+        async def get(self, _: None = Depends(_nested)):
+            return Item(id=1)
+
+        async def put(self):
+            return Item(id=2)
+
+    client = TestClient(app)
+    assert client.get("/").headers["x-dependency"] == "set"
+    assert client.put("/").headers["x-dependency"] == "set"
+
+
+def test_view__default_response_class():
+    app = FastAPI()
+
+    @View(app, default_response_class=ModelJSONResponse)
+    class ItemView:
+        response_model = {"get": Item, "put": Item}
+
+        async def get(self):
+            return Item(id=1)
+
+        def put(self):
+            return ExtendedItem(id=2)
+
+        @endpoint("post", path="items", status_code=201)
+        async def create(self):
+            return Item(id=3)
+
+        async def delete(self):
+            return {"deleted": True}
+
+    client = TestClient(app)
+    response = client.get("/")
+    assert response.json() == {"id": 1, "itemName": "item"}
+    assert response.headers["content-type"] == "application/json"
+    assert client.put("/").json() == {"id": 2, "itemName": "item"}
+    response = client.post("/items")
+    assert response.status_code == 201
+    assert response.json() == {"id": 3, "itemName": "item"}
+    assert client.delete("/").json() == {"deleted": True}
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import inspect
 from collections.abc import Callable, Iterable
 from types import FunctionType
 
 import pytest
+from fastapi import FastAPI
 
-from fastapi_class import Method, endpoint
+from fastapi_class import Method, View, endpoint
 
 
 async def dummy_function():
@@ -74,3 +76,31 @@ def test_endpoint__method_inferred_from_function_name(method: Method):
     )
     _endpoint = endpoint(path="/test")(func)
     assert_methods_in_metadata(_endpoint, [method])
+
+
+def test_endpoint__empty_name_falls_back_to_the_view_default():
+    class ItemView:
+        @endpoint("get", name="")
+        async def get(self):
+            pass  # pragma: no cover
+
+    assert ItemView.get.__endpoint_metadata.name is None
+    app = FastAPI()
+    View(app)(ItemView)
+    assert [route.name for route in app.routes if getattr(route, "path", None) == "/"] == ["Get Item"]
+
+
+def test_endpoint__returns_original_function():
+    async def get():
+        pass  # pragma: no cover
+
+    assert endpoint()(get) is get
+
+
+def test_endpoint__keeps_sync_function_sync():
+    def get():
+        return "sync"
+
+    _endpoint = endpoint()(get)
+    assert not inspect.iscoroutinefunction(_endpoint)
+    assert _endpoint() == "sync"
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import sys
+
+import pytest
+from fastapi import FastAPI, HTTPException, status
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from fastapi_class import RouteTable, View, ViewRegistry, endpoint, source_hash
+
+
+class Item(BaseModel):
+    id: int
+    name: str
+
+
+class ItemView:
+    EXCEPTIONS = {"common": [HTTPException(status.HTTP_404_NOT_FOUND, "Item not found.")]}
+
+    async def get(self, id: int) -> Item:
+        return Item(id=id, name="pen")
+
+    @endpoint(("PUT", "PATCH"), path="/rename", response_model=Item)
+    async def rename(self, id: int, name: str):
+        return Item(id=id, name=name)
+
+
+def _startup(path, hash: str) -> tuple[FastAPI, bool]:
+    app = FastAPI()
+    registry = ViewRegistry()
+    View(app, path="/items", registry=registry, batch=True)(ItemView)
+    return app, registry.register_snapshot(app, path, source_hash=hash)
+
+
+def test_source_hash__changes_with_sources(tmp_path):
+    module = tmp_path / "views.py"
+    module.write_text("x = 1")
+    first = source_hash(module, tmp_path)
+    assert source_hash(str(module), tmp_path) == first
+    module.write_text("x = 2")
+    assert source_hash(module, tmp_path) != first
+    assert source_hash(ItemView) == source_hash(sys.modules[__name__])
+
+
+@pytest.mark.parametrize("name", ["routes.json", "routes.json.gz"])
+def test_register_snapshot__restores_routes_and_schema(tmp_path, name):
+    path = tmp_path / name
+    hash = source_hash(ItemView)
+    app, restored = _startup(path, hash)
+    assert not restored
+    expected = app.openapi()
+
+    app, restored = _startup(path, hash)
+    assert restored
+    assert app.openapi_schema == expected
+    assert not any(route.responses for route in app.routes if hasattr(route, "responses"))
+    client = TestClient(app)
+    assert client.get("/items", params={"id": 1}).json() == {"id": 1, "name": "pen"}
+    assert client.patch("/items/rename", params={"id": 1, "name": "cap"}).json() == {"id": 1, "name": "cap"}
+    assert client.get("/openapi.json").json() == expected
+
+    app, restored = _startup(path, "other")
+    assert not restored
+    assert RouteTable.load(path, "other") is not None
+    assert RouteTable.load(path, hash) is None
+    assert RouteTable.load(tmp_path / "missing.json", hash) is None
+
+
+def test_route_table__rejects_out_of_date_routes(tmp_path):
+    app, _ = _startup(tmp_path / "routes.json", "hash")
+    table = RouteTable.capture(app, "hash")
+    other = FastAPI()
+    View(other, path="/other")(ItemView)
+    with pytest.raises(ValueError, match="out of date"):
+        table.restore(other)
+    table.restore(app)
+
+
+def test_register_snapshot__falls_back_on_out_of_date_routes(tmp_path):
+    path = tmp_path / "routes.json"
+    app, _ = _startup(path, "hash")
+    table = RouteTable.load(path, "hash")
+    assert table is not None
+    table.routes = table.routes[1:]
+    table.dump(path)
+
+    app, restored = _startup(path, "hash")
+    assert not restored
+    assert len(app.routes) == len(_startup(tmp_path / "fresh.json", "hash")[0].routes)
+    assert any(route.responses for route in app.routes if hasattr(route, "responses"))
+    assert RouteTable.load(path, "hash").matches(app)
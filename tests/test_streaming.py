@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from fastapi_class import View, endpoint
+from fastapi_class.streaming import JSONArrayResponse, NDJSONResponse, is_streaming, item_serializer
+
+
+class Item(BaseModel):
+    id: int
+    name: str = "item"
+
+
+def get_prefix() -> str:
+    return "item"
+
+
+def test_is_streaming():
+    async def agen():
+        yield  # pragma: no cover
+
+    def gen():
+        yield  # pragma: no cover
+
+    async def coroutine():
+        pass  # pragma: no cover
+
+    assert is_streaming(agen)
+    assert is_streaming(gen)
+    assert not is_streaming(coroutine)
+
+
+def test_item_serializer():
+    assert item_serializer(Item)({"id": 1, "extra": True}) == b'{"id":1,"name":"item"}'
+    assert item_serializer(None)({"id": 1}) == b'{"id":1}'
+
+
+def test_view__generator_methods_are_streamed():
+    app = FastAPI()
+
+    @View(app)
+    class ItemView:
+        response_model = {"get": Item}
+
+        async def get(self, count: int = 3):
+            for index in range(count):
+                yield {"id": index}
+
+        @endpoint("get", path="array", response_class=JSONArrayResponse)
+        def array(self, count: int = 3):
+            yield from (Item(id=index) for index in range(count))
+
+    client = TestClient(app)
+    response = client.get("/", params={"count": 2})
+    assert response.headers["content-type"] == NDJSONResponse.media_type
+    assert [json.loads(line) for line in response.text.splitlines()] == [
+        {"id": 0, "name": "item"},
+        {"id": 1, "name": "item"},
+    ]
+    response = client.get("/array")
+    assert response.headers["content-type"] == "application/json"
+    assert [item["id"] for item in response.json()] == [0, 1, 2]
+    assert client.get("/array", params={"count": 0}).json() == []
+
+    operation = app.openapi()["paths"]["/"]["get"]
+    schema = operation["responses"]["200"]["content"][NDJSONResponse.media_type]["schema"]
+    assert schema["$ref"] == "#/components/schemas/Item"
+
+
+@pytest.mark.parametrize("pool_size", (0, 1))
+def test_view__request_scoped_generator_keeps_instance_while_streaming(pool_size: int):
+    app = FastAPI()
+
+    @View(app, instance_scope="request", pool_size=pool_size)
+    class ItemView:
+        prefix: str = Depends(get_prefix)
+
+        async def get(self):
+            for index in range(2):
+                yield f"{self.prefix}-{index}"
+
+    response = TestClient(app).get("/")
+    assert response.text.splitlines() == ['"item-0"', '"item-1"']
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from typing import Annotated
+
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from pydantic import BaseModel
+
+from fastapi_class import Deadline, View, endpoint, get_deadline
+
+
+class Item(BaseModel):
+    name: str
+
+
+def test_deadline__budget():
+    assert Deadline().remaining == math.inf
+    assert Deadline().budget() is None
+    assert Deadline().budget(2.0) == 2.0
+    deadline = Deadline(10.0)
+    assert 9.0 < deadline.remaining <= 10.0
+    assert deadline.budget(1.0) == 1.0
+    assert not deadline.expired
+    assert Deadline(0.0).expired
+
+
+def test_view__timeouts():
+    app = FastAPI()
+    cancelled = asyncio.Event()
+
+    @View(app, timeout=0.05)
+    class ItemView:
+        async def get(self):
+            try:
+                await asyncio.sleep(1)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        async def post(self, item: Item, deadline: Annotated[Deadline, Depends(get_deadline)]):
+            return {"name": item.name, "budget": deadline.budget()}
+
+        @endpoint("get", path="fast", timeout=2.0)
+        async def fast(self, deadline: Annotated[Deadline, Depends(get_deadline)]):
+            return {"budget": deadline.budget()}
+
+        @endpoint("get", path="slow", timeout=1.0)
+        def slow(self, deadline: Annotated[Deadline, Depends(get_deadline)]):
+            return {"expired": deadline.expired}
+
+    client = TestClient(app)
+    response = client.get("/")
+    assert response.status_code == 504
+    assert response.json() == {"detail": "Timed out handling the request."}
+    assert cancelled.is_set()
+    response = client.post("/", json={"name": "pen"})
+    assert response.json()["name"] == "pen"
+    assert 0 < response.json()["budget"] <= 0.05
+    assert 1.0 < client.get("/fast").json()["budget"] <= 2.0
+    assert client.get("/slow").json() == {"expired": False}
+
+    responses = app.openapi()["paths"]["/"]["get"]["responses"]
+    assert responses["504"]["description"] == "Timed out handling the request."
+
+
+@pytest.mark.asyncio
+async def test_view__cancels_on_client_disconnect():
+    app = FastAPI()
+    cancelled = asyncio.Event()
+
+    @View(app, timeout=5.0)
+    class ReportView:
+        async def get(self):
+            try:
+                await asyncio.sleep(5)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+    messages = [{"type": "http.request", "body": b"", "more_body": False}, {"type": "http.disconnect"}]
+    sent: list[dict] = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "GET",
+        "path": "/",
+        "headers": [],
+        "query_string": b"",
+        "root_path": "",
+        "app": app,
+    }
+    await asyncio.wait_for(app(scope, receive, send), 1.0)
+    assert cancelled.is_set()
+    assert sent[0]["status"] == 499
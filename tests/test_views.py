@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import gc
+import threading
+import weakref
+
 import pytest
-from fastapi import APIRouter, FastAPI, status
+from fastapi import APIRouter, FastAPI, HTTPException, status
+from fastapi.testclient import TestClient
 
-from fastapi_class import Method, View
+from fastapi_class import Method, View, endpoint
 from tests.factory import Factory
 
 
@@ -76,3 +81,116 @@ def test_view__use_name_of_functions_as_methods(
         assert schema["paths"]["/"][method.value]["summary"] == f"{method.value.capitalize()} Test Class Based"
         responses = schema["paths"]["/"][method.value]["responses"]
         assert "200" in responses
+
+
+def test_view__sync_endpoint_runs_in_threadpool(application: FastAPI):
+    class ThreadView:
+        @endpoint("get", path="thread")
+        def thread(self):
+            return {"thread": threading.get_ident()}
+
+    View(application)(ThreadView)
+    response = TestClient(application).get("/thread")
+    assert response.status_code == 200
+    assert response.json()["thread"] != threading.get_ident()
+
+
+def test_view__exceptions_per_method_and_common(application: FastAPI):
+    not_found = HTTPException(404, "Not found.")
+    unauthorized = HTTPException(401, "Not authorized.")
+
+    class ItemView:
+        EXCEPTIONS = {"common": (unauthorized,), "get": (not_found,)}
+
+        async def get(self):
+            pass  # pragma: no cover
+
+        async def delete(self):
+            pass  # pragma: no cover
+
+    View(application)(ItemView)
+    operations = application.openapi()["paths"]["/"]
+    assert {"401", "404"} <= operations["get"]["responses"].keys()
+    assert "401" in operations["delete"]["responses"]
+    assert "404" not in operations["delete"]["responses"]
+
+
+def test_view__generates_unique_operation_ids(application: FastAPI):
+    calls = []
+
+    def name_parser(cls, method: str) -> str:
+        calls.append(method)
+        return f"{cls.__name__} {method}"
+
+    class ItemView:
+        async def get(self):
+            pass  # pragma: no cover
+
+        @endpoint(("get", "post"), path="both")
+        async def both(self):
+            pass  # pragma: no cover
+
+    View(application, name_parser=name_parser, operation_ids=True)(ItemView)
+    View(application, path="/other", name_parser=name_parser, operation_ids=True)(ItemView)
+    assert sorted(calls) == ["both", "get"]
+
+    paths = application.openapi()["paths"]
+    assert paths["/"]["get"]["operationId"] == "itemview_get"
+    assert paths["/both"]["get"]["operationId"] == "itemview_both_get"
+    assert paths["/both"]["post"]["operationId"] == "itemview_both_post"
+    assert paths["/other"]["get"]["operationId"] == "itemview_get_other"
+
+
+def test_view__keeps_default_operation_ids(application: FastAPI):
+    class ItemView:
+        async def get(self):
+            pass  # pragma: no cover
+
+    View(application)(ItemView)
+    assert application.openapi()["paths"]["/"]["get"]["operationId"] == "Get_Item__get"
+
+
+def test_view__disambiguates_operation_ids_of_views_with_the_same_name(application: FastAPI):
+    def item_view():
+        class ItemView:
+            async def get(self):
+                pass  # pragma: no cover
+
+        return ItemView
+
+    View(application, path="/v1/items", operation_ids=True)(item_view())
+    View(application, path="/v2/items", operation_ids=True)(item_view())
+
+    paths = application.openapi()["paths"]
+    assert paths["/v1/items"]["get"]["operationId"] == "get_item"
+    assert paths["/v2/items"]["get"]["operationId"] == "get_item_v2_items"
+
+
+def test_view__raises_on_explicit_operation_id_collision(application: FastAPI):
+    class ItemView:
+        @endpoint("get", name="Get Item")
+        async def get(self):
+            pass  # pragma: no cover
+
+    class OtherView:
+        @endpoint("get", path="other", name="Get Item")
+        async def other(self):
+            pass  # pragma: no cover
+
+    View(application, operation_ids=True)(ItemView)
+    with pytest.raises(ValueError, match="Duplicate operationId 'get_item'"):
+        View(application, operation_ids=True)(OtherView)
+
+
+def test_view__registration_does_not_keep_view_classes_alive():
+    app = FastAPI()
+
+    class TemporaryView:
+        async def get(self):
+            pass  # pragma: no cover
+
+    View(app)(TemporaryView)
+    reference = weakref.ref(TemporaryView)
+    del app, TemporaryView
+    gc.collect()
+    assert reference() is None